@@ -6,13 +6,14 @@ This module provides functionality to index assets for fast searching.
 import os
 import shutil
 import logging
-from typing import List, Dict, Any, Optional, Set
+from typing import List, Dict, Any, Optional, Set, Iterable, Callable
 from datetime import datetime
 
-from whoosh.index import create_in, open_dir, exists_in
+from whoosh.filedb.filestore import FileStorage, RamStorage
 from whoosh.fields import Schema, ID, TEXT, KEYWORD, STORED, DATETIME, NUMERIC
 from whoosh.qparser import QueryParser, MultifieldParser
 from whoosh import scoring
+from sqlalchemy.orm import selectinload
 
 from assethub.core.config import config
 from assethub.core.models import Asset, SearchIndex, get_session
@@ -21,14 +22,45 @@ from assethub.core.models import Asset, SearchIndex, get_session
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Index path that keeps the search index in memory instead of on disk
+MEMORY_INDEX_PATH = ":memory:"
+
+# Assets loaded from the database and committed to the index at a time
+INDEX_BATCH_SIZE = 500
+
+# Shared so that indexers and searchers see the same in-memory index
+_memory_storage = RamStorage()
+
+
+def get_index_storage(index_path):
+    """
+    Get the Whoosh storage for an index path.
+
+    Args:
+        index_path: Index directory, or MEMORY_INDEX_PATH for an in-memory index
+
+    Returns:
+        Storage holding the index
+    """
+    if str(index_path) == MEMORY_INDEX_PATH:
+        return _memory_storage
+    return FileStorage(str(index_path))
+
 
 class AssetIndexer:
     """Indexer for 3D assets."""
 
-    def __init__(self):
-        """Initialize the asset indexer."""
+    def __init__(self, index_path: Optional[str] = None):
+        """
+        Initialize the asset indexer.
+
+        Args:
+            index_path: Index directory, or MEMORY_INDEX_PATH (default: from config)
+        """
         self.session = get_session()
-        self.index_path = config.get_index_path()
+        self.index_path = index_path or config.get_index_path()
+        self.in_memory = str(self.index_path) == MEMORY_INDEX_PATH
+        self.storage = get_index_storage(self.index_path)
         self._ensure_index_dir()
         self.schema = Schema(
             id=ID(stored=True, unique=True),
@@ -46,17 +78,20 @@ class AssetIndexer:
             vertex_count=NUMERIC(stored=True),
             face_count=NUMERIC(stored=True),
             width=NUMERIC(stored=True),
-            height=NUMERIC(stored=True)
+            height=NUMERIC(stored=True),
+            preview_path=STORED,
+            preview_mtime=STORED
         )
 
     def _ensure_index_dir(self) -> None:
         """Ensure the index directory exists."""
-        os.makedirs(self.index_path, exist_ok=True)
+        if not self.in_memory:
+            os.makedirs(self.index_path, exist_ok=True)
 
     def create_index(self) -> None:
         """Create a new search index."""
-        if not exists_in(self.index_path):
-            create_in(self.index_path, self.schema)
+        if not self.storage.index_exists():
+            self.storage.create_index(self.schema)
             logger.info(f"Created new search index at {self.index_path}")
             
             # Record index creation in database
@@ -69,6 +104,20 @@ class AssetIndexer:
             self.session.commit()
         else:
             logger.info(f"Search index already exists at {self.index_path}")
+            self._add_missing_fields()
+
+    def _add_missing_fields(self) -> None:
+        """Add fields introduced since an existing index was created."""
+        index = self.storage.open_index()
+        missing = [name for name in self.schema.names() if name not in index.schema]
+        if not missing:
+            return
+        
+        writer = index.writer()
+        for name in missing:
+            writer.add_field(name, self.schema[name])
+        writer.commit()
+        logger.info(f"Added fields to search index: {', '.join(missing)}")
 
     def rebuild_index(self) -> int:
         """
@@ -78,7 +127,9 @@ class AssetIndexer:
             Number of indexed assets
         """
         # Delete existing index
-        if os.path.exists(self.index_path):
+        if self.in_memory:
+            self.storage.clean()
+        elif os.path.exists(self.index_path):
             shutil.rmtree(self.index_path)
             logger.info(f"Deleted existing index at {self.index_path}")
         
@@ -86,9 +137,13 @@ class AssetIndexer:
         self._ensure_index_dir()
         self.create_index()
         
-        # Index all assets
-        assets = self.session.query(Asset).all()
-        count = self.index_assets(assets)
+        # Index all assets, streaming them from the database in batches
+        assets = (
+            self.session.query(Asset)
+            .options(selectinload(Asset.tags), selectinload(Asset.categories))
+            .yield_per(INDEX_BATCH_SIZE)
+        )
+        count = self.index_assets(assets, replace=False)
         
         # Update index metadata
         search_index = self.session.query(SearchIndex).first()
@@ -99,50 +154,93 @@ class AssetIndexer:
         
         return count
 
-    def index_assets(self, assets: List[Asset]) -> int:
+    def index_assets(self, assets: Iterable[Asset],
+                     progress: Optional[Callable[[int], None]] = None,
+                     replace: bool = True,
+                     should_stop: Optional[Callable[[], bool]] = None) -> int:
         """
-        Index a list of assets.
+        Index assets.
+
+        Assets are committed to the index every INDEX_BATCH_SIZE documents,
+        so any iterable can be indexed without holding it all in memory.
 
         Args:
-            assets: List of assets to index
+            assets: Iterable of assets to index
+            progress: Callback receiving the number of assets indexed so
+                far, after each commit
+            replace: Whether the assets may already be indexed; assets known
+                to be new are added without looking up an existing document
+            should_stop: Callback returning True to stop before the next
+                batch; the batches committed so far stay indexed
 
         Returns:
             Number of indexed assets
         """
-        if not assets:
-            logger.info("No assets to index")
-            return 0
-        
+        writer = None
         try:
-            index = open_dir(self.index_path)
-            writer = index.writer()
+            index = self.storage.open_index()
             
             count = 0
             for asset in assets:
-                self._index_asset(writer, asset)
+                if writer is None:
+                    if should_stop is not None and should_stop():
+                        logger.info(f"Indexing stopped after {count} assets")
+                        break
+                    writer = index.writer()
+                self._index_asset(writer, asset, replace)
                 count += 1
+                
+                # Flush the batch without merging segments until the end
+                if count % INDEX_BATCH_SIZE == 0:
+                    writer.commit(merge=False)
+                    writer = None
+                    if progress is not None:
+                        progress(count)
+            
+            if writer is not None:
+                writer.commit()
+                if progress is not None:
+                    progress(count)
+            
+            if not count:
+                logger.info("No assets to index")
+                return 0
             
-            writer.commit()
             logger.info(f"Indexed {count} assets")
             return count
         except Exception as e:
             logger.error(f"Error indexing assets: {e}")
+            if writer is not None:
+                writer.cancel()
             return 0
 
-    def _index_asset(self, writer, asset: Asset) -> None:
+    def _index_asset(self, writer, asset: Asset, replace: bool = True) -> None:
         """
         Index a single asset.
 
         Args:
             writer: Index writer
             asset: Asset to index
+            replace: Whether to replace the asset's existing document
         """
         # Prepare tags and categories as comma-separated strings
         tags = ",".join([tag.name for tag in asset.tags]) if asset.tags else ""
         categories = ",".join([category.name for category in asset.categories]) if asset.categories else ""
         
+        # Check the preview once here so searches don't have to; fields
+        # given as None are left out of the document
+        preview_path = None
+        preview_mtime = None
+        if asset.preview_path:
+            try:
+                preview_mtime = os.path.getmtime(asset.preview_path)
+                preview_path = asset.preview_path
+            except OSError:
+                pass
+        
         # Add document to index
-        writer.update_document(
+        add_document = writer.update_document if replace else writer.add_document
+        add_document(
             id=str(asset.id),
             name=asset.name,
             description=asset.description or "",
@@ -158,7 +256,9 @@ class AssetIndexer:
             vertex_count=asset.vertex_count or 0,
             face_count=asset.face_count or 0,
             width=asset.width or 0,
-            height=asset.height or 0
+            height=asset.height or 0,
+            preview_path=preview_path,
+            preview_mtime=preview_mtime
         )
 
     def remove_asset(self, asset_id: int) -> bool:
@@ -172,7 +272,7 @@ class AssetIndexer:
             True if successful, False otherwise
         """
         try:
-            index = open_dir(self.index_path)
+            index = self.storage.open_index()
             writer = index.writer()
             writer.delete_by_term('id', str(asset_id))
             writer.commit()
@@ -7,8 +7,9 @@ import os
 import mimetypes
 import hashlib
 from pathlib import Path
-from typing import List, Dict, Any, Set, Optional, Tuple
+from typing import List, Dict, Any, Set, Optional, Tuple, Callable
 import logging
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
 from datetime import datetime
 
 from assethub.core.config import config
@@ -25,27 +26,131 @@ SUPPORTED_EXTENSIONS = {
     "material": [".mtl", ".mat", ".xml", ".json"],
 }
 
+# All supported file extensions
+SUPPORTED_SUFFIXES = frozenset(
+    extension for extensions in SUPPORTED_EXTENSIONS.values() for extension in extensions
+)
+
+# Number of directories listed at once while scanning
+SCAN_WORKERS = 16
+
+# Directories that never hold assets and are skipped without listing them;
+# .thumb-cache holds the scaled preview thumbnails of the storage path
+IGNORED_DIRECTORIES = frozenset({
+    ".git", ".hg", ".svn", "__pycache__", "node_modules", ".thumb-cache",
+})
+
 # Initialize mimetypes
 mimetypes.init()
 
 
+def _list_directory(directory_path: str) -> Tuple[List[os.DirEntry], List[str]]:
+    """
+    List the files and subdirectories of one directory.
+
+    Supported files are stat'ed here as well, so that when directories are
+    listed concurrently their stat calls overlap too; os.DirEntry caches the
+    result for the scanner.
+
+    Args:
+        directory_path: Path to the directory to list
+
+    Returns:
+        Tuple of (file entries, subdirectory paths)
+    """
+    files = []
+    subdirectories = []
+    try:
+        with os.scandir(directory_path) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in IGNORED_DIRECTORIES:
+                            subdirectories.append(entry.path)
+                    elif entry.is_file():
+                        if os.path.splitext(entry.name)[1].lower() in SUPPORTED_SUFFIXES:
+                            entry.stat()
+                        files.append(entry)
+                except OSError:
+                    continue
+    except OSError as e:
+        logger.error(f"Error reading directory {directory_path}: {e}")
+    return files, subdirectories
+
+
+def _walk_files(directory_path: str, recursive: bool = True, max_workers: int = SCAN_WORKERS,
+                progress: Optional[Callable[[int, int], None]] = None):
+    """
+    Yield directory entries for the files under a directory.
+
+    Uses os.scandir so the file type of each entry comes from the directory
+    listing instead of a separate stat call. Directories are listed by a
+    pool of threads as they are discovered, which hides the latency of
+    network mounts; the entries are yielded on the calling thread. Like
+    os.walk, symlinked directories are not followed and unreadable
+    directories are skipped, as are IGNORED_DIRECTORIES.
+
+    Args:
+        directory_path: Path to the directory to walk
+        recursive: Whether to walk subdirectories
+        max_workers: Number of directories listed at once
+        progress: Callback receiving the number of directories listed and
+            the number found so far, after each directory
+
+    Yields:
+        os.DirEntry for each file
+    """
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        pending = {executor.submit(_list_directory, directory_path)}
+        found = 1
+        listed = 0
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                files, subdirectories = future.result()
+                listed += 1
+                if recursive:
+                    found += len(subdirectories)
+                    pending.update(
+                        executor.submit(_list_directory, subdirectory)
+                        for subdirectory in subdirectories
+                    )
+                if progress is not None:
+                    progress(listed, found)
+                yield from files
+    finally:
+        # Directories not listed yet are dropped if the walk is abandoned
+        executor.shutdown(cancel_futures=True)
+
+
 class AssetScanner:
     """Scanner for 3D assets in the filesystem."""
 
     def __init__(self):
         """Initialize the asset scanner."""
         self.session = get_session()
+        # Keep scanned assets loaded after they are saved, so they can be
+        # indexed without reloading each one
+        self.session.expire_on_commit = False
         self.scanned_files: Set[str] = set()
+        self.existing_assets: Dict[str, Asset] = {}
         self.new_assets: List[Asset] = []
         self.updated_assets: List[Asset] = []
 
-    def scan_directory(self, directory_path: str, recursive: bool = True) -> Tuple[int, int]:
+    def scan_directory(self, directory_path: str, recursive: bool = True,
+                       progress: Optional[Callable[[int, int], None]] = None,
+                       should_stop: Optional[Callable[[], bool]] = None) -> Tuple[int, int]:
         """
         Scan a directory for 3D assets.
 
         Args:
             directory_path: Path to the directory to scan
             recursive: Whether to scan subdirectories recursively
+            progress: Callback receiving the number of directories scanned
+                and the number found so far
+            should_stop: Callback returning True to cancel the scan; a
+                cancelled scan saves nothing
 
         Returns:
             Tuple of (new_assets_count, updated_assets_count)
@@ -61,26 +166,64 @@ class AssetScanner:
         self.new_assets = []
         self.updated_assets = []
 
-        # Walk through the directory
-        for root, dirs, files in os.walk(directory_path):
-            for file in files:
-                file_path = os.path.join(root, file)
-                self._process_file(file_path)
+        # Commits don't expire loaded assets, so drop what a previous scan
+        # loaded and read rows changed elsewhere since then afresh
+        self.session.expire_all()
 
-            if not recursive:
-                break
+        # Load the assets already cataloged under this directory with one
+        # query instead of one query per file
+        self.existing_assets = {
+            asset.file_path: asset
+            for asset in self.session.query(Asset).filter(
+                Asset.file_path.startswith(directory_path, autoescape=True)
+            )
+        }
+
+        # Walk through the directory
+        for entry in _walk_files(directory_path, recursive, progress=progress):
+            if should_stop is not None and should_stop():
+                logger.info(f"Scan cancelled: {directory_path}")
+                self.session.rollback()
+                self.existing_assets = {}
+                self.new_assets = []
+                self.updated_assets = []
+                return 0, 0
+            self._process_file(entry.path, entry)
 
         # Save new and updated assets to the database
         self._save_assets()
 
+        # The cataloged assets are only needed during the scan; a scanner
+        # kept for later scans should not hold on to them
+        self.existing_assets = {}
+
         return len(self.new_assets), len(self.updated_assets)
 
-    def _process_file(self, file_path: str) -> None:
+    def forget_assets(self, assets: List[Asset]) -> None:
+        """
+        Remove assets from the catalog.
+
+        Used for new assets whose import was cancelled before they were
+        indexed, so that the next scan finds them again.
+
+        Args:
+            assets: Assets saved by the last scan
+        """
+        try:
+            for asset in assets:
+                self.session.delete(asset)
+            self.session.commit()
+        except Exception as e:
+            logger.error(f"Error removing assets from database: {e}")
+            self.session.rollback()
+
+    def _process_file(self, file_path: str, entry: Optional[os.DirEntry] = None) -> None:
         """
         Process a file and add it to the catalog if it's a supported asset.
 
         Args:
             file_path: Path to the file to process
+            entry: Directory entry of the file, whose cached stat is used if given
         """
         # Skip if already processed
         if file_path in self.scanned_files:
@@ -96,11 +239,11 @@ class AssetScanner:
             return
         
         # Check if the asset already exists in the database
-        existing_asset = self.session.query(Asset).filter_by(file_path=file_path).first()
+        existing_asset = self.existing_assets.get(file_path)
         
         # Get file stats
         try:
-            file_stats = os.stat(file_path)
+            file_stats = entry.stat() if entry is not None else os.stat(file_path)
             file_size = file_stats.st_size
             file_mtime = datetime.fromtimestamp(file_stats.st_mtime)
         except OSError as e:
@@ -151,7 +294,9 @@ class AssetScanner:
             file_format=file_ext[1:],  # Remove the dot
             created_at=datetime.utcnow(),
             updated_at=datetime.utcnow(),
-            source="local"
+            source="local",
+            tags=[],
+            categories=[]
         )
         
         # Extract additional metadata based on asset type
@@ -4,33 +4,93 @@ Search module for AssetHub.
 This module provides functionality to search for assets in the index.
 """
 import os
+import re
+import pickle
 import logging
-from typing import List, Dict, Any, Optional, Set
+import threading
+from typing import List, Dict, Any, Optional, Set, Callable, Iterator, Iterable
 from datetime import datetime
 
-from whoosh.index import open_dir
 from whoosh.qparser import QueryParser, MultifieldParser
 from whoosh import scoring
-from whoosh.query import Term, And, Or, Not
+from whoosh.analysis import StandardAnalyzer
+from whoosh.query import Term, And, Or, Not, Every, NullQuery
 
 from assethub.core.config import config
 from assethub.core.models import Asset, get_session
+from assethub.catalog.indexer import MEMORY_INDEX_PATH, get_index_storage
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Fields searched when none are given
+DEFAULT_SEARCH_FIELDS = ["name", "description", "tags", "categories"]
+
+# Queries made only of plain words, without wildcards, phrases or field names
+_PLAIN_QUERY_RE = re.compile(r"^[\w\s.\-]*$")
+_QUERY_OPERATORS = {"AND", "OR", "NOT", "ANDNOT", "ANDMAYBE"}
+
+# Results per page yielded by AssetSearch.iter_search
+SEARCH_PAGE_SIZE = 50
+
+# Upper bound on results returned by AssetSearch.iter_search
+MAX_SEARCH_RESULTS = 2500
+
+# File in the index directory holding the saved listing of all assets
+SNAPSHOT_FILE = "all-assets.pickle"
+
+
+def _hit_to_dict(hit) -> Dict[str, Any]:
+    """
+    Convert a search hit to a dictionary.
+
+    Args:
+        hit: Whoosh search hit
+
+    Returns:
+        Stored fields of the hit, with datetimes as ISO strings
+    """
+    asset_dict = dict(hit)
+    
+    # Convert datetime objects to strings
+    for key, value in asset_dict.items():
+        if isinstance(value, datetime):
+            asset_dict[key] = value.isoformat()
+    
+    return asset_dict
+
 
 class AssetSearch:
     """Search engine for 3D assets."""
 
-    def __init__(self):
-        """Initialize the asset search engine."""
+    def __init__(self, index_path: Optional[str] = None):
+        """
+        Initialize the asset search engine.
+
+        Args:
+            index_path: Index directory, or MEMORY_INDEX_PATH (default: from config)
+        """
         self.session = get_session()
-        self.index_path = config.get_index_path()
+        self.index_path = index_path or config.get_index_path()
+        self.in_memory = str(self.index_path) == MEMORY_INDEX_PATH
+        self.storage = get_index_storage(self.index_path)
+        self._analyzer = StandardAnalyzer()
+        self._vocabulary = None
+        self._vocabulary_generation = None
+        self._vocabulary_lock = threading.Lock()
+        self._field_values = {}
+        self._field_values_lock = threading.Lock()
+        self._filter_docs = {}
+        self._filter_docs_generation = None
+        self._filter_docs_lock = threading.Lock()
+        self._listing = None
+        self._listing_key = None
+        self._listing_lock = threading.Lock()
 
     def search(self, query_string: str, fields: Optional[List[str]] = None, 
-               filters: Optional[Dict[str, Any]] = None, limit: int = 50) -> List[Dict[str, Any]]:
+               filters: Optional[Dict[str, Any]] = None, limit: int = 50,
+               should_stop: Optional[Callable[[], bool]] = None) -> List[Dict[str, Any]]:
         """
         Search for assets matching the query.
 
@@ -39,54 +99,32 @@ class AssetSearch:
             fields: Fields to search in (default: name, description, tags, categories)
             filters: Additional filters to apply
             limit: Maximum number of results to return
+            should_stop: Callback polled while collecting results; when it
+                returns True the search is abandoned and an empty list returned
 
         Returns:
             List of matching assets as dictionaries
         """
-        if not os.path.exists(self.index_path):
+        if not self.in_memory and not os.path.exists(self.index_path):
             logger.error(f"Search index not found at {self.index_path}")
             return []
         
         try:
-            index = open_dir(self.index_path)
-            
-            # Default fields to search in
-            if fields is None:
-                fields = ["name", "description", "tags", "categories"]
-            
-            # Create parser
-            parser = MultifieldParser(fields, schema=index.schema)
-            query = parser.parse(query_string)
-            
-            # Apply filters if provided
-            if filters:
-                filter_queries = []
-                for field, value in filters.items():
-                    if isinstance(value, list):
-                        # For list values, create OR query
-                        or_queries = [Term(field, str(v)) for v in value]
-                        filter_queries.append(Or(or_queries))
-                    else:
-                        filter_queries.append(Term(field, str(value)))
-                
-                if filter_queries:
-                    query = And([query] + filter_queries)
+            index = self.storage.open_index()
+            query = self._build_query(index, query_string, fields)
             
             # Search
             with index.searcher(weighting=scoring.BM25F()) as searcher:
-                results = searcher.search(query, limit=limit)
+                results = self._search_filtered(searcher, query, filters, limit)
                 
                 # Convert results to dictionaries
                 assets = []
                 for result in results:
-                    asset_dict = dict(result)
-                    
-                    # Convert datetime objects to strings
-                    for key, value in asset_dict.items():
-                        if isinstance(value, datetime):
-                            asset_dict[key] = value.isoformat()
+                    if should_stop is not None and should_stop():
+                        logger.info(f"Search cancelled for query: {query_string}")
+                        return []
                     
-                    assets.append(asset_dict)
+                    assets.append(_hit_to_dict(result))
                 
                 logger.info(f"Found {len(assets)} assets matching query: {query_string}")
                 return assets
@@ -95,6 +133,259 @@ class AssetSearch:
             logger.error(f"Error searching for assets: {e}")
             return []
 
+    def iter_search(self, query_string: str, fields: Optional[List[str]] = None,
+                    filters: Optional[Dict[str, Any]] = None, page_size: int = SEARCH_PAGE_SIZE,
+                    limit: int = MAX_SEARCH_RESULTS,
+                    should_stop: Optional[Callable[[], bool]] = None,
+                    on_count: Optional[Callable[[int], None]] = None) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Search for assets matching the query, yielding results a page at a time.
+
+        Each page is converted from the index only when it is requested, so
+        callers can show the first results before the rest are read. The
+        listing of all assets ("*" without filters) is kept once it has been
+        read in full, and served from memory until the index changes.
+
+        Args:
+            query_string: Search query string
+            fields: Fields to search in (default: name, description, tags, categories)
+            filters: Additional filters to apply
+            page_size: Number of results per page
+            limit: Maximum number of results to return in total
+            should_stop: Callback polled between pages; when it returns True
+                no further pages are yielded
+            on_count: Callback receiving the total number of results before
+                the first page is yielded
+
+        Yields:
+            Lists of matching assets as dictionaries
+        """
+        if not self.in_memory and not os.path.exists(self.index_path):
+            logger.error(f"Search index not found at {self.index_path}")
+            return
+        
+        try:
+            index = self.storage.open_index()
+            
+            listing_key = None
+            if not filters and query_string.strip() == "*":
+                listing_key = (index.latest_generation(), limit)
+                with self._listing_lock:
+                    listing = self._listing if self._listing_key == listing_key else None
+                if listing is not None:
+                    if on_count is not None:
+                        on_count(len(listing))
+                    for start in range(0, len(listing), page_size):
+                        if should_stop is not None and should_stop():
+                            return
+                        yield listing[start:start + page_size]
+                    return
+            
+            query = self._build_query(index, query_string, fields)
+            
+            with index.searcher(weighting=scoring.BM25F()) as searcher:
+                results = self._search_filtered(searcher, query, filters, limit)
+                
+                # len() counts every match, but only the first limit are scored
+                count = len(results) if limit is None else min(len(results), limit)
+                if on_count is not None:
+                    on_count(count)
+                listing = []
+                for start in range(0, count, page_size):
+                    if should_stop is not None and should_stop():
+                        logger.info(f"Search cancelled for query: {query_string}")
+                        return
+                    
+                    page = [_hit_to_dict(results[i])
+                            for i in range(start, min(start + page_size, count))]
+                    if listing_key is not None:
+                        listing.extend(page)
+                    yield page
+                
+                # Only a listing read in full is kept
+                if listing_key is not None:
+                    with self._listing_lock:
+                        self._listing = listing
+                        self._listing_key = listing_key
+        
+        except Exception as e:
+            logger.error(f"Error searching for assets: {e}")
+
+    def _build_query(self, index, query_string: str, fields: Optional[List[str]]):
+        """
+        Parse a query string.
+
+        Args:
+            index: Open search index
+            query_string: Search query string
+            fields: Fields to search in (default: name, description, tags, categories)
+
+        Returns:
+            Whoosh query
+        """
+        # Default fields to search in
+        if fields is None:
+            fields = DEFAULT_SEARCH_FIELDS
+        
+        # Create parser
+        parser = MultifieldParser(fields, schema=index.schema)
+        return parser.parse(query_string)
+
+    def _search_filtered(self, searcher, query, filters: Optional[Dict[str, Any]], limit: int):
+        """
+        Run a query over the documents matching the filters.
+
+        An empty query matches every document that passes the filters.
+
+        Args:
+            searcher: Open index searcher
+            query: Parsed query
+            filters: Filters to apply
+            limit: Maximum number of results to return
+
+        Returns:
+            Whoosh results, or an empty list if no document passes the filters
+        """
+        filter_docs = self._get_filter_docs(searcher, filters)
+        if filter_docs is None:
+            return searcher.search(query, limit=limit)
+        
+        # Whoosh treats an empty filter set as no filter at all
+        if not filter_docs:
+            return []
+        if query is NullQuery:
+            query = Every()
+        return searcher.search(query, filter=filter_docs, limit=limit)
+
+    def _get_filter_docs(self, searcher, filters: Optional[Dict[str, Any]]) -> Optional[Set[int]]:
+        """
+        Get the document numbers matching all filters.
+
+        The documents for each filter value are read from the index once per
+        index generation. A list value matches any of its values, and the
+        sets for the filtered fields are intersected smallest first. Cached
+        sets are used as they are and never modified.
+
+        Args:
+            searcher: Open index searcher
+            filters: Filters to apply
+
+        Returns:
+            Set of matching document numbers, or None if there are no filters
+        """
+        if not filters:
+            return None
+        
+        generation = searcher.reader().generation()
+        field_docs = []
+        with self._filter_docs_lock:
+            if generation != self._filter_docs_generation:
+                self._filter_docs = {}
+                self._filter_docs_generation = generation
+            
+            for field, value in filters.items():
+                values = value if isinstance(value, list) else [value]
+                value_docs = []
+                for v in values:
+                    key = (field, str(v))
+                    docs = self._filter_docs.get(key)
+                    if docs is None:
+                        docs = self._get_value_docs(searcher, field, str(v))
+                        self._filter_docs[key] = docs
+                    value_docs.append(docs)
+                
+                # Nothing can pass once one field matches no documents
+                docs = value_docs[0] if len(value_docs) == 1 else set().union(*value_docs)
+                if not docs:
+                    return set()
+                field_docs.append(docs)
+        
+        # The result is a new set, so the cached sets are left untouched
+        field_docs.sort(key=len)
+        return field_docs[0].intersection(*field_docs[1:])
+
+    @staticmethod
+    def _get_value_docs(searcher, field: str, value: str) -> Set[int]:
+        """
+        Get the document numbers whose field holds a filter value.
+
+        The value is normalized by the field's own analyzer, the same way the
+        field was tokenized at index time, so a value such as "Furniture"
+        finds the lowercased category term. A value that analyzes to several
+        terms matches the documents holding all of them.
+
+        Args:
+            searcher: Open index searcher
+            field: Field to look the value up in
+            value: Filter value
+
+        Returns:
+            Set of matching document numbers
+        """
+        if field not in searcher.schema:
+            return set()
+        terms = list(searcher.schema[field].process_text(value, mode="query")) or [value]
+        term_docs = [set(searcher.docs_for_query(Term(field, term))) for term in terms]
+        return term_docs[0].intersection(*term_docs[1:])
+
+    def get_vocabulary(self) -> Set[str]:
+        """
+        Get all terms indexed in the default search fields.
+
+        The terms are cached until the index changes. Concurrent callers
+        wait for a single rebuild rather than each scanning the lexicon.
+
+        Returns:
+            Set of indexed terms
+        """
+        try:
+            index = self.storage.open_index()
+            generation = index.latest_generation()
+            with self._vocabulary_lock:
+                if self._vocabulary is None or generation != self._vocabulary_generation:
+                    vocabulary = set()
+                    with index.searcher() as searcher:
+                        for field in DEFAULT_SEARCH_FIELDS:
+                            vocabulary.update(term.decode("utf-8") for term in searcher.lexicon(field))
+                    self._vocabulary = vocabulary
+                    self._vocabulary_generation = generation
+                return self._vocabulary
+        except Exception as e:
+            logger.error(f"Error retrieving vocabulary: {e}")
+            return set()
+
+    def could_match(self, query_string: str) -> bool:
+        """
+        Check cheaply whether a query could match anything in the index.
+
+        Only plain word queries of three or more characters are checked; a
+        query none of whose words is an indexed term cannot match. Anything
+        else is assumed to possibly match.
+
+        Args:
+            query_string: Search query string
+
+        Returns:
+            False if the query certainly has no results, True otherwise
+        """
+        query_string = query_string.strip()
+        if len(query_string) < 3 or not _PLAIN_QUERY_RE.match(query_string):
+            return True
+
+        words = query_string.split()
+        if _QUERY_OPERATORS.intersection(words):
+            return True
+
+        vocabulary = self.get_vocabulary()
+        if not vocabulary:
+            return True
+
+        # Check both analyzed tokens and raw words, since keyword fields
+        # such as tags are not split on punctuation
+        terms = {token.text for token in self._analyzer(query_string)}
+        terms.update(word.lower() for word in words)
+        return not vocabulary.isdisjoint(terms)
+
     def get_asset_by_id(self, asset_id: int) -> Optional[Dict[str, Any]]:
         """
         Get an asset by ID.
@@ -106,7 +397,7 @@ class AssetSearch:
             Asset as dictionary or None if not found
         """
         try:
-            index = open_dir(self.index_path)
+            index = self.storage.open_index()
             with index.searcher() as searcher:
                 result = searcher.document(id=str(asset_id))
                 if result:
@@ -123,36 +414,145 @@ class AssetSearch:
             logger.error(f"Error retrieving asset {asset_id}: {e}")
             return None
 
-    def get_tags(self) -> List[str]:
+    def get_assets_by_id(self, asset_ids: Iterable[int]) -> List[Dict[str, Any]]:
         """
-        Get all unique tags in the index.
+        Get several assets by ID with one searcher.
+
+        Args:
+            asset_ids: IDs of the assets to retrieve
 
         Returns:
-            List of unique tags
+            Assets as dictionaries, leaving out IDs that are not found
         """
         try:
-            index = open_dir(self.index_path)
+            index = self.storage.open_index()
             with index.searcher() as searcher:
-                return list(searcher.lexicon("tags"))
+                documents = (searcher.document(id=str(asset_id)) for asset_id in asset_ids)
+                return [_hit_to_dict(document) for document in documents if document]
         except Exception as e:
-            logger.error(f"Error retrieving tags: {e}")
+            logger.error(f"Error retrieving assets: {e}")
             return []
 
-    def get_categories(self) -> List[str]:
+    def index_generation(self) -> Optional[int]:
         """
-        Get all unique categories in the index.
+        Get the generation of the index, which changes with every commit.
 
         Returns:
-            List of unique categories
+            Index generation, or None if the index could not be opened
         """
         try:
-            index = open_dir(self.index_path)
-            with index.searcher() as searcher:
-                return list(searcher.lexicon("categories"))
+            return self.storage.open_index().latest_generation()
+        except Exception as e:
+            logger.error(f"Error opening search index: {e}")
+            return None
+
+    def load_snapshot(self) -> Optional[List[Dict[str, Any]]]:
+        """
+        Load the saved listing of all assets.
+
+        The listing is only used while the index is at the generation it
+        was saved for, so it always equals a fresh search for every asset.
+
+        Returns:
+            List of assets as dictionaries, or None if there is no current listing
+        """
+        if self.in_memory:
+            return None
+        
+        try:
+            with open(os.path.join(self.index_path, SNAPSHOT_FILE), "rb") as f:
+                generation, assets = pickle.load(f)
+        except FileNotFoundError:
+            return None
         except Exception as e:
-            logger.error(f"Error retrieving categories: {e}")
+            logger.warning(f"Could not load saved asset listing: {e}")
+            return None
+        
+        if generation is None or generation != self.index_generation():
+            return None
+        return assets
+
+    def save_snapshot(self, assets: List[Dict[str, Any]], generation: Optional[int]) -> None:
+        """
+        Save the listing of all assets, to be shown at the next start.
+
+        Args:
+            assets: List of all assets as dictionaries
+            generation: Index generation the assets were read from
+        """
+        if self.in_memory or generation is None:
+            return
+        
+        # Write to a temporary file first so a reader never sees a partial listing
+        snapshot_path = os.path.join(self.index_path, SNAPSHOT_FILE)
+        temp_path = f"{snapshot_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(temp_path, "wb") as f:
+                pickle.dump((generation, assets), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, snapshot_path)
+        except OSError as e:
+            logger.warning(f"Could not save asset listing: {e}")
+
+    def invalidate(self) -> None:
+        """Forget cached vocabulary, field values, filter documents and the asset listing."""
+        with self._vocabulary_lock:
+            self._vocabulary = None
+            self._vocabulary_generation = None
+        with self._field_values_lock:
+            self._field_values.clear()
+        with self._filter_docs_lock:
+            self._filter_docs = {}
+            self._filter_docs_generation = None
+        with self._listing_lock:
+            self._listing = None
+            self._listing_key = None
+
+    def _get_field_values(self, field: str, label: str) -> List[str]:
+        """
+        Get all unique values of a field in the index.
+
+        The values are cached until the index changes or invalidate() is called.
+
+        Args:
+            field: Index field name
+            label: Description of the values for log messages
+
+        Returns:
+            List of unique values
+        """
+        try:
+            index = self.storage.open_index()
+            generation = index.latest_generation()
+            with self._field_values_lock:
+                cached = self._field_values.get(field)
+                if cached is None or cached[0] != generation:
+                    with index.searcher() as searcher:
+                        values = [term.decode("utf-8") for term in searcher.lexicon(field)]
+                    cached = (generation, values)
+                    self._field_values[field] = cached
+            return list(cached[1])
+        except Exception as e:
+            logger.error(f"Error retrieving {label}: {e}")
             return []
 
+    def get_tags(self) -> List[str]:
+        """
+        Get all unique tags in the index.
+
+        Returns:
+            List of unique tags
+        """
+        return self._get_field_values("tags", "tags")
+
+    def get_categories(self) -> List[str]:
+        """
+        Get all unique categories in the index.
+
+        Returns:
+            List of unique categories
+        """
+        return self._get_field_values("categories", "categories")
+
     def get_file_types(self) -> List[str]:
         """
         Get all unique file types in the index.
@@ -160,13 +560,7 @@ class AssetSearch:
         Returns:
             List of unique file types
         """
-        try:
-            index = open_dir(self.index_path)
-            with index.searcher() as searcher:
-                return list(searcher.lexicon("file_type"))
-        except Exception as e:
-            logger.error(f"Error retrieving file types: {e}")
-            return []
+        return self._get_field_values("file_type", "file types")
 
     def get_file_formats(self) -> List[str]:
         """
@@ -175,10 +569,4 @@ class AssetSearch:
         Returns:
             List of unique file formats
         """
-        try:
-            index = open_dir(self.index_path)
-            with index.searcher() as searcher:
-                return list(searcher.lexicon("file_format"))
-        except Exception as e:
-            logger.error(f"Error retrieving file formats: {e}")
-            return []
+        return self._get_field_values("file_format", "file formats")
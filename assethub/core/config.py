@@ -28,7 +28,9 @@ class Config:
         },
         "ui": {
             "theme": "light",
-            "language": "en"
+            "language": "en",
+            "pixmap_cache_mb": 200,
+            "thumb_cache_mb": 256
         }
     }
 
@@ -156,16 +156,33 @@ class SearchIndex(Base):
         return f"<SearchIndex(id={self.id}, path='{self.path}')>"
 
 
-def init_db():
-    """Initialize the database."""
-    db_path = config.get_db_path()
-    engine = create_engine(f"sqlite:///{db_path}")
+def init_db(engine=None):
+    """
+    Initialize the database.
+
+    Args:
+        engine: Engine to initialize (default: SQLite file from the config)
+
+    Returns:
+        Initialized engine
+    """
+    if engine is None:
+        db_path = config.get_db_path()
+        engine = create_engine(f"sqlite:///{db_path}")
     Base.metadata.create_all(engine)
     return engine
 
 
-def get_session():
-    """Get a database session."""
-    engine = init_db()
+def get_session(engine=None):
+    """
+    Get a database session.
+
+    Args:
+        engine: Engine to bind the session to (default: SQLite file from the config)
+
+    Returns:
+        Database session
+    """
+    engine = init_db(engine)
     Session = sessionmaker(bind=engine)
     return Session()
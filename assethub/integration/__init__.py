@@ -3,18 +3,44 @@ Integration module for AssetHub.
 
 This module provides integration with external asset providers.
 """
+import copy
 import logging
 import importlib
 import os
+import shutil
+import threading
+import time
+import zipfile
+from collections import OrderedDict
 from typing import Dict, List, Any
 
 from assethub.integration.providers.base import BaseProvider
 
 logger = logging.getLogger(__name__)
 
+# Chunk size used when extracting archive members
+EXTRACT_CHUNK_SIZE = 1 << 20
+
+# How long provider search results are reused, in seconds
+SEARCH_CACHE_TTL = 1800
+
+# How long an empty search result is reused, in seconds; providers add
+# assets, so searches that found nothing are retried sooner
+EMPTY_SEARCH_CACHE_TTL = 300
+
+# Maximum number of cached provider searches
+SEARCH_CACHE_SIZE = 256
+
 # Dictionary to store provider instances
 _providers = {}
 
+# IDs of providers connected during this session
+_connected_providers = set()
+
+# Provider search results keyed by search arguments, as (expiry, results)
+_search_cache = OrderedDict()
+_search_cache_lock = threading.Lock()
+
 def get_providers():
     """Get all available providers.
     
@@ -76,6 +102,87 @@ def get_providers():
     
     return _providers
 
+def get_provider(provider_id: str):
+    """Get a provider instance by ID.
+    
+    Args:
+        provider_id: ID of the provider
+        
+    Returns:
+        BaseProvider: Provider instance, or None if the provider is not available
+    """
+    return get_providers().get(provider_id)
+
+def connect_provider(provider_id: str):
+    """Connect to a provider, at most once per session.
+    
+    Args:
+        provider_id: ID of the provider
+        
+    Returns:
+        bool: True if the provider is connected, False otherwise
+    """
+    if provider_id in _connected_providers:
+        return True
+    
+    provider = get_provider(provider_id)
+    if provider is None:
+        logger.error(f"Provider {provider_id} not found")
+        return False
+    
+    if provider.connect():
+        _connected_providers.add(provider_id)
+        return True
+    return False
+
+def search_provider(provider_id: str, query: str, asset_type: str = None, page: int = 1, page_size: int = 20):
+    """Search for assets in a specific provider.
+    
+    Successful results are reused for identical searches for SEARCH_CACHE_TTL
+    seconds, or EMPTY_SEARCH_CACHE_TTL seconds if nothing was found. Each
+    call returns its own copy, so callers may modify it.
+    
+    Args:
+        provider_id: ID of the provider
+        query: Search query string
+        asset_type: Type of asset to search for
+        page: Page number for pagination
+        page_size: Number of results per page
+        
+    Returns:
+        dict: Search results with metadata
+    """
+    provider = get_provider(provider_id)
+    if provider is None:
+        logger.error(f"Provider {provider_id} not found")
+        return {"results": [], "total": 0, "error": f"Provider {provider_id} not found"}
+    
+    key = (provider_id, query, asset_type, page, page_size)
+    with _search_cache_lock:
+        cached = _search_cache.get(key)
+        if cached and cached[0] > time.monotonic():
+            _search_cache.move_to_end(key)
+            return copy.deepcopy(cached[1])
+    
+    connect_provider(provider_id)
+    results = provider.search(query, asset_type, page, page_size)
+    
+    # Don't keep failed searches around
+    if "error" not in results:
+        ttl = SEARCH_CACHE_TTL if results.get("total") else EMPTY_SEARCH_CACHE_TTL
+        with _search_cache_lock:
+            _search_cache[key] = (time.monotonic() + ttl, copy.deepcopy(results))
+            _search_cache.move_to_end(key)
+            while len(_search_cache) > SEARCH_CACHE_SIZE:
+                _search_cache.popitem(last=False)
+    
+    return results
+
+def clear_search_cache():
+    """Forget all cached provider search results."""
+    with _search_cache_lock:
+        _search_cache.clear()
+
 def search_all_providers(query: str, asset_type: str = None, page: int = 1, page_size: int = 20):
     """Search for assets across all providers.
     
@@ -93,12 +200,8 @@ def search_all_providers(query: str, asset_type: str = None, page: int = 1, page
     
     for provider_id, provider in providers.items():
         try:
-            # Connect to provider if not already connected
-            if not hasattr(provider, 'session') or provider.session is None:
-                provider.connect()
-            
             # Search for assets
-            results = provider.search(query, asset_type, page, page_size)
+            results = search_provider(provider_id, query, asset_type, page, page_size)
             
             # Convert results to Asset objects
             if "results" in results:
@@ -129,8 +232,7 @@ def get_asset_details(provider_id: str, asset_id: str):
         provider = providers[provider_id]
         
         # Connect to provider if not already connected
-        if not hasattr(provider, 'session') or provider.session is None:
-            provider.connect()
+        connect_provider(provider_id)
         
         # Get asset details
         return provider.get_asset_details(asset_id)
@@ -156,8 +258,7 @@ def download_asset(provider_id: str, asset_id: str, destination_path: str, forma
         provider = providers[provider_id]
         
         # Connect to provider if not already connected
-        if not hasattr(provider, 'session') or provider.session is None:
-            provider.connect()
+        connect_provider(provider_id)
         
         # Download asset
         return provider.download_asset(asset_id, destination_path, format)
@@ -182,8 +283,7 @@ def get_preview(provider_id: str, asset_id: str, destination_path: str):
         provider = providers[provider_id]
         
         # Connect to provider if not already connected
-        if not hasattr(provider, 'session') or provider.session is None:
-            provider.connect()
+        connect_provider(provider_id)
         
         # Download preview
         return provider.get_preview(asset_id, destination_path)
@@ -209,8 +309,7 @@ def get_categories(provider_id: str = None):
             provider = providers[provider_id]
             
             # Connect to provider if not already connected
-            if not hasattr(provider, 'session') or provider.session is None:
-                provider.connect()
+            connect_provider(provider_id)
             
             # Get categories
             categories[provider_id] = provider.get_categories()
@@ -221,8 +320,7 @@ def get_categories(provider_id: str = None):
         for provider_id, provider in providers.items():
             try:
                 # Connect to provider if not already connected
-                if not hasattr(provider, 'session') or provider.session is None:
-                    provider.connect()
+                connect_provider(provider_id)
                 
                 # Get categories
                 categories[provider_id] = provider.get_categories()
@@ -230,3 +328,42 @@ def get_categories(provider_id: str = None):
                 logger.error(f"Error getting categories from {provider.provider_name}: {str(e)}")
     
     return categories
+
+def extract_archive(archive_path: str, destination_dir: str = None):
+    """Extract a downloaded ZIP archive.
+    
+    Members are streamed to disk in large chunks, and members whose paths
+    would leave the destination directory are skipped.
+    
+    Args:
+        archive_path: Path to the downloaded archive
+        destination_dir: Directory to extract to (default: archive path without extension)
+        
+    Returns:
+        list: Paths of the extracted files, or the archive path itself if it is not a ZIP file
+    """
+    if not zipfile.is_zipfile(archive_path):
+        return [archive_path]
+    
+    if destination_dir is None:
+        destination_dir = os.path.splitext(archive_path)[0]
+    root = os.path.realpath(destination_dir)
+    
+    extracted = []
+    with zipfile.ZipFile(archive_path) as archive:
+        for member in archive.infolist():
+            if member.is_dir():
+                continue
+            
+            target_path = os.path.realpath(os.path.join(root, member.filename))
+            if os.path.commonpath([root, target_path]) != root:
+                logger.warning(f"Skipping unsafe archive member: {member.filename}")
+                continue
+            
+            os.makedirs(os.path.dirname(target_path), exist_ok=True)
+            with archive.open(member) as source, open(target_path, "wb") as target:
+                shutil.copyfileobj(source, target, EXTRACT_CHUNK_SIZE)
+            extracted.append(target_path)
+    
+    logger.info(f"Extracted {len(extracted)} files from {archive_path}")
+    return extracted
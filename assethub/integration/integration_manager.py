@@ -0,0 +1,34 @@
+"""
+Provider access for AssetHub front ends.
+
+This module collects the provider registry functions used by the UI and the
+3ds Max plugin. Connections are made once per session and provider search
+results are cached for a while.
+"""
+from assethub.integration import (
+    get_providers,
+    get_provider,
+    connect_provider,
+    search_provider,
+    clear_search_cache,
+    search_all_providers,
+    get_asset_details,
+    download_asset,
+    get_preview,
+    get_categories,
+    extract_archive,
+)
+
+__all__ = [
+    "get_providers",
+    "get_provider",
+    "connect_provider",
+    "search_provider",
+    "clear_search_cache",
+    "search_all_providers",
+    "get_asset_details",
+    "download_asset",
+    "get_preview",
+    "get_categories",
+    "extract_archive",
+]
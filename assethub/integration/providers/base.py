@@ -4,8 +4,66 @@ Base provider module for external asset libraries.
 This module defines the base provider interface for integrating with external asset libraries.
 """
 import abc
+import threading
 from typing import List, Dict, Any, Optional
 
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Connection pool limits of the shared session; sized so that concurrent
+# requests to one host do not queue behind urllib3's default of 10
+POOL_CONNECTIONS = 16
+POOL_MAXSIZE = 32
+
+# Retries of rate limited (HTTP 429) requests, with exponential backoff
+# unless the server sends a Retry-After header
+RATE_LIMIT_RETRIES = 3
+RATE_LIMIT_BACKOFF = 1.0
+
+_shared_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+
+def get_shared_session() -> requests.Session:
+    """
+    Get the HTTP session shared by all providers, creating it on first use.
+
+    Sharing one session keeps connections to every provider host alive
+    across searches and downloads instead of repeating TCP and TLS
+    handshakes. Providers must not store per-account state such as
+    authorization headers on it. Rate limited GET requests are retried
+    with backoff.
+
+    Returns:
+        Shared HTTP session
+    """
+    global _shared_session
+
+    with _session_lock:
+        if _shared_session is None:
+            session = requests.Session()
+            retries = Retry(
+                total=RATE_LIMIT_RETRIES,
+                connect=0,
+                read=0,
+                other=0,
+                status_forcelist=(429,),
+                allowed_methods=frozenset(["GET", "HEAD"]),
+                backoff_factor=RATE_LIMIT_BACKOFF,
+                respect_retry_after_header=True,
+                raise_on_status=False
+            )
+            adapter = HTTPAdapter(
+                pool_connections=POOL_CONNECTIONS,
+                pool_maxsize=POOL_MAXSIZE,
+                max_retries=retries
+            )
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _shared_session = session
+        return _shared_session
+
 
 class BaseProvider(abc.ABC):
     """Base class for external asset library providers."""
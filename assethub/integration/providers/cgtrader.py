@@ -84,7 +84,7 @@ class CGTraderProvider(BaseProvider):
             Dictionary containing search results and metadata
         """
         if not self.connected and not self.connect():
-            return {"results": [], "total": 0, "page": page, "page_size": page_size}
+            return {"results": [], "total": 0, "page": page, "page_size": page_size, "error": "Not connected to CGTrader"}
 
         # Map asset_type to CGTrader categories
         category = None
@@ -143,11 +143,11 @@ class CGTraderProvider(BaseProvider):
                 }
             else:
                 logger.error(f"Error searching CGTrader: {response.status_code}")
-                return {"results": [], "total": 0, "page": page, "page_size": page_size}
+                return {"results": [], "total": 0, "page": page, "page_size": page_size, "error": f"HTTP {response.status_code}"}
         
         except Exception as e:
             logger.error(f"Error searching CGTrader: {e}")
-            return {"results": [], "total": 0, "page": page, "page_size": page_size}
+            return {"results": [], "total": 0, "page": page, "page_size": page_size, "error": str(e)}
 
     def get_asset_details(self, asset_id: str) -> Dict[str, Any]:
         """
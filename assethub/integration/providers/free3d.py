@@ -13,7 +13,7 @@ from typing import Dict, List, Optional, Any
 from bs4 import BeautifulSoup
 from urllib.parse import urljoin
 
-from assethub.integration.providers.base import BaseProvider
+from assethub.integration.providers.base import BaseProvider, get_shared_session
 from assethub.core.config import config
 from assethub.core.models import Asset
 
@@ -41,7 +41,7 @@ class Free3DProvider(BaseProvider):
             bool: True if connection successful, False otherwise.
         """
         try:
-            self.session = requests.Session()
+            self.session = get_shared_session()
             # Test connection by accessing the main page
             response = self.session.get(self.site_url)
             response.raise_for_status()
@@ -11,7 +11,7 @@ import requests
 from typing import Dict, List, Optional, Any
 from urllib.parse import urljoin
 
-from assethub.integration.providers.base import BaseProvider
+from assethub.integration.providers.base import BaseProvider, get_shared_session
 from assethub.core.config import config
 from assethub.core.models import Asset
 
@@ -40,7 +40,7 @@ class PolyHavenProvider(BaseProvider):
             bool: True if connection successful, False otherwise.
         """
         try:
-            self.session = requests.Session()
+            self.session = get_shared_session()
             # Test connection by getting a list of assets
             response = self.session.get(f"{self.api_url}/assets")
             response.raise_for_status()
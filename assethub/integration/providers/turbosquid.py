@@ -5,16 +5,14 @@ This module provides functionality to search and download assets from Turbosquid
 """
 import os
 import json
+import shutil
 import logging
 import requests
-from typing import Dict, Any, Optional, List
-from urllib.parse import urljoin
+from typing import Dict, Any, Optional, List, Set
 
-from assethub.integration.providers.base import BaseProvider
+from assethub.integration.providers.base import BaseProvider, get_shared_session
 from assethub.core.config import config
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # Turbosquid API endpoints
@@ -22,6 +20,63 @@ TURBOSQUID_API_BASE = "https://api.turbosquid.com/v1/"
 TURBOSQUID_SEARCH_ENDPOINT = "search"
 TURBOSQUID_PRODUCT_ENDPOINT = "products/"
 
+# Full endpoint URLs, resolved once instead of per request
+TURBOSQUID_STATUS_URL = f"{TURBOSQUID_API_BASE}status"
+TURBOSQUID_SEARCH_URL = f"{TURBOSQUID_API_BASE}{TURBOSQUID_SEARCH_ENDPOINT}"
+TURBOSQUID_PRODUCT_URL = f"{TURBOSQUID_API_BASE}{TURBOSQUID_PRODUCT_ENDPOINT}"
+
+# Buffer size used when streaming downloads to disk
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+
+
+def _stream_to_file(response: requests.Response, destination_path: str) -> None:
+    """
+    Stream a response body straight to disk.
+
+    Where the platform supports it, the kernel is told that the file is
+    written sequentially and that its pages can be dropped once flushed,
+    so large archives do not evict the rest of the page cache.
+
+    Args:
+        response: Streamed response to read from
+        destination_path: Path where the body should be saved
+    """
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+    fd = os.open(destination_path, flags, 0o644)
+    with os.fdopen(fd, 'wb') as f:
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+
+        # Let urllib3 undo any transfer encoding such as gzip
+        response.raw.decode_content = True
+        shutil.copyfileobj(response.raw, f, DOWNLOAD_CHUNK_SIZE)
+
+        if hasattr(os, "posix_fadvise"):
+            # Dirty pages cannot be dropped, so flush them out first
+            f.flush()
+            os.fdatasync(fd)
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+
+
+def _get_nested(item: Dict[str, Any], key: str, subkey: str, default: Any = "") -> Any:
+    """
+    Read a field of a nested object in an API item.
+
+    Unlike chained ``get`` calls this does not allocate an empty fallback
+    dict for every item that lacks the nested object.
+
+    Args:
+        item: API item
+        key: Key of the nested object
+        subkey: Key of the field inside the nested object
+        default: Value returned when the field is missing
+
+    Returns:
+        Field value or default
+    """
+    value = item.get(key)
+    return value.get(subkey, default) if isinstance(value, dict) else default
+
 
 class TurbosquidProvider(BaseProvider):
     """Provider for Turbosquid 3D model library."""
@@ -34,9 +89,29 @@ class TurbosquidProvider(BaseProvider):
             api_key: API key for Turbosquid (optional, can be set in config)
         """
         self.api_key = api_key or config.get("integration", "turbosquid_api_key")
-        self.session = requests.Session()
+        self.session = get_shared_session()
+        self.headers: Dict[str, str] = {}
         self.connected = False
 
+        # Asset details and the validators used to revalidate them
+        self._details_cache: Dict[str, Dict[str, Any]] = {}
+        self._validators: Dict[str, Dict[str, str]] = {}
+
+        # Destination directories already known to exist
+        self._ensured_dirs: Set[str] = set()
+
+    def _ensure_parent_dir(self, destination_path: str) -> None:
+        """
+        Create the parent directory of a destination path once per provider.
+
+        Args:
+            destination_path: Path of the file about to be written
+        """
+        directory = os.path.dirname(destination_path)
+        if directory not in self._ensured_dirs:
+            os.makedirs(directory, exist_ok=True)
+            self._ensured_dirs.add(directory)
+
     def connect(self) -> bool:
         """
         Connect to Turbosquid API.
@@ -48,25 +123,26 @@ class TurbosquidProvider(BaseProvider):
             logger.error("Turbosquid API key not provided")
             return False
 
-        # Set up session headers
-        self.session.headers.update({
+        # Set up request headers; they are sent per request because the
+        # session is shared with instances that may use other API keys
+        self.headers = {
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json",
             "Accept": "application/json"
-        })
+        }
 
         # Test connection with a simple request
         try:
-            response = self.session.get(urljoin(TURBOSQUID_API_BASE, "status"))
+            response = self.session.get(TURBOSQUID_STATUS_URL, headers=self.headers)
             if response.status_code == 200:
                 self.connected = True
                 logger.info("Connected to Turbosquid API")
                 return True
             else:
-                logger.error(f"Failed to connect to Turbosquid API: {response.status_code}")
+                logger.error("Failed to connect to Turbosquid API: %s", response.status_code)
                 return False
         except Exception as e:
-            logger.error(f"Error connecting to Turbosquid API: {e}")
+            logger.error("Error connecting to Turbosquid API: %s", e)
             return False
 
     def search(self, query: str, asset_type: Optional[str] = None, 
@@ -84,7 +160,7 @@ class TurbosquidProvider(BaseProvider):
             Dictionary containing search results and metadata
         """
         if not self.connected and not self.connect():
-            return {"results": [], "total": 0, "page": page, "page_size": page_size}
+            return {"results": [], "total": 0, "page": page, "page_size": page_size, "error": "Not connected to Turbosquid"}
 
         # Map asset_type to Turbosquid categories
         category = None
@@ -108,8 +184,9 @@ class TurbosquidProvider(BaseProvider):
 
         try:
             response = self.session.get(
-                urljoin(TURBOSQUID_API_BASE, TURBOSQUID_SEARCH_ENDPOINT),
-                params=params
+                TURBOSQUID_SEARCH_URL,
+                params=params,
+                headers=self.headers
             )
 
             if response.status_code == 200:
@@ -130,7 +207,7 @@ class TurbosquidProvider(BaseProvider):
                         "file_formats": item.get("file_formats", []),
                         "tags": item.get("tags", []),
                         "categories": item.get("categories", []),
-                        "author": item.get("artist", {}).get("name", ""),
+                        "author": _get_nested(item, "artist", "name"),
                         "created_at": item.get("created_at", ""),
                         "updated_at": item.get("updated_at", "")
                     })
@@ -142,12 +219,12 @@ class TurbosquidProvider(BaseProvider):
                     "page_size": page_size
                 }
             else:
-                logger.error(f"Error searching Turbosquid: {response.status_code}")
-                return {"results": [], "total": 0, "page": page, "page_size": page_size}
+                logger.error("Error searching Turbosquid: %s", response.status_code)
+                return {"results": [], "total": 0, "page": page, "page_size": page_size, "error": f"HTTP {response.status_code}"}
         
         except Exception as e:
-            logger.error(f"Error searching Turbosquid: {e}")
-            return {"results": [], "total": 0, "page": page, "page_size": page_size}
+            logger.error("Error searching Turbosquid: %s", e)
+            return {"results": [], "total": 0, "page": page, "page_size": page_size, "error": str(e)}
 
     def get_asset_details(self, asset_id: str) -> Dict[str, Any]:
         """
@@ -163,15 +240,20 @@ class TurbosquidProvider(BaseProvider):
             return {}
 
         try:
+            # Revalidate cached details instead of downloading them again
             response = self.session.get(
-                urljoin(TURBOSQUID_API_BASE, f"{TURBOSQUID_PRODUCT_ENDPOINT}{asset_id}")
+                f"{TURBOSQUID_PRODUCT_URL}{asset_id}",
+                headers={**self.headers, **self._validators.get(asset_id, {})}
             )
 
+            if response.status_code == 304 and asset_id in self._details_cache:
+                return dict(self._details_cache[asset_id])
+
             if response.status_code == 200:
                 item = response.json()
                 
                 # Transform response to standard format
-                return {
+                details = {
                     "id": str(item.get("id")),
                     "name": item.get("name", ""),
                     "description": item.get("description", ""),
@@ -183,7 +265,7 @@ class TurbosquidProvider(BaseProvider):
                     "file_formats": item.get("file_formats", []),
                     "tags": item.get("tags", []),
                     "categories": item.get("categories", []),
-                    "author": item.get("artist", {}).get("name", ""),
+                    "author": _get_nested(item, "artist", "name"),
                     "created_at": item.get("created_at", ""),
                     "updated_at": item.get("updated_at", ""),
                     "vertex_count": item.get("vertex_count", 0),
@@ -195,12 +277,24 @@ class TurbosquidProvider(BaseProvider):
                     "dimensions": item.get("dimensions", {}),
                     "additional_images": item.get("additional_images", [])
                 }
+
+                validators = {}
+                if response.headers.get("ETag"):
+                    validators["If-None-Match"] = response.headers["ETag"]
+                if response.headers.get("Last-Modified"):
+                    validators["If-Modified-Since"] = response.headers["Last-Modified"]
+
+                if validators:
+                    self._validators[asset_id] = validators
+                    self._details_cache[asset_id] = details
+
+                return dict(details)
             else:
-                logger.error(f"Error getting asset details from Turbosquid: {response.status_code}")
+                logger.error("Error getting asset details from Turbosquid: %s", response.status_code)
                 return {}
         
         except Exception as e:
-            logger.error(f"Error getting asset details from Turbosquid: {e}")
+            logger.error("Error getting asset details from Turbosquid: %s", e)
             return {}
 
     def download_asset(self, asset_id: str, destination_path: str) -> bool:
@@ -222,7 +316,8 @@ class TurbosquidProvider(BaseProvider):
         try:
             # Get download URL (in a real implementation, this would be the actual download URL)
             response = self.session.get(
-                urljoin(TURBOSQUID_API_BASE, f"{TURBOSQUID_PRODUCT_ENDPOINT}{asset_id}/download")
+                f"{TURBOSQUID_PRODUCT_URL}{asset_id}/download",
+                headers=self.headers
             )
 
             if response.status_code == 200:
@@ -230,31 +325,53 @@ class TurbosquidProvider(BaseProvider):
                 
                 if download_url:
                     # Download the file
-                    download_response = self.session.get(download_url, stream=True)
+                    download_response = self.session.get(download_url, stream=True, headers=self.headers)
                     
                     if download_response.status_code == 200:
-                        os.makedirs(os.path.dirname(destination_path), exist_ok=True)
+                        self._ensure_parent_dir(destination_path)
                         
-                        with open(destination_path, 'wb') as f:
-                            for chunk in download_response.iter_content(chunk_size=8192):
-                                f.write(chunk)
+                        _stream_to_file(download_response, destination_path)
                         
-                        logger.info(f"Downloaded asset {asset_id} to {destination_path}")
+                        logger.info("Downloaded asset %s to %s", asset_id, destination_path)
                         return True
                     else:
-                        logger.error(f"Error downloading asset from Turbosquid: {download_response.status_code}")
+                        logger.error("Error downloading asset from Turbosquid: %s", download_response.status_code)
                         return False
                 else:
                     logger.error("Download URL not found")
                     return False
             else:
-                logger.error(f"Error getting download URL from Turbosquid: {response.status_code}")
+                logger.error("Error getting download URL from Turbosquid: %s", response.status_code)
                 return False
         
         except Exception as e:
-            logger.error(f"Error downloading asset from Turbosquid: {e}")
+            logger.error("Error downloading asset from Turbosquid: %s", e)
             return False
 
+    def _get_preview_url(self, asset_id: str) -> Optional[str]:
+        """
+        Get the preview image URL of an asset.
+
+        Args:
+            asset_id: ID of the asset in Turbosquid
+
+        Returns:
+            Preview image URL, or None if it could not be retrieved
+        """
+        if asset_id in self._details_cache:
+            return self._details_cache[asset_id].get("preview_url")
+
+        response = self.session.get(
+            f"{TURBOSQUID_PRODUCT_URL}{asset_id}",
+            headers=self.headers
+        )
+
+        if response.status_code != 200:
+            logger.error("Error getting preview URL from Turbosquid: %s", response.status_code)
+            return None
+
+        return response.json().get("preview_image_url")
+
     def get_preview(self, asset_id: str, destination_path: str) -> bool:
         """
         Download a preview image for an asset.
@@ -270,30 +387,29 @@ class TurbosquidProvider(BaseProvider):
             return False
 
         try:
-            # Get asset details to get preview URL
-            asset_details = self.get_asset_details(asset_id)
-            preview_url = asset_details.get("preview_url")
+            # Only the preview URL is needed, so skip the full details transform
+            preview_url = self._get_preview_url(asset_id)
             
             if preview_url:
                 # Download the preview image
-                response = self.session.get(preview_url, stream=True)
+                response = self.session.get(preview_url, stream=True, headers=self.headers)
                 
                 if response.status_code == 200:
-                    os.makedirs(os.path.dirname(destination_path), exist_ok=True)
+                    self._ensure_parent_dir(destination_path)
                     
                     with open(destination_path, 'wb') as f:
                         for chunk in response.iter_content(chunk_size=8192):
                             f.write(chunk)
                     
-                    logger.info(f"Downloaded preview for asset {asset_id} to {destination_path}")
+                    logger.info("Downloaded preview for asset %s to %s", asset_id, destination_path)
                     return True
                 else:
-                    logger.error(f"Error downloading preview from Turbosquid: {response.status_code}")
+                    logger.error("Error downloading preview from Turbosquid: %s", response.status_code)
                     return False
             else:
                 logger.error("Preview URL not found")
                 return False
         
         except Exception as e:
-            logger.error(f"Error downloading preview from Turbosquid: {e}")
+            logger.error("Error downloading preview from Turbosquid: %s", e)
             return False
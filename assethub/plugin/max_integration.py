@@ -4,8 +4,11 @@
 This module provides functionality to integrate AssetHub with 3ds Max.
 """
 import os
+import re
 import sys
+import hashlib
 import logging
+from collections import OrderedDict, defaultdict
 from typing import Dict, Any, Optional, List
 from pathlib import Path
 
@@ -24,29 +27,395 @@ except ImportError:
         def FileManager_MergeFile(self, file_path):
             return True
             
+        def FileManager_Import(self, file_path):
+            return True
+            
         def NotificationManager_Register(self, code, callback):
             pass
             
     MaxPlus = MaxPlusMock()
 
+# Function bringing each importable model format into the scene; 3ds Max
+# scenes are merged, other formats go through their import plugins
+_IMPORTERS = {
+    ".max": MaxPlus.FileManager_MergeFile,
+    ".fbx": MaxPlus.FileManager_Import,
+    ".obj": MaxPlus.FileManager_Import,
+    ".3ds": MaxPlus.FileManager_Import,
+    ".dae": MaxPlus.FileManager_Import,
+    ".stl": MaxPlus.FileManager_Import,
+}
+
 # Import PySide for UI
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLineEdit, 
-    QLabel, QListWidget, QListWidgetItem, QFileDialog, QMessageBox,
+    QLabel, QListView, QFileDialog, QMessageBox, QAbstractItemView,
     QComboBox, QTabWidget, QSplitter, QProgressBar, QStatusBar
 )
-from PySide6.QtCore import Qt, Signal, Slot, QSize
-from PySide6.QtGui import QIcon, QPixmap
+from PySide6.QtCore import (
+    Qt, Signal, Slot, QSize, QObject, QRunnable, QThreadPool, QTimer,
+    QAbstractListModel, QModelIndex
+)
+from PySide6.QtGui import QIcon, QImage, QPixmap
+
+import numpy as np
 
 # Import AssetHub modules
 from assethub.core.config import config
 from assethub.catalog.search import AssetSearch
 from assethub.integration import integration_manager
+from assethub.utils.image_cache import THUMB_CACHE_LIMIT_MB, save_cached_image
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Maximum number of concurrent requests to online providers
+NETWORK_THREAD_COUNT = 8
+
+# Size of result list icons and number of decoded icons kept in memory
+ICON_SIZE = 64
+ICON_CACHE_SIZE = 256
+
+# Directory under the storage path holding scaled preview thumbnails
+THUMB_CACHE_DIR = ".thumb-cache"
+
+# Characters not allowed in downloaded file names; \w keeps non-ASCII letters
+_SANITIZE_RE = re.compile(r"[^\w .\-]+")
+
+
+class WorkerSignals(QObject):
+    """Signals emitted by a Worker."""
+    
+    finished = Signal(object)
+    error = Signal(str)
+
+
+class Worker(QRunnable):
+    """Runnable that executes a blocking call on the global thread pool.
+    
+    The result is delivered through ``signals.finished`` and any exception
+    through ``signals.error``, both queued back to the UI thread. The
+    callable must not touch Qt widgets.
+    """
+    
+    def __init__(self, fn, *args, **kwargs):
+        """
+        Initialize the worker.
+        
+        Args:
+            fn: Callable to run in the background
+            *args: Positional arguments for the callable
+            **kwargs: Keyword arguments for the callable
+        """
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = WorkerSignals()
+    
+    def run(self):
+        """Run the callable and emit its result."""
+        try:
+            result = self.fn(*self.args, **self.kwargs)
+        except Exception as e:
+            logger.error(f"Error in background task: {e}")
+            self.signals.error.emit(str(e))
+        else:
+            self.signals.finished.emit(result)
+
+
+def _search_local(search, query, filters):
+    """
+    Search the local library.
+    
+    Queries with no indexed word are answered without opening the index.
+    
+    Args:
+        search: AssetSearch to search with
+        query: Search query string
+        filters: Filters to apply
+        
+    Returns:
+        List of matching assets
+    """
+    if not search.could_match(query):
+        return []
+    
+    return search.search(query, filters=filters)
+
+
+def _search_provider(provider, query):
+    """
+    Connect to a provider and search it.
+    
+    The connection and search results are cached by the integration manager.
+    
+    Args:
+        provider: ID of the provider to search
+        query: Search query string
+        
+    Returns:
+        Provider search results
+    """
+    if not integration_manager.connect_provider(provider):
+        raise ConnectionError(f"Could not connect to {provider}")
+    
+    return integration_manager.search_provider(provider, query)
+
+
+def _get_thumb(preview_path):
+    """
+    Get a scaled thumbnail for a preview image.
+    
+    Thumbnails are stored in the thumbnail cache directory, keyed by the
+    preview path, modification time and size, so each preview is decoded
+    and scaled only once. The cache is kept within the "thumb_cache_mb"
+    UI setting.
+    
+    Args:
+        preview_path: Path to the preview image
+        
+    Returns:
+        Scaled image, or a null image if it could not be read
+    """
+    try:
+        stat = os.stat(preview_path)
+    except OSError:
+        return QImage()
+    
+    key = hashlib.blake2b(
+        f"{preview_path}:{stat.st_mtime}:{stat.st_size}".encode(), digest_size=16
+    ).hexdigest()
+    thumb_dir = config.get_storage_path() / THUMB_CACHE_DIR
+    thumb_path = thumb_dir / f"{key}.png"
+    
+    if thumb_path.exists():
+        image = QImage(str(thumb_path))
+        if not image.isNull():
+            return image
+    
+    image = QImage(preview_path)
+    if image.isNull():
+        return image
+    
+    image = image.scaled(ICON_SIZE, ICON_SIZE, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+    
+    limit_mb = config.get("ui", "thumb_cache_mb", THUMB_CACHE_LIMIT_MB)
+    save_cached_image(image, thumb_path, limit_mb * 1024 * 1024)
+    
+    return image
+
+
+def _as_list(value):
+    """
+    Normalize a tags or categories value to a list.
+    
+    Index results store these as comma-separated strings, provider results
+    as lists.
+    """
+    if not value:
+        return []
+    if isinstance(value, str):
+        return value.split(",")
+    return list(value)
+
+
+class ResultTable:
+    """Column-wise copy of search results for vectorized filtering.
+    
+    Text columns are lowercased once when the table is built. A row's tags
+    and categories are joined into one string each so they are searched
+    like the other columns.
+    """
+    
+    # Joins tags and categories; never part of filter text
+    TAG_SEPARATOR = "\x1f"
+    
+    def __init__(self, results):
+        """
+        Build the table.
+        
+        Args:
+            results: List of result dictionaries
+        """
+        self.names = np.array([(result.get("name") or "").lower() for result in results], dtype=str)
+        self.descriptions = np.array(
+            [(result.get("description") or "").lower() for result in results], dtype=str
+        )
+        self.tags = np.array([
+            self.TAG_SEPARATOR.join(_as_list(result.get("tags"))).lower() for result in results
+        ], dtype=str)
+        self.categories = np.array([
+            self.TAG_SEPARATOR.join(_as_list(result.get("categories"))).lower() for result in results
+        ], dtype=str)
+    
+    def match(self, text, rows):
+        """
+        Find the rows containing filter text in any column.
+        
+        Every check is a substring match, so a longer text never matches a
+        row that a shorter one rejected.
+        
+        Args:
+            text: Lowercased filter text
+            rows: Array of row numbers to check
+            
+        Returns:
+            Array of the matching row numbers
+        """
+        matched = np.zeros(len(rows), dtype=bool)
+        
+        # Only rows no earlier column matched are checked against the next
+        for column in (self.names, self.categories, self.tags, self.descriptions):
+            pending = np.flatnonzero(~matched)
+            if not len(pending):
+                break
+            matched[pending] = np.char.find(column[rows[pending]], text) >= 0
+        
+        return rows[matched]
+
+
+class AssetListModel(QAbstractListModel):
+    """List model over asset result dictionaries.
+    
+    Preview icons are loaded from the thumbnail cache on the thread pool
+    the first time a row is painted and kept in a bounded LRU cache, so
+    only visible rows pay for image decoding.
+    """
+    
+    def __init__(self, parent=None):
+        """Initialize the model."""
+        super().__init__(parent)
+        
+        self._all_results = []
+        self._results = []
+        self._table = None
+        self._visible_rows = np.arange(0)
+        self._search_text = ""
+        self._filter_text = ""
+        self._rows_by_preview = defaultdict(list)
+        self._icon_cache = OrderedDict()
+        self._loading = {}
+    
+    def rowCount(self, parent=QModelIndex()):
+        """Return the number of results."""
+        if parent.isValid():
+            return 0
+        return len(self._results)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        """Return the data for a row."""
+        if not index.isValid():
+            return None
+        
+        result = self._results[index.row()]
+        
+        if role == Qt.DisplayRole:
+            return result.get("name", "")
+        if role == Qt.UserRole:
+            return result
+        if role == Qt.DecorationRole:
+            preview_path = result.get("preview_path")
+            if preview_path:
+                return self._get_icon(preview_path)
+        
+        return None
+    
+    def set_results(self, results, search_text=""):
+        """
+        Replace the displayed results.
+        
+        Args:
+            results: List of result dictionaries
+            search_text: Query the results were searched with
+        """
+        self._all_results = list(results)
+        self._table = None
+        self._search_text = search_text.strip().lower()
+        self._filter_text = self._search_text
+        self._show(np.arange(len(self._all_results)))
+    
+    def filter_results(self, text):
+        """
+        Show only the results matching filter text.
+        
+        Text that extends the previous filter narrows the rows already shown
+        instead of rescanning every result.
+        
+        Args:
+            text: Filter text
+        """
+        text = text.strip().lower()
+        if text == self._filter_text:
+            return
+        
+        all_rows = np.arange(len(self._all_results))
+        if self._search_text.startswith(text):
+            # The search already covered this text
+            rows = all_rows
+        else:
+            # Built on first use, so unfiltered lists never pay for it
+            if self._table is None:
+                self._table = ResultTable(self._all_results)
+            
+            candidates = all_rows
+            if text.startswith(self._filter_text):
+                candidates = self._visible_rows
+            rows = self._table.match(text, candidates)
+        
+        self._filter_text = text
+        self._show(rows)
+    
+    def total_count(self):
+        """Return the number of results before filtering."""
+        return len(self._all_results)
+    
+    def _show(self, rows):
+        """Reset the model to show an array of result row numbers."""
+        self.beginResetModel()
+        self._visible_rows = rows
+        self._results = [self._all_results[row] for row in rows]
+        self._rows_by_preview = defaultdict(list)
+        for row, result in enumerate(self._results):
+            preview_path = result.get("preview_path")
+            if preview_path:
+                self._rows_by_preview[preview_path].append(row)
+        self.endResetModel()
+    
+    def _get_icon(self, preview_path):
+        """Return a cached icon, starting a background load on a miss."""
+        icon = self._icon_cache.get(preview_path)
+        if icon is not None:
+            self._icon_cache.move_to_end(preview_path)
+            return icon
+        
+        if preview_path not in self._loading:
+            worker = Worker(_get_thumb, preview_path)
+            worker.signals.finished.connect(
+                lambda image: self._on_icon_loaded(preview_path, image)
+            )
+            worker.signals.error.connect(
+                lambda message: self._loading.pop(preview_path, None)
+            )
+            self._loading[preview_path] = worker
+            QThreadPool.globalInstance().start(worker)
+        
+        return None
+    
+    def _on_icon_loaded(self, preview_path, image):
+        """Cache a decoded icon and repaint the rows that show it."""
+        self._loading.pop(preview_path, None)
+        
+        # Cache unreadable previews as empty icons so they are not retried
+        self._icon_cache[preview_path] = QIcon(QPixmap.fromImage(image)) if not image.isNull() else QIcon()
+        while len(self._icon_cache) > ICON_CACHE_SIZE:
+            self._icon_cache.popitem(last=False)
+        
+        for row in self._rows_by_preview.get(preview_path, ()):
+            index = self.index(row)
+            self.dataChanged.emit(index, index, [Qt.DecorationRole])
+
 
 class AssetHubMaxPlugin(QWidget):
     """AssetHub plugin for 3ds Max."""
@@ -58,6 +427,18 @@ class AssetHubMaxPlugin(QWidget):
         self.setWindowTitle("AssetHub for 3ds Max")
         self.setMinimumSize(800, 600)
         
+        # Background workers in flight; referenced here so that their
+        # signals are not garbage collected before they are delivered
+        self._workers = set()
+        
+        # Network requests spend their time waiting on I/O, so they get their
+        # own pool instead of competing with local searches for CPU threads
+        self.network_pool = QThreadPool(self)
+        self.network_pool.setMaxThreadCount(NETWORK_THREAD_COUNT)
+        
+        # Categories are loaded when the plugin is first shown
+        self._categories_loaded = False
+        
         # Initialize UI
         self.init_ui()
         
@@ -74,6 +455,7 @@ class AssetHubMaxPlugin(QWidget):
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText("Search assets...")
         self.search_input.returnPressed.connect(self.on_search)
+        self.search_input.textChanged.connect(self.on_search_input_text_changed)
         
         self.search_button = QPushButton("Search")
         self.search_button.clicked.connect(self.on_search)
@@ -96,15 +478,14 @@ class AssetHubMaxPlugin(QWidget):
         # Category filter
         category_label = QLabel("Category:")
         self.category_combo = QComboBox()
-        self.category_combo.addItem("All Categories")
+        self.category_combo.addItem("All Categories", None)
         
         # File type filter
         file_type_label = QLabel("File Type:")
         self.file_type_combo = QComboBox()
-        self.file_type_combo.addItem("All Types")
-        self.file_type_combo.addItem("model")
-        self.file_type_combo.addItem("texture")
-        self.file_type_combo.addItem("material")
+        self.file_type_combo.addItem("All Types", None)
+        for file_type in ("model", "texture", "material"):
+            self.file_type_combo.addItem(file_type, file_type)
         
         # Apply filters button
         self.apply_filters_button = QPushButton("Apply Filters")
@@ -119,9 +500,12 @@ class AssetHubMaxPlugin(QWidget):
         local_layout.addLayout(filters_layout)
         
         # Results list
-        self.results_list = QListWidget()
-        self.results_list.setIconSize(QSize(64, 64))
-        self.results_list.itemDoubleClicked.connect(self.on_asset_double_clicked)
+        self.results_model = AssetListModel(self)
+        self.results_list = QListView()
+        self.results_list.setModel(self.results_model)
+        self.results_list.setIconSize(QSize(ICON_SIZE, ICON_SIZE))
+        self.results_list.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        self.results_list.doubleClicked.connect(self.on_asset_double_clicked)
         
         local_layout.addWidget(self.results_list)
         
@@ -155,9 +539,12 @@ class AssetHubMaxPlugin(QWidget):
         online_layout.addLayout(provider_layout)
         
         # Online results list
-        self.online_results_list = QListWidget()
-        self.online_results_list.setIconSize(QSize(64, 64))
-        self.online_results_list.itemDoubleClicked.connect(self.on_online_asset_double_clicked)
+        self.online_results_model = AssetListModel(self)
+        self.online_results_list = QListView()
+        self.online_results_list.setModel(self.online_results_model)
+        self.online_results_list.setIconSize(QSize(ICON_SIZE, ICON_SIZE))
+        self.online_results_list.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        self.online_results_list.doubleClicked.connect(self.on_online_asset_double_clicked)
         
         online_layout.addWidget(self.online_results_list)
         
@@ -184,18 +571,39 @@ class AssetHubMaxPlugin(QWidget):
         
         # Set initial status
         self.status_bar.showMessage("Ready")
-        
-        # Load initial data
-        self.load_categories()
+    
+    def showEvent(self, event):
+        """Load initial data the first time the plugin is shown."""
+        if not self._categories_loaded:
+            self._categories_loaded = True
+            # Deferred so the window paints before the index is queried
+            QTimer.singleShot(0, self.load_categories)
+        
+        super().showEvent(event)
     
     def load_categories(self):
-        """Load categories into the category filter."""
-        self.category_combo.clear()
-        self.category_combo.addItem("All Categories")
-        
-        categories = self.search.get_categories()
-        for category in categories:
-            self.category_combo.addItem(category)
+        """Load categories into the category filter in the background."""
+        worker = Worker(self.search.get_categories)
+        worker.signals.finished.connect(self._on_categories_loaded)
+        worker.signals.error.connect(lambda message: self.finish_task())
+        self.start_task(worker, "Loading categories...")
+    
+    @Slot(object)
+    def _on_categories_loaded(self, categories):
+        """Fill the category filter."""
+        self.finish_task()
+        
+        # Refill without a repaint and change signal per item
+        self.category_combo.setUpdatesEnabled(False)
+        self.category_combo.blockSignals(True)
+        try:
+            self.category_combo.clear()
+            self.category_combo.addItem("All Categories", None)
+            for category in categories:
+                self.category_combo.addItem(category, category)
+        finally:
+            self.category_combo.blockSignals(False)
+            self.category_combo.setUpdatesEnabled(True)
     
     @Slot()
     def on_search(self):
@@ -205,53 +613,88 @@ class AssetHubMaxPlugin(QWidget):
         # Get filters
         filters = {}
         
-        category = self.category_combo.currentText()
-        if category != "All Categories":
+        # The "All" entries carry no data
+        category = self.category_combo.currentData()
+        if category is not None:
             filters["categories"] = category
         
-        file_type = self.file_type_combo.currentText()
-        if file_type != "All Types":
+        file_type = self.file_type_combo.currentData()
+        if file_type is not None:
             filters["file_type"] = file_type
         
-        # Show progress
-        self.progress_bar.setVisible(True)
-        self.status_bar.showMessage("Searching...")
+        # Perform search in the background
+        worker = Worker(_search_local, self.search, query, filters)
+        worker.signals.finished.connect(lambda results: self._on_search_done(results, query))
+        worker.signals.error.connect(self._on_search_error)
+        self.start_task(worker, "Searching...")
+    
+    def _on_search_done(self, results, query):
+        """Display local search results."""
+        self.finish_task()
+        self.display_results(results, query)
+    
+    @Slot(str)
+    def _on_search_error(self, message):
+        """Report a failed local search."""
+        self.finish_task()
+        QMessageBox.warning(self, "Search Error", f"Error searching: {message}")
+    
+    def start_task(self, worker, message, pool=None):
+        """
+        Start a background task and show progress.
         
-        # Perform search
-        try:
-            results = self.search.search(query, filters=filters)
-            self.display_results(results)
-        except Exception as e:
-            logger.error(f"Error searching: {e}")
-            QMessageBox.warning(self, "Search Error", f"Error searching: {str(e)}")
+        Args:
+            worker: Worker to start
+            message: Status message to show while the task runs
+            pool: Thread pool to run the worker on (default: global pool)
+        """
+        self._workers.add(worker)
+        for signal in (worker.signals.finished, worker.signals.error):
+            signal.connect(lambda *args, worker=worker: self._workers.discard(worker))
         
-        self.progress_bar.setVisible(False)
-        self.status_bar.showMessage("Ready")
+        self.progress_bar.setVisible(True)
+        self.status_bar.showMessage(message)
+        (pool or QThreadPool.globalInstance()).start(worker)
+    
+    def finish_task(self):
+        """Hide progress once the last background task has finished."""
+        # The finishing worker stays registered until its handlers return
+        if len(self._workers) <= 1:
+            self.progress_bar.setVisible(False)
+            self.status_bar.showMessage("Ready")
     
-    def display_results(self, results):
+    def display_results(self, results, query=""):
         """
         Display search results.
         
         Args:
             results: Search results
+            query: Query the results were searched with
         """
-        self.results_list.clear()
+        # Icons are loaded lazily by the model as rows become visible
+        self.results_model.set_results(results, query)
         
-        for result in results:
-            item = QListWidgetItem()
-            item.setText(result.get("name", ""))
-            item.setData(Qt.UserRole, result)
-            
-            # Set icon if preview is available
-            preview_path = result.get("preview_path")
-            if preview_path and os.path.exists(preview_path):
-                icon = QIcon(preview_path)
-                item.setIcon(icon)
-            
-            self.results_list.addItem(item)
+        # Apply anything typed while the search was running
+        self.results_model.filter_results(self.search_input.text())
         
         self.status_bar.showMessage(f"Found {len(results)} assets")
     
+    @Slot(str)
+    def on_search_input_text_changed(self, text):
+        """
+        Filter the local results as the search text changes.
+        
+        Args:
+            text: Current search text
+        """
+        if not self.results_model.total_count():
+            return
+        
+        self.results_model.filter_results(text)
+        self.status_bar.showMessage(
+            f"Showing {self.results_model.rowCount()} of {self.results_model.total_count()} assets"
+        )
+    
     @Slot()
     def on_online_search(self):
         """Handle online search button click."""
@@ -262,36 +705,33 @@ class AssetHubMaxPlugin(QWidget):
             QMessageBox.warning(self, "Search Error", "Please enter a search query")
             return
         
-        # Show progress
-        self.progress_bar.setVisible(True)
-        self.status_bar.showMessage(f"Searching {provider}...")
-        
         # Get provider
         provider_instance = integration_manager.get_provider(provider)
         
         if not provider_instance:
             QMessageBox.warning(self, "Provider Error", f"Provider {provider} not available")
-            self.progress_bar.setVisible(False)
-            self.status_bar.showMessage("Ready")
-            return
-        
-        # Connect to provider
-        if not provider_instance.connect():
-            QMessageBox.warning(self, "Connection Error", f"Could not connect to {provider}")
-            self.progress_bar.setVisible(False)
-            self.status_bar.showMessage("Ready")
             return
         
-        # Search
-        try:
-            results = provider_instance.search(query)
-            self.display_online_results(results, provider)
-        except Exception as e:
-            logger.error(f"Error searching {provider}: {e}")
-            QMessageBox.warning(self, "Search Error", f"Error searching {provider}: {str(e)}")
-        
-        self.progress_bar.setVisible(False)
-        self.status_bar.showMessage("Ready")
+        # Connect and search in the background; repeated searches are
+        # answered from the integration manager's cache
+        worker = Worker(_search_provider, provider, query)
+        worker.signals.finished.connect(
+            lambda results: self._on_online_search_done(results, provider)
+        )
+        worker.signals.error.connect(
+            lambda message: self._on_online_search_error(message, provider)
+        )
+        self.start_task(worker, f"Searching {provider}...", self.network_pool)
+    
+    def _on_online_search_done(self, results, provider):
+        """Display online search results."""
+        self.finish_task()
+        self.display_online_results(results, provider)
+    
+    def _on_online_search_error(self, message, provider):
+        """Report a failed online search."""
+        self.finish_task()
+        QMessageBox.warning(self, "Search Error", f"Error searching {provider}: {message}")
     
     def display_online_results(self, results, provider):
         """
@@ -301,31 +741,25 @@ class AssetHubMaxPlugin(QWidget):
             results: Search results
             provider: Provider name
         """
-        self.online_results_list.clear()
-        
         result_items = results.get("results", [])
         
+        # Add provider to data
         for result in result_items:
-            item = QListWidgetItem()
-            item.setText(result.get("name", ""))
-            
-            # Add provider and ID to data
             result["provider"] = provider
-            item.setData(Qt.UserRole, result)
-            
-            self.online_results_list.addItem(item)
+        
+        self.online_results_model.set_results(result_items)
         
         self.status_bar.showMessage(f"Found {len(result_items)} assets on {provider}")
     
-    @Slot(QListWidgetItem)
-    def on_asset_double_clicked(self, item):
+    @Slot(QModelIndex)
+    def on_asset_double_clicked(self, index):
         """
         Handle double-click on an asset.
         
         Args:
-            item: Clicked list item
+            index: Clicked model index
         """
-        asset_data = item.data(Qt.UserRole)
+        asset_data = index.data(Qt.UserRole)
         
         if not asset_data:
             return
@@ -336,16 +770,22 @@ class AssetHubMaxPlugin(QWidget):
     @Slot()
     def on_import_selected(self):
         """Handle import selected button click."""
-        selected_items = self.results_list.selectedItems()
+        selected_indexes = self.results_list.selectionModel().selectedIndexes()
         
-        if not selected_items:
+        if not selected_indexes:
             QMessageBox.warning(self, "Import Error", "No assets selected")
             return
         
-        for item in selected_items:
-            asset_data = item.data(Qt.UserRole)
+        # Validate everything first so the scene is reset only once
+        file_paths = []
+        for index in selected_indexes:
+            asset_data = index.data(Qt.UserRole)
             if asset_data:
-                self.import_asset(asset_data)
+                file_path = self._validate_asset(asset_data)
+                if file_path:
+                    file_paths.append(file_path)
+        
+        self._do_merge(file_paths)
     
     def import_asset(self, asset_data):
         """
@@ -354,44 +794,81 @@ class AssetHubMaxPlugin(QWidget):
         Args:
             asset_data: Asset data dictionary
         """
+        file_path = self._validate_asset(asset_data)
+        if file_path:
+            self._do_merge([file_path])
+    
+    def _validate_asset(self, asset_data):
+        """
+        Check that an asset can be imported into 3ds Max.
+        
+        Args:
+            asset_data: Asset data dictionary
+            
+        Returns:
+            Path of the asset file, or None if it cannot be imported
+        """
         file_path = asset_data.get("file_path")
         
         if not file_path or not os.path.exists(file_path):
             QMessageBox.warning(self, "Import Error", f"File not found: {file_path}")
-            return
+            return None
         
         # Check if the file is a 3D model
         file_type = asset_data.get("file_type")
         if file_type != "model":
             QMessageBox.warning(self, "Import Error", f"Cannot import {file_type} files")
+            return None
+        
+        file_ext = os.path.splitext(file_path)[1].lower()
+        if file_ext not in _IMPORTERS:
+            QMessageBox.warning(self, "Import Error", f"Cannot import {file_ext} files")
+            return None
+        
+        return file_path
+    
+    def _do_merge(self, file_paths):
+        """
+        Merge asset files into the 3ds Max scene.
+        
+        Args:
+            file_paths: Paths of validated asset files
+        """
+        if not file_paths:
             return
         
-        # Import the file into 3ds Max
+        # Import the files into 3ds Max
         try:
-            # Reset file manager to avoid conflicts
+            # Reset file manager once to avoid conflicts; resetting between
+            # merges would discard the files merged before
             MaxPlus.FileManager_Reset()
             
-            # Merge the file
-            result = MaxPlus.FileManager_MergeFile(file_path)
+            imported = []
+            for file_path in file_paths:
+                importer = _IMPORTERS[os.path.splitext(file_path)[1].lower()]
+                if importer(file_path):
+                    imported.append(file_path)
+                else:
+                    QMessageBox.warning(self, "Import Error", f"Failed to import: {file_path}")
             
-            if result:
-                self.status_bar.showMessage(f"Imported: {os.path.basename(file_path)}")
-            else:
-                QMessageBox.warning(self, "Import Error", f"Failed to import: {file_path}")
+            if len(imported) == 1:
+                self.status_bar.showMessage(f"Imported: {os.path.basename(imported[0])}")
+            elif imported:
+                self.status_bar.showMessage(f"Imported {len(imported)} assets")
         
         except Exception as e:
             logger.error(f"Error importing asset: {e}")
             QMessageBox.warning(self, "Import Error", f"Error importing asset: {str(e)}")
     
-    @Slot(QListWidgetItem)
-    def on_online_asset_double_clicked(self, item):
+    @Slot(QModelIndex)
+    def on_online_asset_double_clicked(self, index):
         """
         Handle double-click on an online asset.
         
         Args:
-            item: Clicked list item
+            index: Clicked model index
         """
-        asset_data = item.data(Qt.UserRole)
+        asset_data = index.data(Qt.UserRole)
         
         if not asset_data:
             return
@@ -402,9 +879,9 @@ class AssetHubMaxPlugin(QWidget):
     @Slot()
     def on_download_selected(self):
         """Handle download selected button click."""
-        selected_items = self.online_results_list.selectedItems()
+        selected_indexes = self.online_results_list.selectionModel().selectedIndexes()
         
-        if not selected_items:
+        if not selected_indexes:
             QMessageBox.warning(self, "Download Error", "No assets selected")
             return
         
@@ -416,10 +893,13 @@ class AssetHubMaxPlugin(QWidget):
         if not download_dir:
             return
         
-        for item in selected_items:
-            asset_data = item.data(Qt.UserRole)
-            if asset_data:
-                self.download_asset(asset_data, download_dir)
+        assets = [index.data(Qt.UserRole) for index in selected_indexes]
+        assets = [asset_data for asset_data in assets if asset_data]
+        
+        if len(assets) == 1:
+            self.download_asset(assets[0], download_dir)
+        elif assets:
+            self.download_assets(assets, download_dir)
     
     def download_asset(self, asset_data, download_dir):
         """
@@ -429,49 +909,156 @@ class AssetHubMaxPlugin(QWidget):
             asset_data: Asset data dictionary
             download_dir: Directory to download to
         """
+        self._start_download(asset_data, download_dir, self._on_download_done, self._on_download_error)
+    
+    def download_assets(self, assets, download_dir):
+        """
+        Download several assets concurrently.
+        
+        The downloads run on the network pool, which caps how many run at
+        once; progress is reported as each one finishes. Assets that share
+        a name are saved under distinct file names.
+        
+        Args:
+            assets: Asset data dictionaries
+            download_dir: Directory to download to
+        """
+        batch = {"total": len(assets), "finished": 0, "failed": []}
+        taken_paths = set()
+        
+        for asset_data in assets:
+            name = asset_data.get("name", "asset")
+            started = self._start_download(
+                asset_data, download_dir,
+                lambda success, provider, destination_path, name=name:
+                    self._on_batch_download_done(batch, success, name),
+                lambda message, name=name: self._on_batch_download_done(batch, False, name),
+                taken_paths
+            )
+            if not started:
+                batch["finished"] += 1
+                batch["failed"].append(name)
+        
+        # Nothing is left to wait for when no download could be started
+        if batch["finished"] == batch["total"]:
+            self._report_batch_progress(batch)
+    
+    def _start_download(self, asset_data, download_dir, on_done, on_error, taken_paths=None):
+        """
+        Start downloading an asset in the background.
+        
+        Args:
+            asset_data: Asset data dictionary
+            download_dir: Directory to download to
+            on_done: Called with (success, provider, destination_path)
+            on_error: Called with an error message
+            taken_paths: Destination paths already used by other downloads
+                of the same batch; the chosen path is added to it
+            
+        Returns:
+            True if the download was started
+        """
         provider = asset_data.get("provider")
         asset_id = asset_data.get("id")
         
         if not provider or not asset_id:
+            return False
+        
+        # Generate destination path
+        asset_name = asset_data.get("name", "asset")
+        # Sanitize filename
+        asset_name = _SANITIZE_RE.sub("", asset_name).strip() or "asset"
+        destination_path = os.path.join(download_dir, f"{asset_name}.zip")
+        
+        # Tell same-named assets of a batch apart by provider and ID
+        if taken_paths is not None:
+            if destination_path in taken_paths:
+                suffix = _SANITIZE_RE.sub("", f"{provider}-{asset_id}")
+                destination_path = os.path.join(download_dir, f"{asset_name} ({suffix}).zip")
+            taken_paths.add(destination_path)
+        
+        # Download the asset in the background
+        worker = Worker(integration_manager.download_asset, provider, asset_id, destination_path)
+        worker.signals.finished.connect(
+            lambda success: on_done(success, provider, destination_path)
+        )
+        worker.signals.error.connect(on_error)
+        self.start_task(worker, f"Downloading from {provider}...", self.network_pool)
+        return True
+    
+    def _on_batch_download_done(self, batch, success, name):
+        """Record one finished download of a batch."""
+        self.finish_task()
+        
+        batch["finished"] += 1
+        if not success:
+            batch["failed"].append(name)
+        
+        self._report_batch_progress(batch)
+    
+    def _report_batch_progress(self, batch):
+        """Show the progress of a download batch, and its outcome once complete."""
+        if batch["finished"] < batch["total"]:
+            self.status_bar.showMessage(f"Downloaded {batch['finished']} of {batch['total']} assets...")
             return
         
-        # Show progress
-        self.progress_bar.setVisible(True)
-        self.status_bar.showMessage(f"Downloading from {provider}...")
+        succeeded = batch["total"] - len(batch["failed"])
+        self.status_bar.showMessage(f"Downloaded {succeeded} of {batch['total']} assets")
+        if batch["failed"]:
+            QMessageBox.warning(
+                self, "Download Error", "Failed to download:\n" + "\n".join(batch["failed"])
+            )
+    
+    def _on_download_done(self, success, provider, destination_path):
+        """Handle a finished download."""
+        self.finish_task()
         
-        try:
-            # Generate destination path
-            asset_name = asset_data.get("name", "asset")
-            # Sanitize filename
-            asset_name = "".join(c for c in asset_name if c.isalnum() or c in " ._-").strip()
-            destination_path = os.path.join(download_dir, f"{asset_name}.zip")
+        if success:
+            self.status_bar.showMessage(f"Downloaded to: {destination_path}")
             
-            # Download the asset
-            success = integration_manager.download_asset(provider, asset_id, destination_path)
+            # Ask if user wants to import the downloaded asset
+            reply = QMessageBox.question(
+                self, "Import Asset",
+                f"Asset downloaded successfully. Import it now?",
+                QMessageBox.Yes | QMessageBox.No, QMessageBox.Yes
+            )
             
-            if success:
-                self.status_bar.showMessage(f"Downloaded to: {destination_path}")
-                
-                # Ask if user wants to import the downloaded asset
-                reply = QMessageBox.question(
-                    self, "Import Asset",
-                    f"Asset downloaded successfully. Import it now?",
-                    QMessageBox.Yes | QMessageBox.No, QMessageBox.Yes
-                )
-                
-                if reply == QMessageBox.Yes:
-                    # TODO: Extract ZIP file and import the model
-                    pass
-            else:
-                QMessageBox.warning(self, "Download Error", f"Failed to download from {provider}")
-        
-        except Exception as e:
-            logger.error(f"Error downloading asset: {e}")
-            QMessageBox.warning(self, "Download Error", f"Error downloading asset: {str(e)}")
+            if reply == QMessageBox.Yes:
+                # Extract in the background, then import the models
+                worker = Worker(integration_manager.extract_archive, destination_path)
+                worker.signals.finished.connect(self._on_extract_done)
+                worker.signals.error.connect(self._on_extract_error)
+                self.start_task(worker, "Extracting...")
+        else:
+            QMessageBox.warning(self, "Download Error", f"Failed to download from {provider}")
+    
+    @Slot(str)
+    def _on_download_error(self, message):
+        """Report a failed download."""
+        self.finish_task()
+        QMessageBox.warning(self, "Download Error", f"Error downloading asset: {message}")
+    
+    @Slot(object)
+    def _on_extract_done(self, file_paths):
+        """Import the models of an extracted download."""
+        self.finish_task()
+        
+        model_paths = [
+            file_path for file_path in file_paths
+            if os.path.splitext(file_path)[1].lower() in _IMPORTERS
+        ]
+        
+        if not model_paths:
+            QMessageBox.warning(self, "Import Error", "No 3D model found in the downloaded asset")
+            return
         
-        finally:
-            self.progress_bar.setVisible(False)
-            self.status_bar.showMessage("Ready")
+        self._do_merge(model_paths)
+    
+    @Slot(str)
+    def _on_extract_error(self, message):
+        """Report a failed extraction."""
+        self.finish_task()
+        QMessageBox.warning(self, "Import Error", f"Error extracting asset: {message}")
     
     def show_online_asset_details(self, asset_data):
         """
@@ -486,46 +1073,48 @@ class AssetHubMaxPlugin(QWidget):
         if not provider or not asset_id:
             return
         
-        # Show progress
-        self.progress_bar.setVisible(True)
-        self.status_bar.showMessage(f"Fetching details from {provider}...")
+        # Get detailed information in the background
+        worker = Worker(integration_manager.get_asset_details, provider, asset_id)
+        worker.signals.finished.connect(
+            lambda details: self._on_details_done(details, provider)
+        )
+        worker.signals.error.connect(self._on_details_error)
+        self.start_task(worker, f"Fetching details from {provider}...", self.network_pool)
+    
+    def _on_details_done(self, details, provider):
+        """Show fetched details for an online asset."""
+        self.finish_task()
         
-        try:
-            # Get detailed information
-            details = integration_manager.get_asset_details(provider, asset_id)
-            
-            if not details:
-                QMessageBox.warning(self, "Error", f"Could not fetch details from {provider}")
-                return
-            
-            # Create a simple message box with asset details
-            details_text = f"Name: {details.get('name', '')}\n"
-            details_text += f"Source: {provider}\n"
-            
-            if details.get('price'):
-                details_text += f"Price: {details.get('price')} {details.get('currency', 'USD')}\n"
-            
-            if details.get('file_formats'):
-                details_text += f"Formats: {', '.join(details.get('file_formats'))}\n"
-            
-            if details.get('vertex_count'):
-                details_text += f"Vertices: {details.get('vertex_count')}\n"
-            
-            if details.get('face_count'):
-                details_text += f"Faces: {details.get('face_count')}\n"
-            
-            if details.get('tags'):
-                details_text += f"Tags: {', '.join(details.get('tags'))}\n"
-            
-            QMessageBox.information(self, "Asset Details", details_text)
-            
-        except Exception as e:
-            logger.error(f"Error fetching details from {provider}: {e}")
-            QMessageBox.warning(self, "Error", f"Error fetching details: {str(e)}")
+        if not details:
+            QMessageBox.warning(self, "Error", f"Could not fetch details from {provider}")
+            return
         
-        finally:
-            self.progress_bar.setVisible(False)
-            self.status_bar.showMessage("Ready")
+        # Create a simple message box with asset details
+        details_text = f"Name: {details.get('name', '')}\n"
+        details_text += f"Source: {provider}\n"
+        
+        if details.get('price'):
+            details_text += f"Price: {details.get('price')} {details.get('currency', 'USD')}\n"
+        
+        if details.get('file_formats'):
+            details_text += f"Formats: {', '.join(details.get('file_formats'))}\n"
+        
+        if details.get('vertex_count'):
+            details_text += f"Vertices: {details.get('vertex_count')}\n"
+        
+        if details.get('face_count'):
+            details_text += f"Faces: {details.get('face_count')}\n"
+        
+        if details.get('tags'):
+            details_text += f"Tags: {', '.join(details.get('tags'))}\n"
+        
+        QMessageBox.information(self, "Asset Details", details_text)
+    
+    @Slot(str)
+    def _on_details_error(self, message):
+        """Report a failed details request."""
+        self.finish_task()
+        QMessageBox.warning(self, "Error", f"Error fetching details: {message}")
 
 
 def initialize_plugin():
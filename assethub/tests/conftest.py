@@ -0,0 +1,38 @@
+"""
+Shared pytest configuration for AssetHub tests.
+
+This module provides command line options and fixtures used across test modules.
+"""
+import pytest
+
+# Where the optional HTTP cache for provider tests is kept
+REQUESTS_CACHE_NAME = ".cache/assethub_tests"
+REQUESTS_CACHE_EXPIRE_SECONDS = 12 * 60 * 60
+
+
+def pytest_addoption(parser):
+    """Add AssetHub test options."""
+    parser.addoption(
+        "--use-requests-cache",
+        action="store_true",
+        default=False,
+        help="Cache provider HTTP responses in a local SQLite database across runs"
+    )
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _requests_cache(request):
+    """Answer repeated provider GET requests from a local cache when enabled."""
+    if not request.config.getoption("--use-requests-cache"):
+        yield
+        return
+    
+    import requests_cache
+    
+    requests_cache.install_cache(
+        REQUESTS_CACHE_NAME,
+        backend="sqlite",
+        expire_after=REQUESTS_CACHE_EXPIRE_SECONDS
+    )
+    yield
+    requests_cache.uninstall_cache()
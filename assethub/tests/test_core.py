@@ -8,76 +8,88 @@ import unittest
 import tempfile
 import shutil
 from pathlib import Path
+from unittest.mock import patch
+
+from sqlalchemy import create_engine
+from sqlalchemy.pool import StaticPool
 
 from assethub.core.config import Config
-from assethub.core.models import init_db, Asset, Tag, Category, get_session
+from assethub.core.models import Asset, Tag, Category, get_session
 from assethub.catalog.scanner import AssetScanner
-from assethub.catalog.indexer import AssetIndexer
+from assethub.catalog.indexer import AssetIndexer, MEMORY_INDEX_PATH, get_index_storage
 from assethub.catalog.search import AssetSearch
 
 
 class TestAssetHubCore(unittest.TestCase):
     """Test case for AssetHub core functionality."""
 
-    def setUp(self):
-        """Set up test environment."""
+    # Fixture files shared by every test, relative to the assets directory
+    TEST_FILES = [
+        ("models/cube.obj", b"# Test OBJ file"),
+        ("models/sphere.fbx", b"# Test FBX file"),
+        ("textures/wood.jpg", b"# Test JPG file"),
+        ("textures/metal.png", b"# Test PNG file"),
+        # Not cataloged, since ignored directories are skipped
+        (".git/objects/blob.obj", b"# Ignored OBJ file"),
+    ]
+
+    @classmethod
+    def setUpClass(cls):
+        """Create the config and fixture files once for all tests."""
         # Create temporary directory for tests
-        self.test_dir = tempfile.mkdtemp()
+        cls.test_dir = tempfile.mkdtemp()
         
         # Create test config
-        self.config_path = os.path.join(self.test_dir, "config.json")
-        self.config = Config(self.config_path)
+        cls.config_path = os.path.join(cls.test_dir, "config.json")
+        cls.config = Config(cls.config_path)
         
         # Override config paths
-        self.config.set("database", "path", os.path.join(self.test_dir, "test.db"))
-        self.config.set("storage", "local_path", os.path.join(self.test_dir, "assets"))
-        self.config.set("search", "index_path", os.path.join(self.test_dir, "index"))
-        
-        # Initialize database
-        self.engine = init_db()
-        self.session = get_session()
+        cls.config.set("database", "path", ":memory:")
+        cls.config.set("storage", "local_path", os.path.join(cls.test_dir, "assets"))
+        cls.config.set("search", "index_path", os.path.join(cls.test_dir, "index"))
         
         # Create test assets directory
-        self.assets_dir = os.path.join(self.test_dir, "test_assets")
-        os.makedirs(self.assets_dir, exist_ok=True)
-        
-        # Create test files
-        self.create_test_files()
+        cls.assets_dir = os.path.join(cls.test_dir, "test_assets")
+        cls.create_test_files()
+    
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the fixture files."""
+        shutil.rmtree(cls.test_dir)
+    
+    @classmethod
+    def create_test_files(cls):
+        """Create test files for scanning."""
+        for relative_path, data in cls.TEST_FILES:
+            file_path = Path(cls.assets_dir, relative_path)
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            file_path.write_bytes(data)
+    
+    def setUp(self):
+        """Reset the database and search index."""
+        # Fresh in-memory database for each test, since the fixture files
+        # are shared; StaticPool keeps every session on one connection
+        self.engine = create_engine(
+            "sqlite:///:memory:",
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool
+        )
+        self.session = get_session(self.engine)
         
-        # Initialize scanner, indexer, and search
+        # Initialize scanner, indexer, and search over an empty in-memory index
+        get_index_storage(MEMORY_INDEX_PATH).clean()
         self.scanner = AssetScanner()
-        self.indexer = AssetIndexer()
-        self.search = AssetSearch()
+        self.indexer = AssetIndexer(MEMORY_INDEX_PATH)
+        self.search = AssetSearch(MEMORY_INDEX_PATH)
+        for component in (self.scanner, self.indexer, self.search):
+            component.session.close()
+            component.session = self.session
     
     def tearDown(self):
         """Clean up test environment."""
         # Close session
         self.session.close()
-        
-        # Remove temporary directory
-        shutil.rmtree(self.test_dir)
-    
-    def create_test_files(self):
-        """Create test files for scanning."""
-        # Create model files
-        model_dir = os.path.join(self.assets_dir, "models")
-        os.makedirs(model_dir, exist_ok=True)
-        
-        with open(os.path.join(model_dir, "cube.obj"), "w") as f:
-            f.write("# Test OBJ file")
-        
-        with open(os.path.join(model_dir, "sphere.fbx"), "w") as f:
-            f.write("# Test FBX file")
-        
-        # Create texture files
-        texture_dir = os.path.join(self.assets_dir, "textures")
-        os.makedirs(texture_dir, exist_ok=True)
-        
-        with open(os.path.join(texture_dir, "wood.jpg"), "w") as f:
-            f.write("# Test JPG file")
-        
-        with open(os.path.join(texture_dir, "metal.png"), "w") as f:
-            f.write("# Test PNG file")
+        self.engine.dispose()
     
     def test_config(self):
         """Test configuration functionality."""
@@ -148,6 +160,28 @@ class TestAssetHubCore(unittest.TestCase):
         self.assertEqual(new_assets, 0)
         self.assertEqual(updated_assets, 0)
     
+    def test_scanner_reloads_assets(self):
+        """Test that a rescan sees catalog changes made through another session."""
+        # Like the scanner's own session, keep assets loaded across commits
+        self.session.expire_on_commit = False
+        self.scanner.scan_directory(self.assets_dir)
+        
+        # Hold on to the scanned assets, as the UI does, so they stay loaded
+        scanned = list(self.scanner.new_assets)
+        
+        other_session = get_session(self.engine)
+        try:
+            cube = other_session.query(Asset).filter_by(name="cube.obj").one()
+            cube.file_size = 0
+            other_session.commit()
+        finally:
+            other_session.close()
+        
+        # The changed size no longer matches the file, so the cube is updated
+        new_assets, updated_assets = self.scanner.scan_directory(self.assets_dir)
+        self.assertEqual((new_assets, updated_assets), (0, 1))
+        self.assertEqual(len(scanned), 4)
+    
     def test_indexer(self):
         """Test asset indexer functionality."""
         # Scan test directory first
@@ -162,6 +196,46 @@ class TestAssetHubCore(unittest.TestCase):
         # Verify results
         self.assertEqual(count, 4)  # 2 models + 2 textures
     
+    def test_index_stopped(self):
+        """Test that stopped indexing keeps committed batches and forgotten assets are found again."""
+        self.scanner.scan_directory(self.assets_dir)
+        self.indexer.create_index()
+        
+        # Stop once the first single-asset batch is committed
+        batches = []
+        with patch("assethub.catalog.indexer.INDEX_BATCH_SIZE", 1):
+            count = self.indexer.index_assets(
+                self.scanner.new_assets, replace=False,
+                progress=batches.append, should_stop=lambda: bool(batches)
+            )
+        self.assertEqual(count, 1)
+        self.assertEqual(len(self.search.search("*")), 1)
+        
+        # The unindexed assets are new again on the next scan
+        self.scanner.forget_assets(self.scanner.new_assets[count:])
+        new_assets, updated_assets = self.scanner.scan_directory(self.assets_dir)
+        self.assertEqual((new_assets, updated_assets), (3, 0))
+    
+    def test_index_preview(self):
+        """Test that only existing previews are stored in the index."""
+        self.scanner.scan_directory(self.assets_dir)
+        
+        # Point one asset at an existing preview and one at a missing one
+        wood = self.session.query(Asset).filter_by(name="wood.jpg").one()
+        wood.preview_path = wood.file_path
+        cube = self.session.query(Asset).filter_by(name="cube.obj").one()
+        cube.preview_path = os.path.join(self.test_dir, "missing.png")
+        self.session.commit()
+        
+        self.indexer.create_index()
+        self.indexer.rebuild_index()
+        
+        results = {result["name"]: result for result in self.search.search("*")}
+        self.assertEqual(results["wood.jpg"]["preview_path"], wood.file_path)
+        self.assertEqual(results["wood.jpg"]["preview_mtime"], os.path.getmtime(wood.file_path))
+        self.assertNotIn("preview_path", results["cube.obj"])
+        self.assertNotIn("preview_mtime", results["cube.obj"])
+    
     def test_search(self):
         """Test asset search functionality."""
         # Scan and index test directory first
@@ -185,6 +259,123 @@ class TestAssetHubCore(unittest.TestCase):
         results = self.search.search("nonexistent")
         self.assertEqual(len(results), 0)
 
+    def test_field_values(self):
+        """Test listing field values and refreshing them after reindexing."""
+        self.indexer.create_index()
+        self.assertEqual(self.search.get_file_types(), [])
+        
+        self.scanner.scan_directory(os.path.join(self.assets_dir, "textures"))
+        self.indexer.index_assets(self.scanner.new_assets)
+        self.assertEqual(self.search.get_file_types(), ["texture"])
+        self.assertEqual(self.search.get_file_formats(), ["jpg", "png"])
+        
+        # Callers get their own copy of the values
+        self.search.get_file_types().append("changed")
+        self.assertEqual(self.search.get_file_types(), ["texture"])
+        
+        # Values are read again after the index changes or invalidate()
+        self.scanner.scan_directory(self.assets_dir)
+        self.indexer.index_assets(self.scanner.new_assets)
+        self.assertEqual(self.search.get_file_types(), ["model", "texture"])
+        self.assertEqual(self.search.get_file_formats(), ["fbx", "jpg", "obj", "png"])
+        self.search.invalidate()
+        self.assertEqual(self.search.get_file_types(), ["model", "texture"])
+    
+    def test_iter_search(self):
+        """Test paged asset search."""
+        self.scanner.scan_directory(self.assets_dir)
+        self.indexer.create_index()
+        self.indexer.rebuild_index()
+        
+        # Results arrive in pages of the requested size
+        pages = list(self.search.iter_search("*", filters={"file_type": "texture"}, page_size=1))
+        self.assertEqual([len(page) for page in pages], [1, 1])
+        self.assertEqual(
+            sorted(page[0]["name"] for page in pages),
+            sorted(result["name"] for result in self.search.search("*", filters={"file_type": "texture"}))
+        )
+        
+        # Results beyond the limit are not read or counted
+        counts = []
+        pages = list(self.search.iter_search("*", limit=3, page_size=2, on_count=counts.append))
+        self.assertEqual([len(page) for page in pages], [2, 1])
+        self.assertEqual(counts, [3])
+        
+        # The full listing is the same on repeated reads, and follows
+        # changes to the index and invalidate()
+        def full_listing():
+            return [asset for page in self.search.iter_search("*") for asset in page]
+        
+        listing = full_listing()
+        self.assertEqual(len(listing), 4)
+        self.assertEqual(full_listing(), listing)
+        self.indexer.remove_asset(listing[0]["id"])
+        self.assertEqual(full_listing(), listing[1:])
+        self.search.invalidate()
+        self.assertEqual(full_listing(), listing[1:])
+        
+        # Cancelled searches stop before the first page
+        pages = list(self.search.iter_search("*", filters={"file_type": "texture"}, should_stop=lambda: True))
+        self.assertEqual(pages, [])
+
+    def test_search_filters(self):
+        """Test filtered search."""
+        self.scanner.scan_directory(self.assets_dir)
+        self.indexer.create_index()
+        self.indexer.rebuild_index()
+        
+        def names(query, filters):
+            return sorted(result["name"] for result in self.search.search(query, filters=filters))
+        
+        # An empty query matches everything that passes the filters
+        self.assertEqual(names("", {"file_type": "model"}), ["cube.obj", "sphere.fbx"])
+        
+        # List values match any value; fields must all match
+        self.assertEqual(names("", {"file_format": ["obj", "png"]}), ["cube.obj", "metal.png"])
+        self.assertEqual(names("", {"file_type": "model", "file_format": ["obj", "png"]}), ["cube.obj"])
+        self.assertEqual(names("", {"file_type": "model", "file_format": "png"}), [])
+        self.assertEqual(names("*", {"file_type": "texture"}), ["metal.png", "wood.jpg"])
+        
+        # Values are normalized like the indexed field
+        self.assertEqual(names("", {"file_type": "Model", "file_format": "OBJ"}), ["cube.obj"])
+        
+        # Cached filter documents are dropped when the index changes
+        for asset in self.session.query(Asset).filter(Asset.file_type == "model"):
+            self.indexer.remove_asset(asset.id)
+        self.assertEqual(names("", {"file_type": "model"}), [])
+
+    def test_get_assets_by_id(self):
+        """Test retrieving several assets by ID."""
+        self.scanner.scan_directory(self.assets_dir)
+        self.indexer.create_index()
+        self.indexer.rebuild_index()
+        
+        assets = self.session.query(Asset).order_by(Asset.id).all()
+        results = self.search.get_assets_by_id([assets[0].id, -1, assets[1].id])
+        self.assertEqual([result["name"] for result in results], [assets[0].name, assets[1].name])
+        self.assertIsInstance(results[0]["created_at"], str)
+
+    def test_snapshot(self):
+        """Test that a saved asset listing is only loaded for the same index."""
+        index_path = os.path.join(self.test_dir, "snapshot_index")
+        indexer = AssetIndexer(index_path)
+        search = AssetSearch(index_path)
+        for component in (indexer, search):
+            component.session.close()
+            component.session = self.session
+        
+        self.scanner.scan_directory(self.assets_dir)
+        indexer.rebuild_index()
+        self.assertIsNone(search.load_snapshot())
+        
+        assets = search.search("*")
+        search.save_snapshot(assets, search.index_generation())
+        self.assertEqual(search.load_snapshot(), assets)
+        
+        # Any commit to the index makes the listing stale
+        indexer.remove_asset(assets[0]["id"])
+        self.assertIsNone(search.load_snapshot())
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -5,10 +5,15 @@ This module provides tests for the new providers and UI components.
 """
 import os
 import sys
+import json
 import unittest
 import logging
 from unittest.mock import MagicMock, patch
 
+import pytest
+import requests
+import vcr
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -18,60 +23,127 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')
 
 from assethub.integration.providers.polyhaven import PolyHavenProvider
 from assethub.integration.providers.free3d import Free3DProvider
-from assethub.integration import get_providers, search_all_providers
+from assethub.integration import (
+    get_providers, search_all_providers, search_provider, clear_search_cache,
+    EMPTY_SEARCH_CACHE_TTL
+)
+
+# Replays the committed provider cassettes without touching the network;
+# with ASSETHUB_VCR_RECORD_MODE=all, as in the scheduled remote tests, the
+# live services are contacted and the cassettes recorded again
+my_vcr = vcr.VCR(
+    cassette_library_dir=os.path.join(os.path.dirname(__file__), "cassettes"),
+    record_mode=os.environ.get("ASSETHUB_VCR_RECORD_MODE", "none"),
+    match_on=["method", "scheme", "host", "path", "query"]
+)
+
+# Canned provider responses used instead of live HTTP
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
+
+
+def load_fixture(name):
+    """Read a canned response body from the fixtures directory."""
+    with open(os.path.join(FIXTURES_DIR, name), "rb") as f:
+        return f.read()
 
 
-class TestPolyHavenProvider(unittest.TestCase):
-    """Test cases for Poly Haven provider."""
+def mock_session(routes):
+    """
+    Create a session stand-in that answers GET requests from fixtures.
     
-    def setUp(self):
-        """Set up test environment."""
-        self.provider = PolyHavenProvider()
+    Args:
+        routes: Dictionary mapping request URLs to fixture file names
         
-    def test_connect(self):
+    Returns:
+        Mock whose get() returns canned responses, or 404 for unknown URLs
+    """
+    def get(url, **kwargs):
+        response = requests.Response()
+        response.url = url
+        response.encoding = "utf-8"
+        if url in routes:
+            response.status_code = 200
+            response._content = load_fixture(routes[url])
+        else:
+            response.status_code = 404
+            response._content = b""
+        return response
+    
+    return MagicMock(get=MagicMock(side_effect=get))
+
+
+class TestPolyHavenProvider:
+    """Test cases for Poly Haven provider.
+    
+    Fixtures are shared by the whole class. The connection test replays a
+    recorded cassette; search and details use canned responses.
+    """
+    
+    @pytest.fixture(scope="class")
+    @classmethod
+    def provider(cls):
+        """Poly Haven provider shared by the tests."""
+        return PolyHavenProvider()
+    
+    @pytest.fixture(scope="class")
+    @classmethod
+    def connected(cls, provider):
+        """Result of connecting the shared provider."""
+        with my_vcr.use_cassette("polyhaven_connect.yaml"):
+            return provider.connect()
+    
+    @pytest.fixture(scope="class")
+    @classmethod
+    def mocked_provider(cls):
+        """Poly Haven provider answering from canned responses."""
+        provider = PolyHavenProvider()
+        provider.session = mock_session({
+            f"{provider.api_url}/assets": "polyhaven_assets.json",
+            f"{provider.api_url}/info/round_wooden_table_01": "polyhaven_info_round_wooden_table_01.json",
+        })
+        return provider
+    
+    @pytest.fixture(scope="class")
+    @classmethod
+    def table_results(cls, mocked_provider):
+        """Results of searching the mocked provider for "table"."""
+        return mocked_provider.search("table")
+    
+    @pytest.mark.remote
+    def test_connect(self, connected):
         """Test connection to Poly Haven API."""
-        result = self.provider.connect()
-        self.assertTrue(result, "Connection to Poly Haven API failed")
+        assert connected, "Connection to Poly Haven API failed"
         
-    def test_search(self):
+    def test_search(self, table_results):
         """Test search functionality."""
-        # Connect to API
-        self.provider.connect()
-        
-        # Search for assets
-        results = self.provider.search("table")
+        results = table_results
         
         # Check if results are returned
-        self.assertIsInstance(results, dict, "Search results should be a dictionary")
-        self.assertIn("results", results, "Search results should contain 'results' key")
-        self.assertIn("total", results, "Search results should contain 'total' key")
+        assert isinstance(results, dict), "Search results should be a dictionary"
+        assert "results" in results, "Search results should contain 'results' key"
+        assert "total" in results, "Search results should contain 'total' key"
+        assert results["total"] == 2, "Both tables should match"
         
         # Check if results contain expected fields
         if results["results"]:
             first_result = results["results"][0]
-            self.assertIn("id", first_result, "Result should contain 'id' field")
+            assert "id" in first_result, "Result should contain 'id' field"
             
-    def test_get_asset_details(self):
+    def test_get_asset_details(self, mocked_provider, table_results):
         """Test getting asset details."""
-        # Connect to API
-        self.provider.connect()
-        
-        # Search for assets to get an ID
-        results = self.provider.search("table")
-        
         # Check if results are returned
-        if results["results"]:
-            asset_id = results["results"][0]["id"]
+        if table_results["results"]:
+            asset_id = table_results["results"][0]["id"]
             
             # Get asset details
-            details = self.provider.get_asset_details(asset_id)
+            details = mocked_provider.get_asset_details(asset_id)
             
             # Check if details are returned
-            self.assertIsInstance(details, dict, "Asset details should be a dictionary")
-            self.assertIn("id", details, "Asset details should contain 'id' field")
-            self.assertEqual(details["id"], asset_id, "Asset ID should match")
+            assert isinstance(details, dict), "Asset details should be a dictionary"
+            assert "id" in details, "Asset details should contain 'id' field"
+            assert details["id"] == asset_id, "Asset ID should match"
             
-    def test_convert_to_asset(self):
+    def test_convert_to_asset(self, provider):
         """Test converting API response to Asset object."""
         # Create a sample item
         item = {
@@ -83,49 +155,69 @@ class TestPolyHavenProvider(unittest.TestCase):
         }
         
         # Convert to Asset object
-        asset = self.provider.convert_to_asset(item)
+        asset = provider.convert_to_asset(item)
         
         # Check Asset object properties
-        self.assertEqual(asset.name, "Test Asset", "Asset name should match")
-        self.assertEqual(asset.file_type, "model", "Asset type should be 'model'")
-        self.assertEqual(asset.source, "Poly Haven", "Asset source should be 'Poly Haven'")
-        self.assertEqual(asset.source_id, "test_asset", "Asset source ID should match")
-        self.assertEqual(asset.license, "CC0", "Asset license should be 'CC0'")
+        assert asset.name == "Test Asset", "Asset name should match"
+        assert asset.file_type == "model", "Asset type should be 'model'"
+        assert asset.source == "Poly Haven", "Asset source should be 'Poly Haven'"
+        assert asset.source_id == "test_asset", "Asset source ID should match"
+        assert asset.license == "CC0", "Asset license should be 'CC0'"
 
 
-class TestFree3DProvider(unittest.TestCase):
-    """Test cases for Free3D provider."""
+class TestFree3DProvider:
+    """Test cases for Free3D provider.
     
-    def setUp(self):
-        """Set up test environment."""
-        self.provider = Free3DProvider()
-        
-    def test_connect(self):
+    Fixtures are shared by the whole class. The connection test replays a
+    recorded cassette; search and details use canned responses.
+    """
+    
+    @pytest.fixture(scope="class")
+    @classmethod
+    def provider(cls):
+        """Free3D provider shared by the tests."""
+        return Free3DProvider()
+    
+    @pytest.fixture(scope="class")
+    @classmethod
+    def connected(cls, provider):
+        """Result of connecting the shared provider."""
+        with my_vcr.use_cassette("free3d_connect.yaml"):
+            return provider.connect()
+    
+    @pytest.fixture(scope="class")
+    @classmethod
+    def chair_results(cls):
+        """Results of searching a Free3D provider answering from canned responses."""
+        provider = Free3DProvider()
+        provider.session = mock_session({
+            f"{provider.search_url}chair/?only=free": "free3d_search_chair.html",
+        })
+        return provider.search("chair")
+    
+    @pytest.mark.remote
+    def test_connect(self, connected):
         """Test connection to Free3D website."""
-        result = self.provider.connect()
-        self.assertTrue(result, "Connection to Free3D website failed")
+        assert connected, "Connection to Free3D website failed"
         
-    def test_search(self):
+    def test_search(self, chair_results):
         """Test search functionality."""
-        # Connect to website
-        self.provider.connect()
-        
-        # Search for assets
-        results = self.provider.search("chair")
+        results = chair_results
         
         # Check if results are returned
-        self.assertIsInstance(results, dict, "Search results should be a dictionary")
-        self.assertIn("results", results, "Search results should contain 'results' key")
-        self.assertIn("total", results, "Search results should contain 'total' key")
+        assert isinstance(results, dict), "Search results should be a dictionary"
+        assert "results" in results, "Search results should contain 'results' key"
+        assert "total" in results, "Search results should contain 'total' key"
+        assert len(results["results"]) == 2, "Only the free chairs should be returned"
         
         # Check if results contain expected fields
         if results["results"]:
             first_result = results["results"][0]
-            self.assertIn("id", first_result, "Result should contain 'id' field")
-            self.assertIn("name", first_result, "Result should contain 'name' field")
-            self.assertIn("url", first_result, "Result should contain 'url' field")
+            assert "id" in first_result, "Result should contain 'id' field"
+            assert "name" in first_result, "Result should contain 'name' field"
+            assert "url" in first_result, "Result should contain 'url' field"
             
-    def test_convert_to_asset(self):
+    def test_convert_to_asset(self, provider):
         """Test converting API response to Asset object."""
         # Create a sample item
         item = {
@@ -139,14 +231,14 @@ class TestFree3DProvider(unittest.TestCase):
         }
         
         # Convert to Asset object
-        asset = self.provider.convert_to_asset(item)
+        asset = provider.convert_to_asset(item)
         
         # Check Asset object properties
-        self.assertEqual(asset.name, "Test Chair", "Asset name should match")
-        self.assertEqual(asset.file_type, "model", "Asset type should be 'model'")
-        self.assertEqual(asset.source, "Free3D", "Asset source should be 'Free3D'")
-        self.assertEqual(asset.source_id, "test_asset", "Asset source ID should match")
-        self.assertEqual(asset.file_format, "obj", "Asset format should be the first format in the list")
+        assert asset.name == "Test Chair", "Asset name should match"
+        assert asset.file_type == "model", "Asset type should be 'model'"
+        assert asset.source == "Free3D", "Asset source should be 'Free3D'"
+        assert asset.source_id == "test_asset", "Asset source ID should match"
+        assert asset.file_format == "obj", "Asset format should be the first format in the list"
 
 
 class TestIntegration(unittest.TestCase):
@@ -211,6 +303,61 @@ class TestIntegration(unittest.TestCase):
         self.assertIn("Poly Haven", sources, "Results should contain assets from Poly Haven")
         self.assertIn("Free3D", sources, "Results should contain assets from Free3D")
 
+    @patch('assethub.integration.providers.free3d.Free3DProvider.connect', return_value=True)
+    @patch('assethub.integration.providers.free3d.Free3DProvider.search')
+    def test_search_provider_cache(self, mock_search, mock_connect):
+        """Test that repeated provider searches reuse the cached results."""
+        mock_search.return_value = {"results": [{"id": "chair"}], "total": 1}
+        clear_search_cache()
+        
+        first = search_provider("free3d", "cached chair")
+        second = search_provider("free3d", "cached chair")
+        
+        self.assertEqual(first, second, "Cached results should be returned")
+        self.assertEqual(mock_search.call_count, 1, "Provider should be searched once")
+        self.assertLessEqual(mock_connect.call_count, 1, "Provider should be connected at most once")
+        
+        # Callers get their own copy of the cached results
+        first["results"].clear()
+        self.assertEqual(search_provider("free3d", "cached chair")["results"], [{"id": "chair"}],
+                         "Modifying returned results should not change the cache")
+        
+        # A different query goes to the provider again
+        search_provider("free3d", "cached table")
+        self.assertEqual(mock_search.call_count, 2, "New query should search the provider")
+        
+        # Failed searches are not cached
+        mock_search.return_value = {"results": [], "total": 0, "error": "HTTP 503"}
+        search_provider("free3d", "cached lamp")
+        search_provider("free3d", "cached lamp")
+        self.assertEqual(mock_search.call_count, 4, "Failed searches should not be cached")
+        
+        clear_search_cache()
+
+    @patch('assethub.integration.providers.free3d.Free3DProvider.connect', return_value=True)
+    @patch('assethub.integration.providers.free3d.Free3DProvider.search')
+    def test_search_provider_cache_empty(self, mock_search, mock_connect):
+        """Test that empty provider results expire sooner than other results."""
+        mock_search.side_effect = lambda query, *args: {
+            "results": [{"id": query}] if query == "chair" else [], "total": int(query == "chair")
+        }
+        clear_search_cache()
+        
+        with patch('assethub.integration.time.monotonic', return_value=0):
+            search_provider("free3d", "chair")
+            search_provider("free3d", "nothing")
+        
+        # Past the empty result TTL only the empty search is repeated
+        with patch('assethub.integration.time.monotonic', return_value=EMPTY_SEARCH_CACHE_TTL + 1):
+            search_provider("free3d", "chair")
+            search_provider("free3d", "nothing")
+        self.assertEqual(
+            [call.args[0] for call in mock_search.call_args_list], ["chair", "nothing", "nothing"],
+            "Only the empty search should be repeated"
+        )
+        
+        clear_search_cache()
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,167 @@
+"""
+Test module for the AssetHub desktop UI.
+
+This module provides smoke tests that build the main window offscreen.
+"""
+import os
+import time
+from unittest.mock import patch
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+QtWidgets = pytest.importorskip("PyQt5.QtWidgets")
+
+from assethub.core.config import config
+from assethub.ui import app as ui_app
+from assethub.utils.image_cache import prune_cache_dir, save_cached_image
+
+# Longest wait for the startup workers, in seconds
+STARTUP_TIMEOUT = 10
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    """Get the offscreen application shared by the UI tests."""
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+
+@pytest.fixture
+def storage(tmp_path):
+    """Point the database, index and storage paths at a temporary directory."""
+    with patch.object(config, "get_db_path", return_value=tmp_path / "database.db"), \
+            patch.object(config, "get_index_path", return_value=tmp_path / "index"), \
+            patch.object(config, "get_storage_path", return_value=tmp_path / "assets"):
+        yield tmp_path
+
+
+def wait_until(qapp, condition, timeout=STARTUP_TIMEOUT):
+    """Process events until a condition holds or the timeout passes."""
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        qapp.processEvents()
+        time.sleep(0.01)
+    return condition()
+
+
+@pytest.fixture
+def window(qapp, storage):
+    """Build the main window and wait for it to load the empty library."""
+    errors = []
+    with patch.object(QtWidgets.QMessageBox, "critical", side_effect=lambda *args: errors.append(args[2])), \
+            patch.object(ui_app, "get_providers", return_value={}):
+        window = ui_app.AssetHubMainWindow()
+        wait_until(qapp, lambda: window.status_bar.currentMessage() == "Found 0 assets")
+        yield window
+        
+        for worker in [window.init_worker, window.scan_worker, *window._search_workers]:
+            if worker is not None:
+                worker.wait()
+        window.close()
+    assert errors == []
+
+
+def test_main_window_starts(window, storage):
+    """Test that the main window builds and finishes loading an empty library."""
+    assert window.status_bar.currentMessage() == "Found 0 assets"
+    assert window.asset_list_model.rowCount() == 0
+    assert os.path.isdir(storage / "index")
+
+
+def import_assets(qapp, window, storage):
+    """Import a directory holding a model and a texture through the window.
+    
+    Returns:
+        Tuple of (imported directory, messages shown to the user)
+    """
+    assets_dir = storage / "import"
+    (assets_dir / "models").mkdir(parents=True)
+    (assets_dir / "models" / "cube.obj").write_bytes(b"# Test OBJ file")
+    (assets_dir / "metal.png").write_bytes(b"# Test PNG file")
+    
+    messages = []
+    with patch.object(QtWidgets.QFileDialog, "getExistingDirectory", return_value=str(assets_dir)), \
+            patch.object(QtWidgets.QMessageBox, "information", side_effect=lambda *args: messages.append(args[2])):
+        window.import_local_assets()
+        assert wait_until(qapp, lambda: window.scan_worker is None)
+    return assets_dir, messages
+
+
+def shown_names(window):
+    """Get the sorted names of the assets shown in the window."""
+    model = window.asset_list_model
+    return sorted(model.rows[row]["name"] for row in range(model.rowCount()))
+
+
+def test_import_local_assets(qapp, window, storage):
+    """Test that importing a directory scans, indexes and shows its assets."""
+    assets_dir, messages = import_assets(qapp, window, storage)
+    
+    assert messages == [f"Successfully imported 2 assets from {assets_dir}"]
+    assert shown_names(window) == ["cube.obj", "metal.png"]
+
+
+def test_blank_search_saves_full_listing(qapp, window, storage):
+    """Test that a search of only spaces saves the listing of all assets."""
+    import_assets(qapp, window, storage)
+    
+    filters = dict(window.sidebar.current_filters(), search="  ")
+    ui_app.SearchWorker(window.search, filters, 0, save_snapshot=True).run()
+    
+    snapshot = window.search.load_snapshot()
+    assert sorted(asset["name"] for asset in snapshot) == ["cube.obj", "metal.png"]
+
+
+def test_blank_search_shows_all_assets(qapp, window, storage):
+    """Test that blank search text and an empty search box share the full listing."""
+    import_assets(qapp, window, storage)
+    filters = window.sidebar.current_filters()
+    
+    window.apply_filters(dict(filters, search="  "))
+    assert wait_until(qapp, lambda: window.search_worker.isFinished())
+    qapp.processEvents()
+    assert shown_names(window) == ["cube.obj", "metal.png"]
+    
+    # The empty search box is answered from the result cache
+    window.apply_filters(dict(filters, search=""))
+    assert window.search_worker is None
+    assert shown_names(window) == ["cube.obj", "metal.png"]
+
+
+def test_import_after_blank_search(qapp, window, storage):
+    """Test that assets imported while a blank search is shown are listed."""
+    window.apply_filters(dict(window.sidebar.current_filters(), search="  "))
+    assert wait_until(qapp, lambda: window.search_worker is None or window.search_worker.isFinished())
+    
+    import_assets(qapp, window, storage)
+    assert shown_names(window) == ["cube.obj", "metal.png"]
+
+
+def test_import_beyond_result_limit(qapp, window, storage):
+    """Test that an import that would overfill the views searches again instead."""
+    with patch.object(ui_app, "MAX_SEARCH_RESULTS", 1), patch.object(window, "load_assets") as load_assets:
+        import_assets(qapp, window, storage)
+    
+    load_assets.assert_called_once()
+    assert shown_names(window) == []
+
+
+def test_save_cached_image(qapp, tmp_path):
+    """Test that failed saves leave no files and the cache stays within its limit."""
+    QtGui = pytest.importorskip("PyQt5.QtGui")
+    cache_dir = tmp_path / "cache"
+    
+    # A null image cannot be saved
+    assert not save_cached_image(QtGui.QImage(), cache_dir / "null.png", 1 << 20)
+    assert list(cache_dir.iterdir()) == []
+    
+    image = QtGui.QImage(8, 8, QtGui.QImage.Format_RGB32)
+    image.fill(0)
+    for index, name in enumerate(["old", "middle", "new"]):
+        assert save_cached_image(image, cache_dir / f"{name}.png", 1 << 20)
+        os.utime(cache_dir / f"{name}.png", (index, index))
+    
+    # The oldest files go first until the directory fits the limit
+    size = (cache_dir / "new.png").stat().st_size
+    assert prune_cache_dir(cache_dir, 2 * size) == 1
+    assert sorted(path.name for path in cache_dir.iterdir()) == ["middle.png", "new.png"]
@@ -9,6 +9,8 @@ import sys
 import logging
 import threading
 import time
+import functools
+from collections import OrderedDict
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 
@@ -17,42 +19,51 @@ from PyQt5.QtWidgets import (
     QPushButton, QLabel, QLineEdit, QComboBox, QScrollArea, 
     QFrame, QSplitter, QFileDialog, QMessageBox, QProgressBar,
     QTabWidget, QGridLayout, QCheckBox, QMenu, QAction, QToolBar,
-    QSizePolicy, QSpacerItem, QToolButton, QStatusBar
+    QSizePolicy, QSpacerItem, QToolButton, QStatusBar, QListView, QStackedWidget,
+    QStyledItemDelegate, QStyle, QProgressDialog
 )
 from PyQt5.QtCore import (
-    Qt, QSize, QThread, pyqtSignal, QTimer, QUrl, QRect, 
-    QPoint, QPropertyAnimation, QEasingCurve
+    Qt, QSize, QThread, pyqtSignal, pyqtSlot, QTimer, QUrl, QRect, 
+    QPoint, QPropertyAnimation, QEasingCurve, QObject, QRunnable, QThreadPool,
+    QAbstractListModel, QModelIndex, QEvent, QRectF
 )
 from PyQt5.QtGui import (
-    QIcon, QPixmap, QFont, QPalette, QColor, QCursor, 
-    QImage, QPainter, QBrush, QLinearGradient, QFontDatabase
+    QIcon, QPixmap, QPixmapCache, QFont, QPalette, QColor, QCursor, 
+    QImage, QPainter, QBrush, QLinearGradient, QFontDatabase,
+    QPainterPath, QPen, QStandardItemModel, QStandardItem
 )
 
 from assethub.core.config import config
 from assethub.core.models import Asset, Category, SearchIndex
-from assethub.catalog.scanner import FileScanner
-from assethub.catalog.indexer import Indexer
-from assethub.catalog.search import AssetSearch
+from assethub.catalog.scanner import AssetScanner
+from assethub.catalog.indexer import AssetIndexer
+from assethub.catalog.search import AssetSearch, MAX_SEARCH_RESULTS
 from assethub.integration import get_providers
+from assethub.ui.thumbcache import get_thumb
+from assethub.ui.style import (
+    APP_STYLESHEET, ACCENT_COLOR, BORDER_COLOR, CARD_BG_COLOR, CARD_HOVER_COLOR,
+    DARKER_BG_COLOR, SECONDARY_TEXT_COLOR, TEXT_COLOR
+)
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
 # Constants
-DARK_BG_COLOR = "#1E1E1E"
-DARKER_BG_COLOR = "#141414"
-ACCENT_COLOR = "#8C52FF"  # Purple accent color
-ACCENT_COLOR_HOVER = "#9D6FFF"
-TEXT_COLOR = "#FFFFFF"
-SECONDARY_TEXT_COLOR = "#AAAAAA"
-BORDER_COLOR = "#333333"
-CARD_BG_COLOR = "#2A2A2A"
-CARD_HOVER_COLOR = "#3A3A3A"
 SIDEBAR_WIDTH = 250
 CARD_WIDTH = 220
 CARD_HEIGHT = 280
 CARD_SPACING = 15
 ANIMATION_DURATION = 200  # ms
+SEARCH_DEBOUNCE_MS = 200
+SEARCH_STATUS_DELAY_MS = 100  # searches faster than this show no progress message
+RESULT_CACHE_SIZE = 32
+RESULT_CACHE_TTL = 60  # seconds
+ALL_ASSETS_KEY = ("", "", "", "", ())  # result cache key of the unfiltered listing
+PREVIEW_WIDTH = CARD_WIDTH - 20
+PREVIEW_HEIGHT = 140
+CARD_BUTTON_HEIGHT = 30
+PIXMAP_CACHE_LIMIT_MB = 200  # default for the "pixmap_cache_mb" UI setting
+LIST_ICON_SIZE = QSize(64, 48)
 
 # Asset type icons
 ASSET_TYPE_ICONS = {
@@ -62,169 +73,543 @@ ASSET_TYPE_ICONS = {
     "hdri": "icons/hdri.png",
     "other": "icons/other.png"
 }
+LOGO_ICON = "icons/logo.png"
+PLACEHOLDER_ICON_SIZE = 64
+LOGO_ICON_SIZE = 32
+
+# Card colors, parsed once instead of on every paint
+_ACCENT_QCOLOR = QColor(ACCENT_COLOR)
+_BORDER_QCOLOR = QColor(BORDER_COLOR)
+_CARD_BG_QCOLOR = QColor(CARD_BG_COLOR)
+_CARD_HOVER_QCOLOR = QColor(CARD_HOVER_COLOR)
+_DARKER_BG_QCOLOR = QColor(DARKER_BG_COLOR)
+_TEXT_QCOLOR = QColor(TEXT_COLOR)
+_SECONDARY_TEXT_QCOLOR = QColor(SECONDARY_TEXT_COLOR)
+_WHITE_QCOLOR = QColor("white")
+
+# Scaled icons by path and size, or None where the icon is missing
+_icon_pixmaps = {}
 
-class AssetCard(QFrame):
-    """Card widget for displaying an asset."""
+
+def _preview_key(path: str, mtime: Optional[float] = None):
+    """Get the cache key for a preview image.
     
-    clicked = pyqtSignal(object)
+    Args:
+        path: Path to the preview image
+        mtime: Modification time recorded when the asset was indexed; the
+            file is only checked on disk when it is not given
+        
+    Returns:
+        Tuple of path and modification time, or None if the file is missing
+    """
+    if mtime is not None:
+        return (path, mtime)
+    try:
+        return (path, os.path.getmtime(path))
+    except OSError:
+        return None
+
+
+def _get_cached_preview(key) -> Optional[QPixmap]:
+    """Get a decoded preview from the cache.
     
-    def __init__(self, asset: Asset, parent=None):
-        """Initialize the asset card.
+    Args:
+        key: Cache key from _preview_key
+        
+    Returns:
+        Cached pixmap, or None if not cached
+    """
+    return QPixmapCache.find(_pixmap_cache_key(key))
+
+
+def _cache_preview(key, pixmap: QPixmap):
+    """Store a decoded preview in the cache.
+    
+    Args:
+        key: Cache key from _preview_key
+        pixmap: Scaled preview pixmap
+    """
+    QPixmapCache.insert(_pixmap_cache_key(key), pixmap)
+
+
+def _pixmap_cache_key(key) -> str:
+    """Get the QPixmapCache key for a scaled preview.
+    
+    Args:
+        key: Cache key from _preview_key
+        
+    Returns:
+        String key including the preview size
+    """
+    path, mtime = key
+    return f"{path}:{mtime}:{PREVIEW_WIDTH}x{PREVIEW_HEIGHT}"
+
+
+def _get_icon(icon_path: str, size: int) -> Optional[QPixmap]:
+    """Get an icon scaled to fit a square.
+    
+    Each icon is decoded once per session and the pixmap is shared. Higher
+    resolution variants such as logo@2x.png are used on HiDPI screens.
+    
+    Args:
+        icon_path: Path to the icon image
+        size: Width and height to fit the icon in
+        
+    Returns:
+        Icon pixmap, or None if the icon is missing
+    """
+    key = (icon_path, size)
+    if key not in _icon_pixmaps:
+        pixmap = QIcon(icon_path).pixmap(QSize(size, size))
+        _icon_pixmaps[key] = None if pixmap.isNull() else pixmap
+    return _icon_pixmaps[key]
+
+
+def _get_placeholder(asset_type: str) -> Optional[QPixmap]:
+    """Get the scaled placeholder pixmap for an asset type.
+    
+    Args:
+        asset_type: Asset type
+        
+    Returns:
+        Placeholder pixmap, or None if the icon is missing
+    """
+    icon_path = ASSET_TYPE_ICONS.get(asset_type, ASSET_TYPE_ICONS["other"])
+    return _get_icon(icon_path, PLACEHOLDER_ICON_SIZE)
+
+
+def _preload_icons():
+    """Decode the placeholder and logo icons before any view needs them."""
+    for icon_path in ASSET_TYPE_ICONS.values():
+        _get_icon(icon_path, PLACEHOLDER_ICON_SIZE)
+    _get_icon(LOGO_ICON, LOGO_ICON_SIZE)
+
+
+@functools.lru_cache(maxsize=64)
+def _type_format_label(file_type: str, file_format: str) -> str:
+    """Get the card label for an asset type and format.
+    
+    Args:
+        file_type: Asset type
+        file_format: File format
+        
+    Returns:
+        Label such as "Model • OBJ"
+    """
+    return f"{file_type.capitalize()} • {file_format.upper()}"
+
+
+@functools.lru_cache(maxsize=64)
+def _source_label(source: str) -> str:
+    """Get the card label for an asset source.
+    
+    Args:
+        source: Asset source
+        
+    Returns:
+        Label such as "Source: local"
+    """
+    return f"Source: {source}"
+
+
+def _asset_value(asset, key: str, default=None):
+    """Get a field of an asset given as a model object or a search result.
+    
+    Args:
+        asset: Asset model or asset dictionary
+        key: Field name
+        default: Value returned if the field is missing
+        
+    Returns:
+        Field value
+    """
+    if isinstance(asset, dict):
+        return asset.get(key, default)
+    return getattr(asset, key, default)
+
+
+class PreviewLoaderSignals(QObject):
+    """Signals for the preview loader."""
+    
+    loaded = pyqtSignal(object, QImage)
+
+
+class PreviewLoader(QRunnable):
+    """Runnable that loads a preview thumbnail off the UI thread."""
+    
+    def __init__(self, key):
+        """Initialize the loader.
         
         Args:
-            asset: Asset to display
-            parent: Parent widget
+            key: Cache key from _preview_key
+        """
+        super().__init__()
+        self.key = key
+        self.signals = PreviewLoaderSignals()
+    
+    def run(self):
+        """Load the preview thumbnail and emit it."""
+        path, mtime = self.key
+        self.signals.loaded.emit(self.key, get_thumb(path, PREVIEW_WIDTH, PREVIEW_HEIGHT, mtime))
+
+
+class AssetListModel(QAbstractListModel):
+    """List model over assets, shared by the grid and list view modes.
+    
+    Rows are kept in a plain list; no per-row widgets or items are created.
+    Previews are decoded in the background the first time a row is painted.
+    """
+    
+    PreviewRole = Qt.UserRole + 1
+    NameSortRole = Qt.UserRole + 2
+    CreatedRole = Qt.UserRole + 3
+    
+    def __init__(self, parent=None):
+        """Initialize the model.
+        
+        Args:
+            parent: Parent object
         """
         super().__init__(parent)
-        self.asset = asset
-        self.is_hovered = False
-        self.setup_ui()
+        self.rows = []
+        self.rows_by_preview = {}
+        self.loading = set()
+        self.preview_pool = QThreadPool(self)
+        self.sort_role = None
+        self.sort_order = Qt.AscendingOrder
+    
+    def rowCount(self, parent=QModelIndex()):
+        """Return the number of assets."""
+        if parent.isValid():
+            return 0
+        return len(self.rows)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        """Return the data for a row."""
+        if not index.isValid():
+            return None
+        
+        asset = self.rows[index.row()]
+        
+        if role == Qt.DisplayRole:
+            return _asset_value(asset, "name", "")
+        if role == Qt.UserRole:
+            return asset
+        if role in (Qt.DecorationRole, self.PreviewRole):
+            pixmap = self.get_preview(
+                _asset_value(asset, "preview_path"), _asset_value(asset, "preview_mtime")
+            )
+            if pixmap is None or role == self.PreviewRole:
+                return pixmap
+            return QIcon(pixmap)
+        if role in (self.NameSortRole, self.CreatedRole):
+            return self.sort_value(asset, role)
         
-    def setup_ui(self):
-        """Set up the UI components."""
-        # Set up the card appearance
-        self.setFixedSize(CARD_WIDTH, CARD_HEIGHT)
-        self.setObjectName("assetCard")
-        self.setStyleSheet(f"""
-            #assetCard {{
-                background-color: {CARD_BG_COLOR};
-                border-radius: 8px;
-                border: 1px solid {BORDER_COLOR};
-            }}
-            #assetCard:hover {{
-                background-color: {CARD_HOVER_COLOR};
-                border: 1px solid {ACCENT_COLOR};
-            }}
-            QLabel {{
-                color: {TEXT_COLOR};
-            }}
-        """)
+        return None
+    
+    def set_rows(self, rows):
+        """Replace the displayed assets.
         
-        # Main layout
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(10, 10, 10, 10)
-        layout.setSpacing(5)
-        
-        # Preview image
-        self.preview_label = QLabel()
-        self.preview_label.setAlignment(Qt.AlignCenter)
-        self.preview_label.setMinimumHeight(140)
-        self.preview_label.setMaximumHeight(140)
-        self.preview_label.setStyleSheet(f"""
-            background-color: {DARKER_BG_COLOR};
-            border-radius: 4px;
-        """)
-        
-        # Load preview image if available
-        if hasattr(self.asset, 'preview_path') and os.path.exists(self.asset.preview_path):
-            pixmap = QPixmap(self.asset.preview_path)
-            pixmap = pixmap.scaled(CARD_WIDTH - 20, 140, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-            self.preview_label.setPixmap(pixmap)
-        else:
-            # Use placeholder based on asset type
-            asset_type = self.asset.file_type if self.asset.file_type else "other"
-            icon_path = ASSET_TYPE_ICONS.get(asset_type, ASSET_TYPE_ICONS["other"])
-            if os.path.exists(icon_path):
-                pixmap = QPixmap(icon_path)
-                pixmap = pixmap.scaled(64, 64, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                self.preview_label.setPixmap(pixmap)
-            else:
-                self.preview_label.setText("No Preview")
-        
-        layout.addWidget(self.preview_label)
-        
-        # Asset name
-        self.name_label = QLabel(self.asset.name)
-        self.name_label.setWordWrap(True)
-        self.name_label.setAlignment(Qt.AlignLeft | Qt.AlignTop)
-        self.name_label.setStyleSheet(f"""
-            font-weight: bold;
-            font-size: 14px;
-            color: {TEXT_COLOR};
-        """)
-        layout.addWidget(self.name_label)
-        
-        # Asset type and format
-        type_format = f"{self.asset.file_type.capitalize()} • {self.asset.file_format.upper()}"
-        self.type_label = QLabel(type_format)
-        self.type_label.setStyleSheet(f"""
-            font-size: 12px;
-            color: {SECONDARY_TEXT_COLOR};
-        """)
-        layout.addWidget(self.type_label)
-        
-        # Source
-        self.source_label = QLabel(f"Source: {self.asset.source}")
-        self.source_label.setStyleSheet(f"""
-            font-size: 12px;
-            color: {SECONDARY_TEXT_COLOR};
-        """)
-        layout.addWidget(self.source_label)
+        Args:
+            rows: List of assets
+        """
+        # Drop decodes still queued for the previous rows
+        self.preview_pool.clear()
+        self.loading = set()
+        
+        self.beginResetModel()
+        self.rows = list(rows)
+        if self.sort_role is not None:
+            self.rows.sort(key=self.row_sort_key, reverse=self.sort_order == Qt.DescendingOrder)
+        self.rows_by_preview = {}
+        self.index_previews(0, self.rows)
+        self.endResetModel()
+    
+    def append_rows(self, rows):
+        """Add assets after the ones already displayed.
         
-        # Add spacer to push everything to the top
-        layout.addItem(QSpacerItem(0, 0, QSizePolicy.Minimum, QSizePolicy.Expanding))
-        
-        # Bottom row with buttons
-        bottom_layout = QHBoxLayout()
-        bottom_layout.setSpacing(5)
-        
-        # Import button
-        self.import_button = QPushButton("Import")
-        self.import_button.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {ACCENT_COLOR};
-                color: white;
-                border: none;
-                border-radius: 4px;
-                padding: 5px 10px;
-                font-weight: bold;
-            }}
-            QPushButton:hover {{
-                background-color: {ACCENT_COLOR_HOVER};
-            }}
-        """)
-        bottom_layout.addWidget(self.import_button)
-        
-        # Details button
-        self.details_button = QPushButton("Details")
-        self.details_button.setStyleSheet(f"""
-            QPushButton {{
-                background-color: transparent;
-                color: {TEXT_COLOR};
-                border: 1px solid {BORDER_COLOR};
-                border-radius: 4px;
-                padding: 5px 10px;
-            }}
-            QPushButton:hover {{
-                border-color: {ACCENT_COLOR};
-                color: {ACCENT_COLOR};
-            }}
-        """)
-        bottom_layout.addWidget(self.details_button)
-        
-        layout.addLayout(bottom_layout)
-        
-    def enterEvent(self, event):
-        """Handle mouse enter event."""
-        self.is_hovered = True
-        self.update()
-        super().enterEvent(event)
-        
-    def leaveEvent(self, event):
-        """Handle mouse leave event."""
-        self.is_hovered = False
-        self.update()
-        super().leaveEvent(event)
-        
-    def mousePressEvent(self, event):
-        """Handle mouse press event."""
-        if event.button() == Qt.LeftButton:
-            self.clicked.emit(self.asset)
-        super().mousePressEvent(event)
-
-
-class AssetGridWidget(QScrollArea):
-    """Widget for displaying a grid of assets."""
+        Args:
+            rows: List of assets
+        """
+        if not rows:
+            return
+        start = len(self.rows)
+        self.beginInsertRows(QModelIndex(), start, start + len(rows) - 1)
+        self.rows.extend(rows)
+        self.index_previews(start, rows)
+        self.endInsertRows()
+        
+        # Move the new rows into place
+        if self.sort_role is not None:
+            self.sort(0, self.sort_order)
+    
+    def sort_value(self, asset, role):
+        """Get the value an asset is sorted by.
+        
+        Args:
+            asset: Asset model or asset dictionary
+            role: NameSortRole or CreatedRole
+            
+        Returns:
+            Sort key
+        """
+        if role == self.NameSortRole:
+            return (_asset_value(asset, "name") or "").lower()
+        
+        # ISO timestamps sort chronologically as strings
+        created_at = _asset_value(asset, "created_at")
+        if isinstance(created_at, datetime):
+            created_at = created_at.isoformat()
+        return created_at or ""
+    
+    def row_sort_key(self, asset):
+        """Get the sort key of an asset for the current sort role."""
+        return self.sort_value(asset, self.sort_role)
+    
+    def set_sort(self, role, order=Qt.AscendingOrder):
+        """Keep the rows sorted by a role.
+        
+        Args:
+            role: NameSortRole or CreatedRole
+            order: Sort order
+        """
+        self.sort_role = role
+        self.sort(0, order)
+    
+    def sort(self, column, order=Qt.AscendingOrder):
+        """Sort the rows by the current sort role.
+        
+        The rows are sorted in Python with one key per row and the views
+        are told about the new order in one layout change.
+        
+        Args:
+            column: Sorted column; the model has only one
+            order: Sort order
+        """
+        self.sort_order = order
+        if self.sort_role is None or not self.rows:
+            return
+        
+        self.layoutAboutToBeChanged.emit()
+        keys = [self.row_sort_key(asset) for asset in self.rows]
+        new_order = sorted(range(len(self.rows)), key=keys.__getitem__,
+                           reverse=order == Qt.DescendingOrder)
+        self.rows = [self.rows[row] for row in new_order]
+        self.rows_by_preview = {}
+        self.index_previews(0, self.rows)
+        
+        # Keep selections and the current item on the same assets
+        new_rows = {old_row: new_row for new_row, old_row in enumerate(new_order)}
+        old_indexes = self.persistentIndexList()
+        self.changePersistentIndexList(
+            old_indexes, [self.index(new_rows[index.row()]) for index in old_indexes]
+        )
+        self.layoutChanged.emit()
+    
+    def index_previews(self, start, rows):
+        """Record which rows show which preview image.
+        
+        Args:
+            start: Row number of the first asset
+            rows: List of assets
+        """
+        for row, asset in enumerate(rows, start):
+            preview_path = _asset_value(asset, "preview_path")
+            if preview_path:
+                self.rows_by_preview.setdefault(preview_path, []).append(row)
+    
+    def get_preview(self, preview_path, preview_mtime=None):
+        """Get the pixmap for a preview, loading it in the background if needed.
+        
+        Args:
+            preview_path: Path to the preview image
+            preview_mtime: Modification time recorded at index time
+            
+        Returns:
+            Preview pixmap, or None until it has been loaded
+        """
+        if not preview_path:
+            return None
+        key = _preview_key(preview_path, preview_mtime)
+        if key is None:
+            return None
+        
+        pixmap = _get_cached_preview(key)
+        if pixmap is not None:
+            return pixmap
+        
+        if key not in self.loading:
+            self.loading.add(key)
+            loader = PreviewLoader(key)
+            loader.signals.loaded.connect(self.on_preview_loaded)
+            self.preview_pool.start(loader)
+        return None
+    
+    @pyqtSlot(object, QImage)
+    def on_preview_loaded(self, key, image):
+        """Repaint the rows showing a preview decoded by the background loader.
+        
+        Args:
+            key: Cache key of the preview
+            image: Scaled preview image
+        """
+        self.loading.discard(key)
+        if image.isNull():
+            return
+        _cache_preview(key, QPixmap.fromImage(image))
+        for row in self.rows_by_preview.get(key[0], []):
+            index = self.index(row)
+            self.dataChanged.emit(index, index, [Qt.DecorationRole, self.PreviewRole])
+
+
+class AssetCardDelegate(QStyledItemDelegate):
+    """Delegate that paints an asset as a card.
+    
+    The whole card, buttons included, is drawn with QPainter, so the grid
+    needs no child widgets or layouts per asset.
+    """
+    
+    import_clicked = pyqtSignal(object)
+    details_clicked = pyqtSignal(object)
+    
+    def __init__(self, parent=None):
+        """Initialize the delegate.
+        
+        Args:
+            parent: Parent object
+        """
+        super().__init__(parent)
+        self.fonts = None
+    
+    def card_fonts(self, font):
+        """Get the fonts of a card, derived once from the view font.
+        
+        Args:
+            font: Font of the view
+            
+        Returns:
+            Tuple of the name, details and button fonts
+        """
+        if self.fonts is None or self.fonts[0] != font:
+            name_font = QFont(font)
+            name_font.setPixelSize(14)
+            name_font.setBold(True)
+            meta_font = QFont(font)
+            meta_font.setPixelSize(12)
+            button_font = QFont(font)
+            button_font.setBold(True)
+            self.fonts = (QFont(font), name_font, meta_font, button_font)
+        return self.fonts[1:]
+    
+    def sizeHint(self, option, index):
+        """Return the card size."""
+        return QSize(CARD_WIDTH, CARD_HEIGHT)
+    
+    def button_rects(self, rect):
+        """Get the Import and Details button areas of a card.
+        
+        Args:
+            rect: Card rectangle
+            
+        Returns:
+            Tuple of the Import and Details button rectangles
+        """
+        width = (rect.width() - 25) // 2
+        top = rect.bottom() - 10 - CARD_BUTTON_HEIGHT
+        import_rect = QRect(rect.left() + 10, top, width, CARD_BUTTON_HEIGHT)
+        details_rect = QRect(import_rect.right() + 6, top, width, CARD_BUTTON_HEIGHT)
+        return import_rect, details_rect
+    
+    def paint(self, painter, option, index):
+        """Paint the card for an asset."""
+        asset = index.data(Qt.UserRole)
+        rect = option.rect.adjusted(0, 0, -1, -1)
+        hovered = bool(option.state & QStyle.State_MouseOver)
+        
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        
+        # Card background
+        path = QPainterPath()
+        path.addRoundedRect(QRectF(rect).adjusted(0.5, 0.5, -0.5, -0.5), 8, 8)
+        painter.fillPath(path, _CARD_HOVER_QCOLOR if hovered else _CARD_BG_QCOLOR)
+        painter.setPen(QPen(_ACCENT_QCOLOR if hovered else _BORDER_QCOLOR, 1))
+        painter.drawPath(path)
+        
+        # Preview, or a placeholder until it is decoded
+        preview_rect = QRect(rect.left() + 10, rect.top() + 10, PREVIEW_WIDTH, PREVIEW_HEIGHT)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(_DARKER_BG_QCOLOR)
+        painter.drawRoundedRect(preview_rect, 4, 4)
+        pixmap = index.data(AssetListModel.PreviewRole)
+        if pixmap is None:
+            pixmap = _get_placeholder(_asset_value(asset, "file_type") or "other")
+        if pixmap is not None:
+            size = pixmap.size() / pixmap.devicePixelRatio()
+            x = preview_rect.left() + (preview_rect.width() - size.width()) // 2
+            y = preview_rect.top() + (preview_rect.height() - size.height()) // 2
+            painter.drawPixmap(x, y, pixmap)
+        else:
+            painter.setPen(_TEXT_QCOLOR)
+            painter.drawText(preview_rect, Qt.AlignCenter, "No Preview")
+        
+        # Name, type and source
+        text_left = rect.left() + 10
+        text_width = rect.width() - 20
+        name_font, meta_font, button_font = self.card_fonts(option.font)
+        painter.setFont(name_font)
+        painter.setPen(_TEXT_QCOLOR)
+        name_rect = QRect(text_left, preview_rect.bottom() + 6, text_width, 36)
+        name_bounds = painter.drawText(name_rect, Qt.AlignLeft | Qt.AlignTop | Qt.TextWordWrap,
+                                       _asset_value(asset, "name", ""))
+        
+        painter.setFont(meta_font)
+        painter.setPen(_SECONDARY_TEXT_QCOLOR)
+        meta_rect = QRect(text_left, min(name_bounds.bottom(), name_rect.bottom()) + 2, text_width, 18)
+        painter.drawText(meta_rect, Qt.AlignLeft | Qt.AlignVCenter, _type_format_label(
+            _asset_value(asset, "file_type") or "", _asset_value(asset, "file_format") or ""
+        ))
+        meta_rect.translate(0, 18)
+        painter.drawText(meta_rect, Qt.AlignLeft | Qt.AlignVCenter,
+                         _source_label(_asset_value(asset, "source") or ""))
+        
+        # Buttons
+        import_rect, details_rect = self.button_rects(rect)
+        painter.setFont(button_font)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(_ACCENT_QCOLOR)
+        painter.drawRoundedRect(import_rect, 4, 4)
+        painter.setPen(_WHITE_QCOLOR)
+        painter.drawText(import_rect, Qt.AlignCenter, "Import")
+        
+        painter.setFont(option.font)
+        painter.setBrush(Qt.NoBrush)
+        painter.setPen(_BORDER_QCOLOR)
+        painter.drawRoundedRect(QRectF(details_rect).adjusted(0.5, 0.5, -0.5, -0.5), 4, 4)
+        painter.setPen(_TEXT_QCOLOR)
+        painter.drawText(details_rect, Qt.AlignCenter, "Details")
+        
+        painter.restore()
+    
+    def editorEvent(self, event, model, option, index):
+        """Route clicks on the painted buttons."""
+        if event.type() == QEvent.MouseButtonRelease and event.button() == Qt.LeftButton:
+            import_rect, details_rect = self.button_rects(option.rect.adjusted(0, 0, -1, -1))
+            if import_rect.contains(event.pos()):
+                self.import_clicked.emit(index.data(Qt.UserRole))
+                return True
+            if details_rect.contains(event.pos()):
+                self.details_clicked.emit(index.data(Qt.UserRole))
+                return True
+        return super().editorEvent(event, model, option, index)
+
+
+class AssetGridWidget(QListView):
+    """Widget for displaying a grid of assets.
+    
+    The grid is a list view in icon mode whose cards are painted by
+    AssetCardDelegate, so only the cards in view cost anything to draw.
+    """
     
     def __init__(self, parent=None):
         """Initialize the asset grid widget.
@@ -233,79 +618,26 @@ class AssetGridWidget(QScrollArea):
             parent: Parent widget
         """
         super().__init__(parent)
-        self.assets = []
         self.setup_ui()
         
     def setup_ui(self):
         """Set up the UI components."""
-        # Set up the scroll area
-        self.setWidgetResizable(True)
+        self.setViewMode(QListView.IconMode)
+        self.setMovement(QListView.Static)
+        self.setResizeMode(QListView.Adjust)
+        self.setLayoutMode(QListView.Batched)
+        self.setUniformItemSizes(True)
+        self.setSpacing(CARD_SPACING // 2)
+        self.setSelectionMode(QListView.NoSelection)
+        self.setMouseTracking(True)
         self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        self.setStyleSheet(f"""
-            QScrollArea {{
-                background-color: {DARK_BG_COLOR};
-                border: none;
-            }}
-            QScrollBar:vertical {{
-                background-color: {DARKER_BG_COLOR};
-                width: 10px;
-                margin: 0px;
-            }}
-            QScrollBar::handle:vertical {{
-                background-color: {ACCENT_COLOR};
-                min-height: 20px;
-                border-radius: 5px;
-            }}
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
-                height: 0px;
-            }}
-        """)
-        
-        # Create container widget
-        self.container = QWidget()
-        self.container.setStyleSheet(f"background-color: {DARK_BG_COLOR};")
-        
-        # Create grid layout
-        self.grid_layout = QGridLayout(self.container)
-        self.grid_layout.setContentsMargins(CARD_SPACING, CARD_SPACING, CARD_SPACING, CARD_SPACING)
-        self.grid_layout.setSpacing(CARD_SPACING)
-        
-        self.setWidget(self.container)
-        
-    def set_assets(self, assets: List[Asset]):
-        """Set the assets to display.
-        
-        Args:
-            assets: List of assets to display
-        """
-        # Clear existing assets
-        self.assets = assets
-        
-        # Clear the grid layout
-        while self.grid_layout.count():
-            item = self.grid_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-        
-        # Add assets to the grid
-        columns = max(1, (self.width() - 2 * CARD_SPACING) // (CARD_WIDTH + CARD_SPACING))
-        for i, asset in enumerate(assets):
-            row = i // columns
-            col = i % columns
-            
-            card = AssetCard(asset)
-            card.clicked.connect(self.on_asset_clicked)
-            self.grid_layout.addWidget(card, row, col)
-            
-        # Add empty items to fill the grid
-        if assets:
-            for i in range(len(assets), (((len(assets) - 1) // columns) + 1) * columns):
-                row = i // columns
-                col = i % columns
-                spacer = QWidget()
-                spacer.setFixedSize(CARD_WIDTH, CARD_HEIGHT)
-                spacer.setStyleSheet("background-color: transparent;")
-                self.grid_layout.addWidget(spacer, row, col)
+        self.setVerticalScrollMode(QListView.ScrollPerPixel)
+        self.verticalScrollBar().setSingleStep((CARD_HEIGHT + CARD_SPACING) // 4)
+        self.setObjectName("assetGrid")
+        
+        self.card_delegate = AssetCardDelegate(self)
+        self.card_delegate.details_clicked.connect(self.on_asset_clicked)
+        self.setItemDelegate(self.card_delegate)
     
     def on_asset_clicked(self, asset):
         """Handle asset click event.
@@ -315,13 +647,21 @@ class AssetGridWidget(QScrollArea):
         """
         # Show asset details dialog
         pass
-        
-    def resizeEvent(self, event):
-        """Handle resize event."""
-        # Recalculate grid layout when widget is resized
-        if self.assets:
-            self.set_assets(self.assets)
-        super().resizeEvent(event)
+
+
+class CategoryItemDelegate(QStyledItemDelegate):
+    """Delegate that toggles a checkable row when it is clicked anywhere."""
+    
+    def editorEvent(self, event, model, option, index):
+        """Toggle the check state on a left click."""
+        if event.type() == QEvent.MouseButtonRelease and event.button() == Qt.LeftButton:
+            if option.rect.contains(event.pos()):
+                state = Qt.Unchecked if index.data(Qt.CheckStateRole) == Qt.Checked else Qt.Checked
+                model.setData(index, state, Qt.CheckStateRole)
+                return True
+        if event.type() == QEvent.MouseButtonDblClick:
+            return True
+        return super().editorEvent(event, model, option, index)
 
 
 class SidebarWidget(QWidget):
@@ -336,16 +676,32 @@ class SidebarWidget(QWidget):
             parent: Parent widget
         """
         super().__init__(parent)
+        
+        # Filter values, updated one field at a time as the widgets change
+        self._filter_state = {
+            "search": "",
+            "type": "",
+            "format": "",
+            "source": "",
+            "categories": []
+        }
+        
+        # Typing and category toggles are debounced so a burst of edits
+        # fires one search
+        self._last_filters = None
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(SEARCH_DEBOUNCE_MS)
+        self._filter_timer.timeout.connect(self.emit_filters)
+        
         self.setup_ui()
         
     def setup_ui(self):
         """Set up the UI components."""
         # Set fixed width
         self.setFixedWidth(SIDEBAR_WIDTH)
-        self.setStyleSheet(f"""
-            background-color: {DARKER_BG_COLOR};
-            border-right: 1px solid {BORDER_COLOR};
-        """)
+        self.setObjectName("sidebar")
+        self.setAttribute(Qt.WA_StyledBackground, True)
         
         # Main layout
         layout = QVBoxLayout(self)
@@ -355,30 +711,19 @@ class SidebarWidget(QWidget):
         # Logo and title
         logo_layout = QHBoxLayout()
         logo_label = QLabel()
-        logo_pixmap = QPixmap("icons/logo.png")
-        if not logo_pixmap.isNull():
-            logo_label.setPixmap(logo_pixmap.scaled(32, 32, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+        logo_pixmap = _get_icon(LOGO_ICON, LOGO_ICON_SIZE)
+        if logo_pixmap is not None:
+            logo_label.setPixmap(logo_pixmap)
         else:
             logo_label.setText("AH")
-            logo_label.setStyleSheet(f"""
-                font-size: 18px;
-                font-weight: bold;
-                color: {ACCENT_COLOR};
-                background-color: {DARK_BG_COLOR};
-                border-radius: 16px;
-                padding: 5px;
-            """)
-            logo_label.setFixedSize(32, 32)
+            logo_label.setObjectName("logoLabel")
+            logo_label.setFixedSize(LOGO_ICON_SIZE, LOGO_ICON_SIZE)
             logo_label.setAlignment(Qt.AlignCenter)
         
         logo_layout.addWidget(logo_label)
         
         title_label = QLabel("AssetHub")
-        title_label.setStyleSheet(f"""
-            font-size: 18px;
-            font-weight: bold;
-            color: {TEXT_COLOR};
-        """)
+        title_label.setObjectName("titleLabel")
         logo_layout.addWidget(title_label)
         logo_layout.addStretch()
         
@@ -387,33 +732,17 @@ class SidebarWidget(QWidget):
         # Search box
         self.search_edit = QLineEdit()
         self.search_edit.setPlaceholderText("Search assets...")
-        self.search_edit.setStyleSheet(f"""
-            QLineEdit {{
-                background-color: {DARK_BG_COLOR};
-                color: {TEXT_COLOR};
-                border: 1px solid {BORDER_COLOR};
-                border-radius: 4px;
-                padding: 8px;
-            }}
-            QLineEdit:focus {{
-                border: 1px solid {ACCENT_COLOR};
-            }}
-        """)
-        self.search_edit.textChanged.connect(self.on_filter_changed)
+        self.search_edit.textChanged.connect(self.on_search_changed)
         layout.addWidget(self.search_edit)
         
         # Filters section
         filters_label = QLabel("Filters")
-        filters_label.setStyleSheet(f"""
-            font-size: 14px;
-            font-weight: bold;
-            color: {TEXT_COLOR};
-        """)
+        filters_label.setProperty("role", "section")
         layout.addWidget(filters_label)
         
         # Asset type filter
         type_label = QLabel("Asset Type")
-        type_label.setStyleSheet(f"color: {SECONDARY_TEXT_COLOR};")
+        type_label.setProperty("role", "secondary")
         layout.addWidget(type_label)
         
         self.type_combo = QComboBox()
@@ -422,37 +751,13 @@ class SidebarWidget(QWidget):
         self.type_combo.addItem("Textures", "texture")
         self.type_combo.addItem("Materials", "material")
         self.type_combo.addItem("HDRIs", "hdri")
-        self.type_combo.setStyleSheet(f"""
-            QComboBox {{
-                background-color: {DARK_BG_COLOR};
-                color: {TEXT_COLOR};
-                border: 1px solid {BORDER_COLOR};
-                border-radius: 4px;
-                padding: 5px;
-            }}
-            QComboBox:hover {{
-                border: 1px solid {ACCENT_COLOR};
-            }}
-            QComboBox::drop-down {{
-                subcontrol-origin: padding;
-                subcontrol-position: top right;
-                width: 20px;
-                border-left: 1px solid {BORDER_COLOR};
-            }}
-            QComboBox QAbstractItemView {{
-                background-color: {DARK_BG_COLOR};
-                color: {TEXT_COLOR};
-                selection-background-color: {ACCENT_COLOR};
-                selection-color: white;
-                border: 1px solid {BORDER_COLOR};
-            }}
-        """)
-        self.type_combo.currentIndexChanged.connect(self.on_filter_changed)
+        self.type_combo.setProperty("role", "filter")
+        self.type_combo.currentIndexChanged.connect(self.on_type_changed)
         layout.addWidget(self.type_combo)
         
         # Format filter
         format_label = QLabel("Format")
-        format_label.setStyleSheet(f"color: {SECONDARY_TEXT_COLOR};")
+        format_label.setProperty("role", "secondary")
         layout.addWidget(format_label)
         
         self.format_combo = QComboBox()
@@ -463,37 +768,13 @@ class SidebarWidget(QWidget):
         self.format_combo.addItem("3ds Max", "max")
         self.format_combo.addItem("PNG", "png")
         self.format_combo.addItem("JPG", "jpg")
-        self.format_combo.setStyleSheet(f"""
-            QComboBox {{
-                background-color: {DARK_BG_COLOR};
-                color: {TEXT_COLOR};
-                border: 1px solid {BORDER_COLOR};
-                border-radius: 4px;
-                padding: 5px;
-            }}
-            QComboBox:hover {{
-                border: 1px solid {ACCENT_COLOR};
-            }}
-            QComboBox::drop-down {{
-                subcontrol-origin: padding;
-                subcontrol-position: top right;
-                width: 20px;
-                border-left: 1px solid {BORDER_COLOR};
-            }}
-            QComboBox QAbstractItemView {{
-                background-color: {DARK_BG_COLOR};
-                color: {TEXT_COLOR};
-                selection-background-color: {ACCENT_COLOR};
-                selection-color: white;
-                border: 1px solid {BORDER_COLOR};
-            }}
-        """)
-        self.format_combo.currentIndexChanged.connect(self.on_filter_changed)
+        self.format_combo.setProperty("role", "filter")
+        self.format_combo.currentIndexChanged.connect(self.on_format_changed)
         layout.addWidget(self.format_combo)
         
         # Source filter
         source_label = QLabel("Source")
-        source_label.setStyleSheet(f"color: {SECONDARY_TEXT_COLOR};")
+        source_label.setProperty("role", "secondary")
         layout.addWidget(source_label)
         
         self.source_combo = QComboBox()
@@ -501,71 +782,24 @@ class SidebarWidget(QWidget):
         self.source_combo.addItem("Local Library", "local")
         self.source_combo.addItem("Poly Haven", "Poly Haven")
         self.source_combo.addItem("Free3D", "Free3D")
-        self.source_combo.setStyleSheet(f"""
-            QComboBox {{
-                background-color: {DARK_BG_COLOR};
-                color: {TEXT_COLOR};
-                border: 1px solid {BORDER_COLOR};
-                border-radius: 4px;
-                padding: 5px;
-            }}
-            QComboBox:hover {{
-                border: 1px solid {ACCENT_COLOR};
-            }}
-            QComboBox::drop-down {{
-                subcontrol-origin: padding;
-                subcontrol-position: top right;
-                width: 20px;
-                border-left: 1px solid {BORDER_COLOR};
-            }}
-            QComboBox QAbstractItemView {{
-                background-color: {DARK_BG_COLOR};
-                color: {TEXT_COLOR};
-                selection-background-color: {ACCENT_COLOR};
-                selection-color: white;
-                border: 1px solid {BORDER_COLOR};
-            }}
-        """)
-        self.source_combo.currentIndexChanged.connect(self.on_filter_changed)
+        self.source_combo.setProperty("role", "filter")
+        self.source_combo.currentIndexChanged.connect(self.on_source_changed)
         layout.addWidget(self.source_combo)
         
         # Categories section
         categories_label = QLabel("Categories")
-        categories_label.setStyleSheet(f"""
-            font-size: 14px;
-            font-weight: bold;
-            color: {TEXT_COLOR};
-            margin-top: 10px;
-        """)
+        categories_label.setObjectName("categoriesLabel")
+        categories_label.setProperty("role", "section")
         layout.addWidget(categories_label)
         
-        # Category checkboxes in a scroll area
-        categories_scroll = QScrollArea()
-        categories_scroll.setWidgetResizable(True)
-        categories_scroll.setStyleSheet(f"""
-            QScrollArea {{
-                background-color: transparent;
-                border: none;
-            }}
-            QScrollBar:vertical {{
-                background-color: {DARKER_BG_COLOR};
-                width: 8px;
-                margin: 0px;
-            }}
-            QScrollBar::handle:vertical {{
-                background-color: {ACCENT_COLOR};
-                min-height: 20px;
-                border-radius: 4px;
-            }}
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
-                height: 0px;
-            }}
-        """)
-        
-        categories_widget = QWidget()
-        categories_layout = QVBoxLayout(categories_widget)
-        categories_layout.setContentsMargins(0, 0, 0, 0)
-        categories_layout.setSpacing(5)
+        # Categories as checkable rows of one list view
+        self.category_model = QStandardItemModel(self)
+        self.categories_list = QListView()
+        self.categories_list.setModel(self.category_model)
+        self.categories_list.setItemDelegate(CategoryItemDelegate(self.categories_list))
+        self.categories_list.setSelectionMode(QListView.NoSelection)
+        self.categories_list.setUniformItemSizes(True)
+        self.categories_list.setObjectName("categoriesList")
         
         # Sample categories (will be populated dynamically)
         sample_categories = [
@@ -574,73 +808,232 @@ class SidebarWidget(QWidget):
             "Food", "Animals", "Sci-Fi"
         ]
         
-        self.category_checkboxes = {}
+        # Add all rows in one insertion rather than one per category
+        items = []
         for category in sample_categories:
-            checkbox = QCheckBox(category)
-            checkbox.setStyleSheet(f"""
-                QCheckBox {{
-                    color: {TEXT_COLOR};
-                }}
-                QCheckBox::indicator {{
-                    width: 16px;
-                    height: 16px;
-                    border: 1px solid {BORDER_COLOR};
-                    border-radius: 3px;
-                    background-color: {DARK_BG_COLOR};
-                }}
-                QCheckBox::indicator:checked {{
-                    background-color: {ACCENT_COLOR};
-                    border: 1px solid {ACCENT_COLOR};
-                    image: url(icons/check.png);
-                }}
-                QCheckBox::indicator:hover {{
-                    border: 1px solid {ACCENT_COLOR};
-                }}
-            """)
-            checkbox.stateChanged.connect(self.on_filter_changed)
-            categories_layout.addWidget(checkbox)
-            self.category_checkboxes[category] = checkbox
-        
-        categories_layout.addStretch()
-        categories_scroll.setWidget(categories_widget)
-        layout.addWidget(categories_scroll)
+            item = QStandardItem(category)
+            item.setCheckable(True)
+            item.setEditable(False)
+            items.append(item)
+        self.category_model.invisibleRootItem().appendRows(items)
+        self.category_model.itemChanged.connect(self.on_category_changed)
+        layout.addWidget(self.categories_list)
         
         # Add spacer to push everything to the top
         layout.addStretch()
         
         # Settings button at the bottom
         self.settings_button = QPushButton("Settings")
-        self.settings_button.setStyleSheet(f"""
-            QPushButton {{
-                background-color: transparent;
-                color: {SECONDARY_TEXT_COLOR};
-                border: 1px solid {BORDER_COLOR};
-                border-radius: 4px;
-                padding: 8px;
-                text-align: left;
-            }}
-            QPushButton:hover {{
-                color: {TEXT_COLOR};
-                border-color: {ACCENT_COLOR};
-            }}
-        """)
+        self.settings_button.setObjectName("settingsButton")
+        self.settings_button.setProperty("role", "secondary")
         layout.addWidget(self.settings_button)
         
-    def on_filter_changed(self, *args):
-        """Handle filter change events."""
-        # Collect all filter values
-        filters = {
-            "search": self.search_edit.text(),
-            "type": self.type_combo.currentData(),
-            "format": self.format_combo.currentData(),
-            "source": self.source_combo.currentData(),
-            "categories": [cat for cat, cb in self.category_checkboxes.items() if cb.isChecked()]
-        }
+    def on_search_changed(self, text):
+        """Update the search text and emit it once typing pauses."""
+        self._filter_state["search"] = text
+        self._filter_timer.start()
+    
+    def on_type_changed(self, index):
+        """Update the asset type filter."""
+        self._filter_state["type"] = self.type_combo.itemData(index)
+        self.emit_filters()
+    
+    def on_format_changed(self, index):
+        """Update the format filter."""
+        self._filter_state["format"] = self.format_combo.itemData(index)
+        self.emit_filters()
+    
+    def on_source_changed(self, index):
+        """Update the source filter."""
+        self._filter_state["source"] = self.source_combo.itemData(index)
+        self.emit_filters()
+    
+    def on_category_changed(self, item):
+        """Update the category filter and emit it once toggling pauses."""
+        categories = self._filter_state["categories"]
+        checked = item.checkState() == Qt.Checked
+        if checked and item.text() not in categories:
+            categories.append(item.text())
+        elif not checked and item.text() in categories:
+            categories.remove(item.text())
+        self._filter_timer.start()
+    
+    def current_filters(self) -> Dict[str, Any]:
+        """Get the current filter values.
+        
+        Returns:
+            Copy of the filter values, safe to hand to a worker thread
+        """
+        filters = dict(self._filter_state)
+        filters["categories"] = list(filters["categories"])
+        return filters
+    
+    def emit_filters(self):
+        """Emit the current filter values if they have changed."""
+        self._filter_timer.stop()
+        
+        filters = self.current_filters()
+        if filters == self._last_filters:
+            return
+        self._last_filters = filters
         
         # Emit signal with filter values
         self.filter_changed.emit(filters)
 
 
+class InitWorker(QThread):
+    """Worker thread that prepares the search index and providers at startup."""
+    
+    ready = pyqtSignal(dict, object)
+    error = pyqtSignal(str)
+    
+    def __init__(self, indexer, search):
+        """Initialize the worker.
+        
+        Args:
+            indexer: Indexer whose search index should be created
+            search: AssetSearch instance to load the saved asset listing from
+        """
+        super().__init__()
+        self.indexer = indexer
+        self.search = search
+    
+    def run(self):
+        """Create the search index if it doesn't exist, load providers and the saved listing."""
+        try:
+            self.indexer.create_index()
+            self.ready.emit(get_providers(), self.search.load_snapshot())
+        except Exception as e:
+            logger.exception("Error creating search index: %s", e)
+            self.error.emit(str(e))
+
+
+class SearchWorker(QThread):
+    """Worker thread that runs a filtered asset search, a page at a time."""
+    
+    result_count = pyqtSignal(int, int)
+    results_ready = pyqtSignal(int, list)
+    search_finished = pyqtSignal(int)
+    error = pyqtSignal(int, str)
+    
+    def __init__(self, search, filters, seq, save_snapshot=False):
+        """Initialize the worker.
+        
+        Args:
+            search: AssetSearch instance to query
+            filters: Dictionary of filter values
+            seq: Sequence number of the search request
+            save_snapshot: Whether to save the results as the listing of
+                all assets shown at the next start
+        """
+        super().__init__()
+        self.search = search
+        self.filters = filters
+        self.seq = seq
+        self.save_snapshot = save_snapshot
+    
+    def run(self):
+        """Run the search and emit each page of results unless interrupted."""
+        try:
+            generation = self.search.index_generation() if self.save_snapshot else None
+            assets = []
+            search_filters = {
+                "file_type": self.filters["type"],
+                "file_format": self.filters["format"],
+                "source": self.filters["source"],
+                "categories": self.filters["categories"]
+            }
+            # Blank text lists everything, matching the result cache key
+            pages = self.search.iter_search(
+                self.filters["search"].strip() or "*",
+                filters={field: value for field, value in search_filters.items() if value},
+                should_stop=self.isInterruptionRequested,
+                on_count=lambda count: self.result_count.emit(self.seq, count)
+            )
+            for page in pages:
+                if self.isInterruptionRequested():
+                    return
+                self.results_ready.emit(self.seq, page)
+                if self.save_snapshot:
+                    assets.extend(page)
+            if not self.isInterruptionRequested():
+                self.search_finished.emit(self.seq)
+                if self.save_snapshot:
+                    self.search.save_snapshot(assets, generation)
+        except Exception as e:
+            logger.exception("Error applying filters: %s", e)
+            self.error.emit(self.seq, str(e))
+
+
+class ScanWorker(QThread):
+    """Worker thread that scans a directory for assets and indexes them."""
+    
+    progress = pyqtSignal(int, int)
+    index_progress = pyqtSignal(int, int)
+    scan_finished = pyqtSignal(list, list)
+    scan_canceled = pyqtSignal(int)
+    error = pyqtSignal(str)
+    
+    def __init__(self, scanner, indexer, search, directory):
+        """Initialize the worker.
+        
+        Args:
+            scanner: Scanner to scan the directory with
+            indexer: Indexer to add the scanned assets to
+            search: AssetSearch instance to read the indexed assets from
+            directory: Directory to scan
+        """
+        super().__init__()
+        self.scanner = scanner
+        self.indexer = indexer
+        self.search = search
+        self.directory = directory
+    
+    def run(self):
+        """Scan the directory and index the assets, reporting progress of both.
+        
+        The new and updated assets are emitted as they are stored in the
+        index, like search results. Nothing is emitted if the scan is
+        interrupted. Indexing stops between batches of new assets when
+        interrupted; the new assets left unindexed are removed from the
+        catalog again and the number of indexed assets is emitted.
+        """
+        try:
+            scanner = self.scanner
+            scanner.scan_directory(
+                self.directory, progress=self.progress.emit,
+                should_stop=self.isInterruptionRequested
+            )
+            if self.isInterruptionRequested():
+                return
+            updated_count = len(scanner.updated_assets)
+            total = updated_count + len(scanner.new_assets)
+            
+            # Index assets in batched commits rather than one commit each.
+            # Updated assets are always indexed, since their catalog entries
+            # have already changed; new assets have no document to replace
+            self.indexer.index_assets(
+                scanner.updated_assets,
+                progress=lambda count: self.index_progress.emit(count, total)
+            )
+            indexed = self.indexer.index_assets(
+                scanner.new_assets, replace=False,
+                progress=lambda count: self.index_progress.emit(updated_count + count, total),
+                should_stop=self.isInterruptionRequested
+            )
+            if self.isInterruptionRequested():
+                scanner.forget_assets(scanner.new_assets[indexed:])
+                self.scan_canceled.emit(updated_count + indexed)
+                return
+            self.scan_finished.emit(
+                self.search.get_assets_by_id(asset.id for asset in scanner.new_assets),
+                self.search.get_assets_by_id(asset.id for asset in scanner.updated_assets)
+            )
+        except Exception as e:
+            logger.exception("Error importing assets: %s", e)
+            self.error.emit(str(e))
+
+
 class AssetHubMainWindow(QMainWindow):
     """Main window for the AssetHub application."""
     
@@ -648,30 +1041,60 @@ class AssetHubMainWindow(QMainWindow):
         """Initialize the main window."""
         super().__init__()
         
+        # Style every widget from one application-wide stylesheet
+        QApplication.instance().setStyleSheet(APP_STYLESHEET)
+        
+        # Room for the scaled previews of a large library
+        QPixmapCache.setCacheLimit(config.get("ui", "pixmap_cache_mb", PIXMAP_CACHE_LIMIT_MB) * 1024)
+        _preload_icons()
+        
         # Initialize components
-        self.indexer = Indexer()
+        self.scanner = AssetScanner()
+        self.indexer = AssetIndexer()
         self.search = AssetSearch()
-        self.providers = get_providers()
-        
-        # Create search index if it doesn't exist
-        self.indexer.create_index()
+        self.providers = {}
+        
+        # Search state: only results of the latest request are shown
+        self._search_seq = 0
+        self._search_result_count = 0
+        
+        # Results of recent completed searches, by normalized filters
+        self._result_cache = OrderedDict()
+        self._search_key = None
+        self._search_results = []
+        self.search_worker = None
+        self._search_workers = set()
+        
+        # Only searches that take a while announce themselves
+        self._search_status_timer = QTimer(self)
+        self._search_status_timer.setSingleShot(True)
+        self._search_status_timer.setInterval(SEARCH_STATUS_DELAY_MS)
+        self._search_status_timer.timeout.connect(
+            lambda: self.status_bar.showMessage("Filtering assets...")
+        )
+        
+        # Import state
+        self.scan_worker = None
+        self._import_directory = None
+        self._import_dialog = None
         
         # Set up the UI
         self.setup_ui()
         
-        # Load initial assets
-        self.load_assets()
+        # Create search index and load providers in the background, then
+        # load initial assets
+        self.status_bar.showMessage("Initializing...")
+        self.progress_bar.setVisible(True)
+        self.init_worker = InitWorker(self.indexer, self.search)
+        self.init_worker.ready.connect(self.on_init_ready)
+        self.init_worker.error.connect(self.on_init_error)
+        self.init_worker.start()
         
     def setup_ui(self):
         """Set up the UI components."""
         # Set window properties
         self.setWindowTitle("AssetHub")
         self.setMinimumSize(1000, 600)
-        self.setStyleSheet(f"""
-            QMainWindow {{
-                background-color: {DARK_BG_COLOR};
-            }}
-        """)
         
         # Create central widget
         central_widget = QWidget()
@@ -681,7 +1104,7 @@ class AssetHubMainWindow(QMainWindow):
         
         # Create sidebar
         self.sidebar = SidebarWidget()
-        self.sidebar.filter_changed.connect(self.apply_filters)
+        self.sidebar.filter_changed.connect(self.on_filter_changed)
         main_layout.addWidget(self.sidebar)
         
         # Create right side container
@@ -693,10 +1116,8 @@ class AssetHubMainWindow(QMainWindow):
         # Create toolbar
         toolbar = QWidget()
         toolbar.setFixedHeight(60)
-        toolbar.setStyleSheet(f"""
-            background-color: {DARKER_BG_COLOR};
-            border-bottom: 1px solid {BORDER_COLOR};
-        """)
+        toolbar.setObjectName("toolbar")
+        toolbar.setAttribute(Qt.WA_StyledBackground, True)
         
         toolbar_layout = QHBoxLayout(toolbar)
         toolbar_layout.setContentsMargins(15, 0, 15, 0)
@@ -708,88 +1129,34 @@ class AssetHubMainWindow(QMainWindow):
         self.grid_view_button = QPushButton("Grid")
         self.grid_view_button.setCheckable(True)
         self.grid_view_button.setChecked(True)
-        self.grid_view_button.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {DARK_BG_COLOR};
-                color: {SECONDARY_TEXT_COLOR};
-                border: 1px solid {BORDER_COLOR};
-                border-radius: 0;
-                border-top-left-radius: 4px;
-                border-bottom-left-radius: 4px;
-                padding: 5px 15px;
-            }}
-            QPushButton:checked {{
-                background-color: {ACCENT_COLOR};
-                color: white;
-                border-color: {ACCENT_COLOR};
-            }}
-            QPushButton:hover:!checked {{
-                color: {TEXT_COLOR};
-            }}
-        """)
+        self.grid_view_button.setObjectName("gridViewButton")
+        self.grid_view_button.setProperty("role", "viewToggle")
+        self.grid_view_button.setAutoExclusive(True)
+        self.grid_view_button.clicked.connect(self.show_grid_view)
         view_group_layout.addWidget(self.grid_view_button)
         
         self.list_view_button = QPushButton("List")
         self.list_view_button.setCheckable(True)
-        self.list_view_button.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {DARK_BG_COLOR};
-                color: {SECONDARY_TEXT_COLOR};
-                border: 1px solid {BORDER_COLOR};
-                border-radius: 0;
-                border-top-right-radius: 4px;
-                border-bottom-right-radius: 4px;
-                padding: 5px 15px;
-            }}
-            QPushButton:checked {{
-                background-color: {ACCENT_COLOR};
-                color: white;
-                border-color: {ACCENT_COLOR};
-            }}
-            QPushButton:hover:!checked {{
-                color: {TEXT_COLOR};
-            }}
-        """)
+        self.list_view_button.setObjectName("listViewButton")
+        self.list_view_button.setProperty("role", "viewToggle")
+        self.list_view_button.setAutoExclusive(True)
+        self.list_view_button.clicked.connect(self.show_list_view)
         view_group_layout.addWidget(self.list_view_button)
         
         toolbar_layout.addLayout(view_group_layout)
         
         # Sort options
         sort_label = QLabel("Sort by:")
-        sort_label.setStyleSheet(f"color: {SECONDARY_TEXT_COLOR};")
+        sort_label.setProperty("role", "secondary")
         toolbar_layout.addWidget(sort_label)
         
         self.sort_combo = QComboBox()
-        self.sort_combo.addItem("Name (A-Z)")
-        self.sort_combo.addItem("Name (Z-A)")
-        self.sort_combo.addItem("Newest First")
-        self.sort_combo.addItem("Oldest First")
-        self.sort_combo.setStyleSheet(f"""
-            QComboBox {{
-                background-color: {DARK_BG_COLOR};
-                color: {TEXT_COLOR};
-                border: 1px solid {BORDER_COLOR};
-                border-radius: 4px;
-                padding: 5px;
-                min-width: 120px;
-            }}
-            QComboBox:hover {{
-                border: 1px solid {ACCENT_COLOR};
-            }}
-            QComboBox::drop-down {{
-                subcontrol-origin: padding;
-                subcontrol-position: top right;
-                width: 20px;
-                border-left: 1px solid {BORDER_COLOR};
-            }}
-            QComboBox QAbstractItemView {{
-                background-color: {DARK_BG_COLOR};
-                color: {TEXT_COLOR};
-                selection-background-color: {ACCENT_COLOR};
-                selection-color: white;
-                border: 1px solid {BORDER_COLOR};
-            }}
-        """)
+        self.sort_combo.addItem("Name (A-Z)", (AssetListModel.NameSortRole, Qt.AscendingOrder))
+        self.sort_combo.addItem("Name (Z-A)", (AssetListModel.NameSortRole, Qt.DescendingOrder))
+        self.sort_combo.addItem("Newest First", (AssetListModel.CreatedRole, Qt.DescendingOrder))
+        self.sort_combo.addItem("Oldest First", (AssetListModel.CreatedRole, Qt.AscendingOrder))
+        self.sort_combo.setObjectName("sortCombo")
+        self.sort_combo.setProperty("role", "filter")
         toolbar_layout.addWidget(self.sort_combo)
         
         # Add spacer
@@ -797,82 +1164,151 @@ class AssetHubMainWindow(QMainWindow):
         
         # Refresh button
         self.refresh_button = QPushButton("Refresh")
-        self.refresh_button.setStyleSheet(f"""
-            QPushButton {{
-                background-color: transparent;
-                color: {SECONDARY_TEXT_COLOR};
-                border: 1px solid {BORDER_COLOR};
-                border-radius: 4px;
-                padding: 5px 15px;
-            }}
-            QPushButton:hover {{
-                color: {TEXT_COLOR};
-                border-color: {ACCENT_COLOR};
-            }}
-        """)
+        self.refresh_button.setProperty("role", "secondary")
         self.refresh_button.clicked.connect(self.load_assets)
         toolbar_layout.addWidget(self.refresh_button)
         
         # Import local button
         self.import_button = QPushButton("Import Local")
-        self.import_button.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {ACCENT_COLOR};
-                color: white;
-                border: none;
-                border-radius: 4px;
-                padding: 5px 15px;
-                font-weight: bold;
-            }}
-            QPushButton:hover {{
-                background-color: {ACCENT_COLOR_HOVER};
-            }}
-        """)
+        self.import_button.setProperty("role", "primary")
         self.import_button.clicked.connect(self.import_local_assets)
         toolbar_layout.addWidget(self.import_button)
         
         right_layout.addWidget(toolbar)
         
-        # Create asset grid
+        # Create asset grid and list, one shown at a time
+        self.asset_views = QStackedWidget()
+        
+        self.asset_list_model = AssetListModel(self)
+        self.sort_combo.currentIndexChanged.connect(self.on_sort_changed)
+        self.on_sort_changed(self.sort_combo.currentIndex())
+        
         self.asset_grid = AssetGridWidget()
-        right_layout.addWidget(self.asset_grid)
+        self.asset_grid.setModel(self.asset_list_model)
+        self.asset_views.addWidget(self.asset_grid)
+        
+        self.asset_list = QListView()
+        self.asset_list.setModel(self.asset_list_model)
+        self.asset_list.setUniformItemSizes(True)
+        self.asset_list.setIconSize(LIST_ICON_SIZE)
+        self.asset_list.setObjectName("assetList")
+        self.asset_views.addWidget(self.asset_list)
+        
+        right_layout.addWidget(self.asset_views)
         
         # Create status bar
         self.status_bar = QStatusBar()
-        self.status_bar.setStyleSheet(f"""
-            QStatusBar {{
-                background-color: {DARKER_BG_COLOR};
-                color: {SECONDARY_TEXT_COLOR};
-                border-top: 1px solid {BORDER_COLOR};
-            }}
-        """)
         self.setStatusBar(self.status_bar)
         
+        # Busy indicator shown while background work is running
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setRange(0, 0)
+        self.progress_bar.setFixedWidth(150)
+        self.progress_bar.setTextVisible(False)
+        self.progress_bar.setVisible(False)
+        self.status_bar.addPermanentWidget(self.progress_bar)
+        
         # Add right container to main layout
         main_layout.addWidget(right_container)
         
         # Set central widget
         self.setCentralWidget(central_widget)
         
+    def on_sort_changed(self, index):
+        """Sort the displayed assets by the selected sort option.
+        
+        Args:
+            index: Index of the selected sort option
+        """
+        role, order = self.sort_combo.itemData(index)
+        self.asset_list_model.set_sort(role, order)
+    
+    def show_grid_view(self):
+        """Show assets as a grid of cards."""
+        self.asset_views.setCurrentWidget(self.asset_grid)
+    
+    def show_list_view(self):
+        """Show assets as a list."""
+        self.asset_views.setCurrentWidget(self.asset_list)
+    
+    def set_results(self, assets):
+        """Show assets in the grid and list views.
+        
+        Args:
+            assets: List of assets
+        """
+        self.asset_list_model.set_rows(assets)
+    
+    def append_results(self, assets):
+        """Add assets to the grid and list views.
+        
+        Args:
+            assets: List of assets
+        """
+        self.asset_list_model.append_rows(assets)
+    
+    def on_init_ready(self, providers, snapshot):
+        """Load initial assets once the search index is ready.
+        
+        The listing of all assets saved last time is shown without a search
+        if the index has not changed since.
+        
+        Args:
+            providers: Dictionary of provider instances
+            snapshot: Saved listing of all assets, or None
+        """
+        self.providers = providers
+        self.progress_bar.setVisible(False)
+        self._result_cache.clear()
+        if snapshot is not None:
+            self._result_cache[ALL_ASSETS_KEY] = (time.monotonic(), snapshot)
+        self.apply_filters(self.sidebar.current_filters())
+    
+    def on_init_error(self, message):
+        """Report a failure to create the search index.
+        
+        Args:
+            message: Error message from the init worker
+        """
+        self.progress_bar.setVisible(False)
+        QMessageBox.critical(self, "Error", f"Failed to create search index: {message}")
+        self.status_bar.showMessage("Error initializing search index")
+    
     def load_assets(self):
-        """Load assets from the index."""
-        try:
-            # Show loading status
-            self.status_bar.showMessage("Loading assets...")
-            
-            # Get all assets from the index
-            assets = self.search.search("")
-            
-            # Update the asset grid
-            self.asset_grid.set_assets(assets)
-            
-            # Update status bar
-            self.status_bar.showMessage(f"Loaded {len(assets)} assets")
+        """Load assets matching the current filters from the index.
+        
+        The index is queried on a search worker like any filter change, so
+        the window stays responsive while a large library loads. Cached
+        results are dropped, since the index may have changed.
+        """
+        self._result_cache.clear()
+        self.apply_filters(self.sidebar.current_filters())
+    
+    def on_filter_changed(self, filters):
+        """Search for the new filter values, superseding any search in flight.
+        
+        Args:
+            filters: Dictionary of filter values
+        """
+        self.apply_filters(filters)
+    
+    @staticmethod
+    def result_cache_key(filters):
+        """Get the result cache key for filter values.
+        
+        Args:
+            filters: Dictionary of filter values
             
-        except Exception as e:
-            logger.error(f"Error loading assets: {str(e)}")
-            QMessageBox.critical(self, "Error", f"Failed to load assets: {str(e)}")
-            self.status_bar.showMessage("Error loading assets")
+        Returns:
+            Hashable key that is equal for equivalent filters
+        """
+        return (
+            filters["search"].strip(),
+            filters["type"] or "",
+            filters["format"] or "",
+            filters["source"] or "",
+            tuple(sorted(filters["categories"]))
+        )
     
     def apply_filters(self, filters):
         """Apply filters to the asset list.
@@ -880,79 +1316,234 @@ class AssetHubMainWindow(QMainWindow):
         Args:
             filters: Dictionary of filter values
         """
-        try:
-            # Show loading status
-            self.status_bar.showMessage("Filtering assets...")
-            
-            # Build search query
-            query = filters["search"]
-            
-            # Get filtered assets
-            assets = self.search.search(
-                query, 
-                asset_type=filters["type"], 
-                file_format=filters["format"],
-                source=filters["source"],
-                categories=filters["categories"]
-            )
-            
-            # Update the asset grid
-            self.asset_grid.set_assets(assets)
-            
-            # Update status bar
-            self.status_bar.showMessage(f"Found {len(assets)} assets")
-            
-        except Exception as e:
-            logger.error(f"Error applying filters: {str(e)}")
-            QMessageBox.critical(self, "Error", f"Failed to apply filters: {str(e)}")
-            self.status_bar.showMessage("Error filtering assets")
+        # Cancel the previous search; its results will be ignored
+        if self.search_worker is not None:
+            self.search_worker.requestInterruption()
+        
+        self._search_seq += 1
+        self._search_result_count = 0
+        self.search_worker = None
+        self._search_status_timer.stop()
+        
+        # The cache key and the search both use the stripped text
+        filters = dict(filters, search=filters["search"].strip())
+        
+        # Recent results for the same filters are shown without searching
+        key = self.result_cache_key(filters)
+        self._search_key = key
+        cached = self._result_cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < RESULT_CACHE_TTL:
+            self._result_cache.move_to_end(key)
+            self.set_results(cached[1])
+            self.status_bar.showMessage(f"Found {len(cached[1])} assets")
+            return
+        
+        self._search_results = []
+        
+        # Show loading status if the search is slow
+        self._search_status_timer.start()
+        
+        worker = SearchWorker(self.search, filters, self._search_seq, save_snapshot=key == ALL_ASSETS_KEY)
+        worker.result_count.connect(self.on_search_count)
+        worker.results_ready.connect(self.on_search_results)
+        worker.search_finished.connect(self.on_search_finished)
+        worker.error.connect(self.on_search_error)
+        worker.finished.connect(lambda: self._search_workers.discard(worker))
+        self._search_workers.add(worker)
+        self.search_worker = worker
+        worker.start()
+    
+    def on_search_count(self, seq, count):
+        """Report the number of results before they have all arrived.
+        
+        Args:
+            seq: Sequence number of the search request
+            count: Number of matching assets
+        """
+        if seq != self._search_seq:
+            return
+        
+        self._search_status_timer.stop()
+        self.status_bar.showMessage(f"Found {count} assets")
+    
+    def on_search_results(self, seq, assets):
+        """Show a page of search results.
+        
+        The first page replaces the grid contents, later pages are appended.
+        
+        Args:
+            seq: Sequence number of the search request
+            assets: Page of matching assets
+        """
+        if seq != self._search_seq:
+            return
+        
+        # Update the asset views
+        if self._search_result_count:
+            self.append_results(assets)
+        else:
+            self.set_results(assets)
+        self._search_result_count += len(assets)
+        self._search_results.extend(assets)
+    
+    def on_search_finished(self, seq):
+        """Report the number of results once a search has finished.
+        
+        Args:
+            seq: Sequence number of the search request
+        """
+        if seq != self._search_seq:
+            return
+        
+        if not self._search_result_count:
+            self.set_results([])
+        self._search_status_timer.stop()
+        self.status_bar.showMessage(f"Found {self._search_result_count} assets")
+        
+        self._result_cache[self._search_key] = (time.monotonic(), self._search_results)
+        self._result_cache.move_to_end(self._search_key)
+        while len(self._result_cache) > RESULT_CACHE_SIZE:
+            self._result_cache.popitem(last=False)
+    
+    def on_search_error(self, seq, message):
+        """Report a failed search.
+        
+        Args:
+            seq: Sequence number of the search request
+            message: Error message from the search worker
+        """
+        if seq != self._search_seq:
+            return
+        
+        self._search_status_timer.stop()
+        QMessageBox.critical(self, "Error", f"Failed to apply filters: {message}")
+        self.status_bar.showMessage("Error filtering assets")
     
     def import_local_assets(self):
-        """Import assets from local directory."""
-        try:
-            # Show file dialog to select directory
-            directory = QFileDialog.getExistingDirectory(
-                self, "Select Directory", "", QFileDialog.ShowDirsOnly
-            )
-            
-            if directory:
-                # Show progress dialog
-                progress_dialog = QMessageBox(self)
-                progress_dialog.setWindowTitle("Importing Assets")
-                progress_dialog.setText("Scanning directory for assets...")
-                progress_dialog.setStandardButtons(QMessageBox.NoButton)
-                progress_dialog.show()
-                
-                # Process events to update UI
-                QApplication.processEvents()
-                
-                # Scan directory for assets
-                scanner = FileScanner()
-                assets = scanner.scan_directory(directory)
-                
-                # Update progress
-                progress_dialog.setText(f"Found {len(assets)} assets. Indexing...")
-                QApplication.processEvents()
-                
-                # Index assets
-                for asset in assets:
-                    self.indexer.add_asset(asset)
-                
-                # Close progress dialog
-                progress_dialog.close()
-                
-                # Reload assets
-                self.load_assets()
-                
-                # Show success message
-                QMessageBox.information(
-                    self, "Import Complete", 
-                    f"Successfully imported {len(assets)} assets from {directory}"
-                )
-                
-        except Exception as e:
-            logger.error(f"Error importing assets: {str(e)}")
-            QMessageBox.critical(self, "Error", f"Failed to import assets: {str(e)}")
+        """Import assets from local directory.
+        
+        The directory is scanned and indexed on a scan worker, so the window
+        stays responsive while a large or remote directory is imported.
+        """
+        if self.scan_worker is not None:
+            return
+        
+        # Show file dialog to select directory
+        directory = QFileDialog.getExistingDirectory(
+            self, "Select Directory", "", QFileDialog.ShowDirsOnly
+        )
+        
+        if not directory:
+            return
+        
+        # Show progress dialog; its range grows as directories are found
+        self._import_directory = directory
+        self._import_dialog = QProgressDialog("Scanning directory for assets...", "Cancel", 0, 0, self)
+        self._import_dialog.setWindowTitle("Importing Assets")
+        self._import_dialog.setWindowModality(Qt.WindowModal)
+        self._import_dialog.setMinimumDuration(0)
+        self._import_dialog.setAutoReset(False)
+        self._import_dialog.setAutoClose(False)
+        self._import_dialog.canceled.connect(self.on_import_canceled)
+        self._import_dialog.show()
+        
+        self.scan_worker = ScanWorker(self.scanner, self.indexer, self.search, directory)
+        self.scan_worker.progress.connect(self.on_scan_progress)
+        self.scan_worker.index_progress.connect(self.on_index_progress)
+        self.scan_worker.scan_finished.connect(self.on_scan_finished)
+        self.scan_worker.scan_canceled.connect(self.on_scan_canceled)
+        self.scan_worker.error.connect(self.on_scan_error)
+        self.scan_worker.finished.connect(self.on_scan_worker_done)
+        self.scan_worker.start()
+    
+    def on_scan_progress(self, scanned, found):
+        """Update the import progress.
+        
+        Args:
+            scanned: Number of directories scanned
+            found: Number of directories found so far
+        """
+        self._import_dialog.setMaximum(found)
+        self._import_dialog.setValue(scanned)
+    
+    def on_index_progress(self, indexed, total):
+        """Update the import progress while the scanned assets are indexed.
+        
+        Args:
+            indexed: Number of assets indexed
+            total: Number of assets to index
+        """
+        self._import_dialog.setLabelText(f"Found {total} assets. Indexing...")
+        self._import_dialog.setMaximum(total)
+        self._import_dialog.setValue(indexed)
+    
+    def on_scan_finished(self, new_assets, updated_assets):
+        """Show the imported assets.
+        
+        When all assets are shown and none changed, the new assets are
+        appended to the views instead of searching the whole index again,
+        as long as the views stay within MAX_SEARCH_RESULTS.
+        
+        Args:
+            new_assets: List of newly imported assets
+            updated_assets: List of reimported assets that had changed
+        """
+        self.search.invalidate()
+        self._result_cache.clear()
+        self._import_dialog.hide()
+        
+        showing_all = (
+            self._search_key == ALL_ASSETS_KEY
+            and (self.search_worker is None or self.search_worker.isFinished())
+        )
+        fits = self.asset_list_model.rowCount() + len(new_assets) <= MAX_SEARCH_RESULTS
+        if showing_all and fits and not updated_assets:
+            self.append_results(new_assets)
+            self.status_bar.showMessage(f"Loaded {len(new_assets)} new assets")
+        else:
+            self.load_assets()
+        
+        # Show success message
+        QMessageBox.information(
+            self, "Import Complete", 
+            f"Successfully imported {len(new_assets) + len(updated_assets)} assets "
+            f"from {self._import_directory}"
+        )
+    
+    def on_scan_canceled(self, indexed):
+        """Show what a cancelled import had already indexed.
+        
+        Args:
+            indexed: Number of assets indexed before the import stopped
+        """
+        self._import_dialog.hide()
+        if indexed:
+            self.search.invalidate()
+            self._result_cache.clear()
+            self.load_assets()
+        self.status_bar.showMessage(f"Import cancelled after indexing {indexed} assets")
+    
+    def on_scan_error(self, message):
+        """Report a failed import.
+        
+        Args:
+            message: Error message from the scan worker
+        """
+        self._import_dialog.hide()
+        QMessageBox.critical(self, "Error", f"Failed to import assets: {message}")
+    
+    def on_import_canceled(self):
+        """Stop the scan worker when the import is cancelled."""
+        if self.scan_worker is None:
+            return
+        self.scan_worker.requestInterruption()
+        self.status_bar.showMessage("Import cancelled")
+    
+    def on_scan_worker_done(self):
+        """Allow the next import once the scan worker has stopped."""
+        self.scan_worker = None
+        self._import_dialog.deleteLater()
+        self._import_dialog = None
 
 
 def run_app():
@@ -963,6 +1554,9 @@ def run_app():
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     )
     
+    # Use @2x icon variants on HiDPI screens
+    QApplication.setAttribute(Qt.AA_UseHighDpiPixmaps)
+    
     # Create application
     app = QApplication(sys.argv)
     
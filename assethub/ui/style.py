@@ -0,0 +1,235 @@
+"""
+Style module for AssetHub.
+
+This module provides the application-wide stylesheet. Widgets are matched
+by object name or by a "role" property instead of carrying their own
+stylesheets, so Qt parses the styles once for the whole application.
+"""
+
+# Colors
+DARK_BG_COLOR = "#1E1E1E"
+DARKER_BG_COLOR = "#141414"
+ACCENT_COLOR = "#8C52FF"  # Purple accent color
+ACCENT_COLOR_HOVER = "#9D6FFF"
+TEXT_COLOR = "#FFFFFF"
+SECONDARY_TEXT_COLOR = "#AAAAAA"
+BORDER_COLOR = "#333333"
+CARD_BG_COLOR = "#2A2A2A"
+CARD_HOVER_COLOR = "#3A3A3A"
+
+APP_STYLESHEET = f"""
+    QMainWindow {{
+        background-color: {DARK_BG_COLOR};
+    }}
+
+    /* Buttons */
+    QPushButton[role="primary"] {{
+        background-color: {ACCENT_COLOR};
+        color: white;
+        border: none;
+        border-radius: 4px;
+        padding: 5px 15px;
+        font-weight: bold;
+    }}
+    QPushButton[role="primary"]:hover {{
+        background-color: {ACCENT_COLOR_HOVER};
+    }}
+    QPushButton[role="outline"] {{
+        background-color: transparent;
+        color: {TEXT_COLOR};
+        border: 1px solid {BORDER_COLOR};
+        border-radius: 4px;
+    }}
+    QPushButton[role="outline"]:hover {{
+        border-color: {ACCENT_COLOR};
+        color: {ACCENT_COLOR};
+    }}
+    QPushButton[role="secondary"] {{
+        background-color: transparent;
+        color: {SECONDARY_TEXT_COLOR};
+        border: 1px solid {BORDER_COLOR};
+        border-radius: 4px;
+        padding: 5px 15px;
+    }}
+    QPushButton[role="secondary"]:hover {{
+        color: {TEXT_COLOR};
+        border-color: {ACCENT_COLOR};
+    }}
+    QPushButton#settingsButton {{
+        padding: 8px;
+        text-align: left;
+    }}
+    QPushButton[role="viewToggle"] {{
+        background-color: {DARK_BG_COLOR};
+        color: {SECONDARY_TEXT_COLOR};
+        border: 1px solid {BORDER_COLOR};
+        border-radius: 0;
+        padding: 5px 15px;
+    }}
+    QPushButton[role="viewToggle"]:checked {{
+        background-color: {ACCENT_COLOR};
+        color: white;
+        border-color: {ACCENT_COLOR};
+    }}
+    QPushButton[role="viewToggle"]:hover:!checked {{
+        color: {TEXT_COLOR};
+    }}
+    QPushButton#gridViewButton {{
+        border-top-left-radius: 4px;
+        border-bottom-left-radius: 4px;
+    }}
+    QPushButton#listViewButton {{
+        border-top-right-radius: 4px;
+        border-bottom-right-radius: 4px;
+    }}
+
+    /* Labels */
+    QLabel[role="secondary"] {{
+        color: {SECONDARY_TEXT_COLOR};
+    }}
+    QLabel[role="section"] {{
+        font-size: 14px;
+        font-weight: bold;
+        color: {TEXT_COLOR};
+    }}
+    QLabel#categoriesLabel {{
+        margin-top: 10px;
+    }}
+    QLabel#titleLabel {{
+        font-size: 18px;
+        font-weight: bold;
+        color: {TEXT_COLOR};
+    }}
+    QLabel#logoLabel {{
+        font-size: 18px;
+        font-weight: bold;
+        color: {ACCENT_COLOR};
+        background-color: {DARK_BG_COLOR};
+        border-radius: 16px;
+        padding: 5px;
+    }}
+
+    /* Inputs */
+    QLineEdit {{
+        background-color: {DARK_BG_COLOR};
+        color: {TEXT_COLOR};
+        border: 1px solid {BORDER_COLOR};
+        border-radius: 4px;
+        padding: 8px;
+    }}
+    QLineEdit:focus {{
+        border: 1px solid {ACCENT_COLOR};
+    }}
+    QComboBox[role="filter"] {{
+        background-color: {DARK_BG_COLOR};
+        color: {TEXT_COLOR};
+        border: 1px solid {BORDER_COLOR};
+        border-radius: 4px;
+        padding: 5px;
+    }}
+    QComboBox[role="filter"]:hover {{
+        border: 1px solid {ACCENT_COLOR};
+    }}
+    QComboBox[role="filter"]::drop-down {{
+        subcontrol-origin: padding;
+        subcontrol-position: top right;
+        width: 20px;
+        border-left: 1px solid {BORDER_COLOR};
+    }}
+    QComboBox[role="filter"] QAbstractItemView {{
+        background-color: {DARK_BG_COLOR};
+        color: {TEXT_COLOR};
+        selection-background-color: {ACCENT_COLOR};
+        selection-color: white;
+        border: 1px solid {BORDER_COLOR};
+    }}
+    QComboBox#sortCombo {{
+        min-width: 120px;
+    }}
+    /* Panels */
+    #sidebar {{
+        background-color: {DARKER_BG_COLOR};
+        border-right: 1px solid {BORDER_COLOR};
+    }}
+    #toolbar {{
+        background-color: {DARKER_BG_COLOR};
+        border-bottom: 1px solid {BORDER_COLOR};
+    }}
+    QStatusBar {{
+        background-color: {DARKER_BG_COLOR};
+        color: {SECONDARY_TEXT_COLOR};
+        border-top: 1px solid {BORDER_COLOR};
+    }}
+
+    /* Asset views */
+    #assetGrid {{
+        background-color: {DARK_BG_COLOR};
+        border: none;
+    }}
+    #assetGrid QScrollBar:vertical {{
+        background-color: {DARKER_BG_COLOR};
+        width: 10px;
+        margin: 0px;
+    }}
+    #assetGrid QScrollBar::handle:vertical {{
+        background-color: {ACCENT_COLOR};
+        min-height: 20px;
+        border-radius: 5px;
+    }}
+    #assetGrid QScrollBar::add-line:vertical, #assetGrid QScrollBar::sub-line:vertical {{
+        height: 0px;
+    }}
+    QListView#assetList {{
+        background-color: {DARK_BG_COLOR};
+        color: {TEXT_COLOR};
+        border: none;
+    }}
+    QListView#assetList::item {{
+        padding: 5px;
+        border-bottom: 1px solid {BORDER_COLOR};
+    }}
+    QListView#assetList::item:selected {{
+        background-color: {ACCENT_COLOR};
+        color: white;
+    }}
+
+    /* Category list */
+    QListView#categoriesList {{
+        background-color: transparent;
+        color: {TEXT_COLOR};
+        border: none;
+        outline: none;
+    }}
+    QListView#categoriesList::item {{
+        padding: 3px 0px;
+    }}
+    QListView#categoriesList::indicator {{
+        width: 16px;
+        height: 16px;
+        border: 1px solid {BORDER_COLOR};
+        border-radius: 3px;
+        background-color: {DARK_BG_COLOR};
+    }}
+    QListView#categoriesList::indicator:checked {{
+        background-color: {ACCENT_COLOR};
+        border: 1px solid {ACCENT_COLOR};
+        image: url(icons/check.png);
+    }}
+    QListView#categoriesList::indicator:hover {{
+        border: 1px solid {ACCENT_COLOR};
+    }}
+    QListView#categoriesList QScrollBar:vertical {{
+        background-color: {DARKER_BG_COLOR};
+        width: 8px;
+        margin: 0px;
+    }}
+    QListView#categoriesList QScrollBar::handle:vertical {{
+        background-color: {ACCENT_COLOR};
+        min-height: 20px;
+        border-radius: 4px;
+    }}
+    QListView#categoriesList QScrollBar::add-line:vertical,
+    QListView#categoriesList QScrollBar::sub-line:vertical {{
+        height: 0px;
+    }}
+"""
@@ -0,0 +1,104 @@
+"""
+Thumbnail cache module for AssetHub.
+
+This module provides scaled preview thumbnails that are generated once and
+kept on disk, so later sessions only decode a small image.
+"""
+import os
+import hashlib
+import logging
+from pathlib import Path
+from typing import Optional
+
+from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QImage
+
+from assethub.core.config import config
+from assethub.utils.image_cache import THUMB_CACHE_LIMIT_MB, save_cached_image
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+# Directory under the storage path holding scaled preview thumbnails; the
+# 3ds Max plugin keeps its icons there too
+THUMB_CACHE_DIR = ".thumb-cache"
+
+# Largest source-to-thumbnail size ratio that is scaled without smoothing
+FAST_SCALE_RATIO = 1.5
+
+
+def get_thumb_path(path: str, mtime: float, width: int, height: int) -> Path:
+    """Get the cache file of a thumbnail.
+
+    Args:
+        path: Path to the preview image
+        mtime: Modification time of the preview image
+        width: Thumbnail width
+        height: Thumbnail height
+
+    Returns:
+        Path of the cached thumbnail
+    """
+    key = hashlib.blake2b(
+        f"{path}:{mtime}:{width}x{height}".encode(), digest_size=16
+    ).hexdigest()
+    return config.get_storage_path() / THUMB_CACHE_DIR / f"{key}.png"
+
+
+def scale_image(image: QImage, width: int, height: int) -> QImage:
+    """Scale an image to fit a thumbnail size.
+
+    Images already close to the target size are scaled without smoothing,
+    which looks the same at that ratio and is much cheaper.
+
+    Args:
+        image: Source image
+        width: Thumbnail width
+        height: Thumbnail height
+
+    Returns:
+        Scaled image
+    """
+    ratio = max(image.width() / width, image.height() / height)
+    mode = Qt.FastTransformation if ratio <= FAST_SCALE_RATIO else Qt.SmoothTransformation
+    return image.scaled(width, height, Qt.KeepAspectRatio, mode)
+
+
+def get_thumb(path: str, width: int, height: int, mtime: Optional[float] = None) -> QImage:
+    """Get a preview image scaled to a thumbnail size.
+
+    The thumbnail is read from the cache if it was generated before, and
+    generated and stored otherwise; the cache is kept within the
+    "thumb_cache_mb" UI setting. This is safe to call from worker threads.
+
+    Args:
+        path: Path to the preview image
+        width: Thumbnail width
+        height: Thumbnail height
+        mtime: Modification time of the preview image; the file is only
+            checked on disk when it is not given
+
+    Returns:
+        Scaled image, or a null image if the preview could not be read
+    """
+    if mtime is None:
+        try:
+            mtime = os.path.getmtime(path)
+        except OSError:
+            return QImage()
+
+    thumb_path = get_thumb_path(path, mtime, width, height)
+    if thumb_path.exists():
+        image = QImage(str(thumb_path))
+        if not image.isNull():
+            return image
+
+    image = QImage(path)
+    if image.isNull():
+        return image
+    image = scale_image(image, width, height)
+
+    limit_mb = config.get("ui", "thumb_cache_mb", THUMB_CACHE_LIMIT_MB)
+    save_cached_image(image, thumb_path, limit_mb * 1024 * 1024)
+
+    return image
@@ -0,0 +1,113 @@
+"""
+Image cache module for AssetHub.
+
+This module stores cached images on disk and keeps the cache directory
+within a size limit. It works with the QImage of either Qt binding, so the
+desktop UI and the 3ds Max plugin share it.
+"""
+import itertools
+import logging
+import os
+import threading
+from pathlib import Path
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+# Default for the "thumb_cache_mb" UI setting
+THUMB_CACHE_LIMIT_MB = 256
+
+# Number of cached images written between checks of the cache size
+PRUNE_INTERVAL = 200
+
+_write_count = itertools.count()
+_prune_lock = threading.Lock()
+
+
+def save_cached_image(image, path: Path, limit_bytes: int) -> bool:
+    """Save an image into a cache directory.
+
+    The image is written to a temporary file first so a concurrent reader
+    never sees a partial file, and the temporary file is removed if saving
+    fails. Every PRUNE_INTERVAL writes, starting with the first, the oldest
+    files of the directory are removed while it exceeds the size limit.
+
+    Args:
+        image: QImage to save
+        path: Cache file to write
+        limit_bytes: Size limit of the cache directory
+
+    Returns:
+        True if the image was saved
+    """
+    temp_path = path.with_name(f"{path.stem}.{os.getpid()}.{threading.get_ident()}.tmp")
+    saved = False
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if image.save(str(temp_path), "PNG"):
+            os.replace(temp_path, path)
+            saved = True
+    except OSError as e:
+        logger.warning(f"Could not cache image {path}: {e}")
+
+    if not saved:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        return False
+
+    # Only one thread prunes at a time; the others carry on
+    if next(_write_count) % PRUNE_INTERVAL == 0 and _prune_lock.acquire(blocking=False):
+        try:
+            prune_cache_dir(path.parent, limit_bytes)
+        finally:
+            _prune_lock.release()
+    return True
+
+
+def prune_cache_dir(directory: Path, limit_bytes: int) -> int:
+    """Remove the oldest files of a cache directory beyond a size limit.
+
+    Files that cannot be removed, for example because they are open on
+    Windows, are skipped.
+
+    Args:
+        directory: Cache directory
+        limit_bytes: Size limit of the directory
+
+    Returns:
+        Number of removed files
+    """
+    files = []
+    total = 0
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                try:
+                    if not entry.is_file():
+                        continue
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                files.append((stat.st_mtime, stat.st_size, entry.path))
+                total += stat.st_size
+    except OSError as e:
+        logger.warning(f"Could not read cache directory {directory}: {e}")
+        return 0
+
+    removed = 0
+    files.sort()
+    for _, size, file_path in files:
+        if total <= limit_bytes:
+            break
+        try:
+            os.remove(file_path)
+        except OSError:
+            continue
+        total -= size
+        removed += 1
+
+    if removed:
+        logger.info(f"Removed {removed} files from cache directory {directory}")
+    return removed